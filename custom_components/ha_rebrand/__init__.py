@@ -2,56 +2,141 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
+import copy
 import hashlib
 import json
 import logging
+import math
 import os
 import re
 import shutil
+import time
+from collections.abc import Awaitable, Callable, Mapping
 from functools import partial
-from html import escape as html_escape
-from pathlib import Path
 from typing import Any
 
 import voluptuous as vol
-from aiohttp import web
+from aiohttp import hdrs, web
 from homeassistant.components import frontend, panel_custom
 from homeassistant.components.http import HomeAssistantView, StaticPathConfig
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.helpers.typing import ConfigType
 
+from .assets import ASSETS_URL, StaticAssets, load_static_assets
+from .bundle import (
+    AsyncStreamReader,
+    AsyncStreamWriter,
+    BundleError,
+    commit_bundle,
+    create_import_staging,
+    extract_bundle,
+    referenced_assets,
+    remove_import_staging,
+    write_bundle,
+)
+from .cache import ArtifactCache
 from .const import (
     ALLOWED_EXTENSIONS,
     ALLOWED_FILE_TYPES,
+    BRANDING_KEYS,
     CONF_BRAND_NAME_OLD,
     CONF_BROWSER_TAB_TITLE,
     CONF_DOCUMENT_TITLE_OLD,
     CONF_FAVICON,
     CONF_HIDE_OPEN_HOME_FOUNDATION,
+    CONF_HOSTS,
+    CONF_IMAGE_SIZES,
     CONF_LOGO,
     CONF_LOGO_DARK,
     CONF_PRIMARY_COLOR,
+    CONF_PROFILES,
+    CONF_RATE_LIMIT,
+    CONF_RATE_LIMIT_BURST,
     CONF_SIDEBAR_TEXT,
     CONF_SIDEBAR_TITLE_OLD,
     CONF_SYSTEM_NAME,
+    CONF_TRANSLATIONS,
+    CONF_WATCH_CONFIG_FILE,
+    DEFAULT_PROFILE,
+    DEFAULT_RATE_LIMIT_BURST,
     DEFAULT_SYSTEM_NAME,
     DOMAIN,
+    MAX_BUNDLE_SIZE,
     MAX_FILE_SIZE,
     PANEL_COMPONENT_NAME,
     PANEL_ICON,
     PANEL_TITLE,
     PANEL_URL_PATH,
+    PREVIEW_CACHE_BUDGET,
+    RENDER_CACHE_BUDGET,
+    SIGNAL_CONFIG_UPDATED,
+)
+from .dependencies import (
+    ARTIFACT_BRAND_CONFIG,
+    ARTIFACT_MANIFEST,
+    ARTIFACT_PRELOAD,
+    affected_artifacts,
+    snapshot,
+)
+from .executor import IOExecutor
+from .image import ImageError, ImageInfo, read_image
+from .indexview import IndexViewHook
+from .locales import available_locales, localize, negotiate_locale
+from .pages import (
+    AUTHORIZE_PAGE,
+    COLOR_SCHEMES,
+    INDEX_PAGE,
+    ONBOARDING_PAGE,
+    BrandedPage,
+    preload_links,
+)
+from .palette import derive_palette, palette_variables
+from .profiles import (
+    PROFILE_CONFIGS,
+    PROFILE_HOSTS,
+    build_profiles,
+    normalize_host,
+    resolve_profile,
+)
+from .ratelimit import TokenBucketLimiter
+from .routes import RouteOverrides
+from .templates import FrontendTemplates
+from .uploads import (
+    CHUNK_SIZE,
+    MAX_CHUNK_SIZE,
+    STAGING_PREFIX,
+    ChunkedUploads,
+    UploadError,
+    UploadSession,
+    create_staging,
+    remove_staging,
+    write_chunk,
+)
+from .watcher import ConfigFileWatcher
+from .webmanifest import (
+    build_manifest,
+    fallback_icons,
+    generate_icons,
+    icon_background,
+    icon_source,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-# Pre-compiled regex pattern for SVG replacement (performance optimization)
-_SVG_PATTERN = re.compile(r'<svg[^>]*viewBox="0 0 240 240"[^>]*>.*?</svg>', re.DOTALL)
-
-# Color validation pattern
-_COLOR_PATTERN = re.compile(r"^#[0-9A-Fa-f]{3}(?:[0-9A-Fa-f]{3})?(?:[0-9A-Fa-f]{2})?$")
+# Client hint carrying the user's preferred color scheme
+HEADER_COLOR_SCHEME = "Sec-CH-Prefers-Color-Scheme"
 
 
 def _get_file_hash(filepath: str) -> str:
@@ -68,35 +153,40 @@ def _get_file_hash(filepath: str) -> str:
         return "0"
 
 
-def _escape_js_string(s: str) -> str:
-    """Escape string for safe JavaScript embedding, preventing XSS."""
-    if not s:
-        return ""
-    return (
-        s.replace("\\", "\\\\")
-        .replace('"', '\\"')
-        .replace("'", "\\'")
-        .replace("\n", "\\n")
-        .replace("\r", "\\r")
-        .replace("<", "\\x3c")
-        .replace(">", "\\x3e")
-    )
-
-
-def _validate_color(color: str) -> str:
-    """Validate CSS color value format. Returns empty string if invalid."""
-    if not color:
-        return ""
-    # Only allow #RGB, #RRGGBB, #RRGGBBAA formats
-    if _COLOR_PATTERN.match(color):
-        return color
-    _LOGGER.warning("Invalid color format rejected: %s", color)
-    return ""
-
-
 type HaRebrandConfigEntry = ConfigEntry
 
 DATA_PANEL_REGISTERED = f"{DOMAIN}_panel_registered"
+DATA_TEMPLATES = f"{DOMAIN}_templates"
+DATA_RATE_LIMITER = f"{DOMAIN}_rate_limiter"
+DATA_ROUTE_OVERRIDES = f"{DOMAIN}_route_overrides"
+DATA_RENDER_CACHE = f"{DOMAIN}_render_cache"
+DATA_INJECTOR_URL = f"{DOMAIN}_injector_url"
+DATA_IO_EXECUTOR = f"{DOMAIN}_io_executor"
+DATA_SIDEBAR_REGISTERED = f"{DOMAIN}_sidebar_registered"
+DATA_ARTIFACT_INPUTS = f"{DOMAIN}_artifact_inputs"
+DATA_PERSISTED_CONFIG = f"{DOMAIN}_persisted_config"
+DATA_PERSISTED_PRIVATE = f"{DOMAIN}_persisted_private"
+DATA_STORE = f"{DOMAIN}_store"
+DATA_CHUNKED_UPLOADS = f"{DOMAIN}_chunked_uploads"
+DATA_STATIC_ASSETS = f"{DOMAIN}_static_assets"
+DATA_PREVIEW_CACHE = f"{DOMAIN}_preview_cache"
+DATA_INDEX_HTML = f"{DOMAIN}_index_html"
+DATA_WATCH_CONFIG_FILE = f"{DOMAIN}_watch_config_file"
+DATA_CONFIG_WATCHER = f"{DOMAIN}_config_watcher"
+DATA_CONFIG_REVISION = f"{DOMAIN}_config_revision"
+
+# Profiles (with every tenant's hosts) and image sizes are kept in .storage,
+# out of the config.json served without auth under /local/
+STORAGE_KEY = f"{DOMAIN}.private"
+STORAGE_VERSION = 1
+_PRIVATE_KEYS = (CONF_PROFILES, CONF_IMAGE_SIZES)
+
+# Upload filenames written by the upload views, optionally profile-prefixed
+_UPLOAD_FILENAME = re.compile(
+    r"^(?:[a-z0-9_]+-)?(?:logo|logo_dark|favicon)\.(?:png|jpe?g|svg|ico|webp)$"
+)
+# Unreferenced uploads younger than this are kept (they may await a save)
+ORPHAN_MIN_AGE = 3600
 
 # Keep CONFIG_SCHEMA for backward compatibility (YAML still works)
 # Note: extra=vol.ALLOW_EXTRA allows existing configs with 'replacements' to load without error
@@ -117,6 +207,15 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_BRAND_NAME_OLD): cv.string,
                 vol.Optional(CONF_SIDEBAR_TITLE_OLD): cv.string,
                 vol.Optional(CONF_DOCUMENT_TITLE_OLD): cv.string,
+                # Per-client requests per minute on unauthenticated endpoints
+                vol.Optional(CONF_RATE_LIMIT): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
+                vol.Optional(
+                    CONF_RATE_LIMIT_BURST, default=DEFAULT_RATE_LIMIT_BURST
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                # Reload config.json when it is changed by other tools
+                vol.Optional(CONF_WATCH_CONFIG_FILE, default=False): cv.boolean,
             },
             extra=vol.ALLOW_EXTRA,
         )
@@ -129,86 +228,137 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the HA Rebrand component (YAML configuration)."""
     hass.data.setdefault(DOMAIN, {})
 
+    # Optional admission control for the unauthenticated branded endpoints
+    yaml_config = config.get(DOMAIN, {})
+    if rate_limit := yaml_config.get(CONF_RATE_LIMIT):
+        hass.data[DATA_RATE_LIMITER] = TokenBucketLimiter(
+            rate_limit / 60, yaml_config[CONF_RATE_LIMIT_BURST]
+        )
+
+    hass.data[DATA_WATCH_CONFIG_FILE] = yaml_config.get(CONF_WATCH_CONFIG_FILE, False)
+
+    # Precomputed pages and payloads per profile, bounded by a memory budget
+    hass.data[DATA_RENDER_CACHE] = ArtifactCache(RENDER_CACHE_BUDGET)
+    hass.data[DATA_PREVIEW_CACHE] = ArtifactCache(PREVIEW_CACHE_BUDGET)
+
+    # Resumable websocket uploads in progress
+    hass.data[DATA_CHUNKED_UPLOADS] = ChunkedUploads()
+
     # Register WebSocket API at setup level (available for all entries)
     _async_register_websocket_commands(hass)
 
+    # Register HTTP views once; they read the current config per request so
+    # reloading the entry doesn't stack duplicate routes
+    hass.http.register_view(RebrandConfigView(hass))
+    hass.http.register_view(RebrandUploadView(hass))
+    hass.http.register_view(RebrandBatchUploadView(hass))
+    hass.http.register_view(RebrandSaveConfigView(hass))
+    hass.http.register_view(RebrandExportView(hass))
+    hass.http.register_view(RebrandImportView(hass))
+    hass.http.register_view(RebrandAssetView(hass))
+
+    # Middleware-backed route overrides; aiohttp only accepts new middleware
+    # before the server starts, which is when integrations normally load
+    overrides = RouteOverrides()
+    overrides.async_install(hass.http.app)
+    hass.data[DATA_ROUTE_OVERRIDES] = overrides
+
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: HaRebrandConfigEntry) -> bool:
     """Set up HA Rebrand from a config entry."""
     _LOGGER.info("HA Rebrand: Setting up from config entry")
+    setup_started = time.monotonic()
 
     # Initialize data structure
     hass.data.setdefault(DOMAIN, {})
 
-    # Create uploads directory
-    uploads_dir = hass.config.path("www", "ha_rebrand")
-    await hass.async_add_executor_job(_create_directory, uploads_dir)
+    # File I/O runs on a dedicated pool instead of Home Assistant's shared one.
+    # Unload callbacks run last-registered first, so registering the shutdown
+    # here runs it after the watcher, hooks and overrides below are removed
+    executor = hass.data[DATA_IO_EXECUTOR] = IOExecutor(hass)
+    entry.async_on_unload(executor.async_shutdown)
 
-    # Load existing config from JSON file if exists
+    # Create uploads directory and load the public config.json and the
+    # privately stored profiles
+    uploads_dir = hass.config.path("www", "ha_rebrand")
     config_json_path = os.path.join(uploads_dir, "config.json")
-    config = await hass.async_add_executor_job(_load_config_json, config_json_path)
-
-    # Store configuration in hass.data
-    hass.data[DOMAIN] = {
-        CONF_SYSTEM_NAME: config.get(CONF_SYSTEM_NAME, DEFAULT_SYSTEM_NAME),
-        CONF_LOGO: config.get(CONF_LOGO),
-        CONF_LOGO_DARK: config.get(CONF_LOGO_DARK),
-        CONF_FAVICON: config.get(CONF_FAVICON),
-        CONF_SIDEBAR_TEXT: config.get(
-            CONF_SIDEBAR_TEXT, config.get(CONF_SYSTEM_NAME, DEFAULT_SYSTEM_NAME)
+    store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+    hass.data[DATA_STORE] = store
+    _, config, private = await asyncio.gather(
+        _async_timed(
+            "create uploads dir", _async_io(hass, _create_directory, uploads_dir)
         ),
-        CONF_BROWSER_TAB_TITLE: config.get(
-            CONF_BROWSER_TAB_TITLE, config.get(CONF_SYSTEM_NAME, DEFAULT_SYSTEM_NAME)
-        ),
-        CONF_HIDE_OPEN_HOME_FOUNDATION: config.get(
-            CONF_HIDE_OPEN_HOME_FOUNDATION, True
+        _async_timed(
+            "load config", _async_io(hass, _load_config_json, config_json_path)
         ),
-        CONF_PRIMARY_COLOR: config.get(CONF_PRIMARY_COLOR),
-        "uploads_dir": uploads_dir,
-    }
-
-    # Write initial config.json
-    await _async_write_config_json(hass)
-
-    # Register frontend resources
-    await _async_register_frontend(hass)
+        _async_timed("load profiles", store.async_load()),
+    )
+    # Profiles and sizes found in config.json (written by older versions or
+    # another tool) take precedence; the initial write moves them to the store
+    config = {**(private or {}), **config}
 
-    # Register HTTP views
-    hass.http.register_view(RebrandConfigView(hass))
-    hass.http.register_view(RebrandUploadView(hass))
-    hass.http.register_view(RebrandSaveConfigView(hass))
+    # Store configuration in hass.data
+    hass.data[DOMAIN] = _build_config(config, uploads_dir)
+    _async_config_changed(hass)
+
+    # Independent I/O runs concurrently: write the initial config.json (which
+    # also persists migrated legacy keys), preload hass_frontend templates so
+    # the first login doesn't pay for it, and register frontend resources
+    templates = FrontendTemplates(hass, hass.data[DATA_IO_EXECUTOR])
+    hass.data[DATA_TEMPLATES] = templates
+    _, _, panel_hash, assets = await asyncio.gather(
+        _async_timed("write config.json", _async_write_config_json(hass)),
+        _async_timed("load templates", templates.async_load()),
+        _async_timed("register frontend", _async_register_frontend(hass)),
+        _async_timed("load assets", _async_io(hass, load_static_assets)),
+    )
+    hass.data[DATA_STATIC_ASSETS] = assets
 
-    # Register custom authorize view to replace login page logo
-    # First, we need to remove the existing static route for /auth/authorize
-    # since Home Assistant's frontend component registers it as a static file
-    # Only register custom view if we successfully removed the original
-    if _unregister_static_path(hass, "/auth/authorize"):
-        hass.http.register_view(RebrandAuthorizeView(hass))
-        _LOGGER.info("HA Rebrand: Registered RebrandAuthorizeView for /auth/authorize")
-    else:
-        _LOGGER.warning(
-            "HA Rebrand: Could not replace authorize view - "
-            "login page branding will use JavaScript fallback only"
+    # Pick up config.json changes made outside of HA Rebrand; started after
+    # the initial write so setup doesn't trigger a reload
+    if hass.data.get(DATA_WATCH_CONFIG_FILE):
+        watcher = ConfigFileWatcher(
+            hass,
+            hass.data[DATA_IO_EXECUTOR],
+            config_json_path,
+            partial(_async_reload_config_json, hass),
+        )
+        await watcher.async_start()
+        hass.data[DATA_CONFIG_WATCHER] = watcher
+        entry.async_on_unload(watcher.async_stop)
+
+    # Brand the loading screen served by IndexView; unhooked on unload
+    if (index_hook := _async_hook_index_view(hass)) is not None:
+        entry.async_on_unload(index_hook.async_remove)
+
+    # Serve branded login and onboarding pages in place of the static ones
+    # registered by the frontend component; removed again on unload
+    overrides: RouteOverrides = hass.data[DATA_ROUTE_OVERRIDES]
+    if overrides.installed:
+        for view in (RebrandAuthorizeView(hass), RebrandOnboardingView(hass)):
+            entry.async_on_unload(overrides.async_override(view.url, view.get))
+            _LOGGER.info("HA Rebrand: Overriding %s with branded page", view.url)
+        # Serve the injector config for the profile matching the request host
+        entry.async_on_unload(
+            overrides.async_override(
+                "/ha_rebrand/config.json", RebrandConfigView(hass).get
+            )
+        )
+        # Installed apps take their name and icons from the manifest
+        manifest_view = RebrandManifestView(hass)
+        entry.async_on_unload(
+            overrides.async_override(manifest_view.url, manifest_view.get)
         )
-
-    # Register custom onboarding view to replace onboarding page logo
-    if _unregister_static_path(hass, "/onboarding"):
-        hass.http.register_view(RebrandOnboardingView(hass))
-        _LOGGER.info("HA Rebrand: Registered RebrandOnboardingView for /onboarding")
     else:
-        _LOGGER.debug(
-            "HA Rebrand: Could not replace onboarding view - "
-            "onboarding page branding will use JavaScript fallback only"
+        _LOGGER.warning(
+            "HA Rebrand: Could not replace login and onboarding pages until "
+            "Home Assistant restarts - branding will use JavaScript fallback only"
         )
 
     # Register panel (only once)
     if not hass.data.get(DATA_PANEL_REGISTERED):
-        # Get content hash for panel URL cache busting
-        panel_path = os.path.join(uploads_dir, "ha-rebrand-panel.js")
-        panel_hash = await hass.async_add_executor_job(_get_file_hash, panel_path)
-
         await panel_custom.async_register_panel(
             hass,
             webcomponent_name=PANEL_COMPONENT_NAME,
@@ -220,21 +370,48 @@ async def async_setup_entry(hass: HomeAssistant, entry: HaRebrandConfigEntry) ->
             embed_iframe=False,
             require_admin=True,
         )
-        # Register sidebar title i18n script (runs on every page)
-        sidebar_title_path = os.path.join(uploads_dir, "sidebar-title.js")
-        sidebar_hash = await hass.async_add_executor_job(
-            _get_file_hash, sidebar_title_path
-        )
-        frontend.add_extra_js_url(
-            hass, f"/ha_rebrand/sidebar-title.js?v={sidebar_hash}"
-        )
-
         hass.data[DATA_PANEL_REGISTERED] = True
 
+    # Work the first page doesn't need waits until Home Assistant has started
+    entry.async_on_unload(async_at_started(hass, _async_startup_tasks))
+
+    _LOGGER.debug(
+        "HA Rebrand: Setup took %.1f ms", (time.monotonic() - setup_started) * 1000
+    )
     _LOGGER.info("HA Rebrand component loaded successfully")
     return True
 
 
+async def _async_startup_tasks(hass: HomeAssistant) -> None:
+    """Run deferred setup work once Home Assistant has started."""
+    if (uploads_dir := hass.data.get(DOMAIN, {}).get("uploads_dir")) is None:
+        return
+    await asyncio.gather(
+        _async_timed("register sidebar title", _async_register_sidebar_title(hass)),
+        _async_timed(
+            "orphan cleanup",
+            _async_io_write(
+                hass,
+                uploads_dir,
+                _remove_orphan_assets,
+                uploads_dir,
+                referenced_assets(_config_json(hass.data[DOMAIN])),
+            ),
+        ),
+        _async_io(hass, remove_import_staging, hass.config.path(STORAGE_DIR)),
+    )
+
+
+async def _async_register_sidebar_title(hass: HomeAssistant) -> None:
+    """Register the sidebar title i18n script (runs on every page) once."""
+    if hass.data.get(DATA_SIDEBAR_REGISTERED):
+        return
+    sidebar_title_path = hass.config.path("www", "ha_rebrand", "sidebar-title.js")
+    sidebar_hash = await _async_io(hass, _get_file_hash, sidebar_title_path)
+    frontend.add_extra_js_url(hass, f"/ha_rebrand/sidebar-title.js?v={sidebar_hash}")
+    hass.data[DATA_SIDEBAR_REGISTERED] = True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: HaRebrandConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.info("Unloading HA Rebrand")
@@ -245,13 +422,279 @@ async def async_unload_entry(hass: HomeAssistant, entry: HaRebrandConfigEntry) -
             frontend.async_remove_panel(hass, PANEL_URL_PATH)
         hass.data[DATA_PANEL_REGISTERED] = False
 
+    if (templates := hass.data.pop(DATA_TEMPLATES, None)) is not None:
+        templates.async_shutdown()
+
+    # Later I/O falls back to the shared executor; the pool itself is shut
+    # down by the entry's last unload callback, once nothing can submit to it
+    hass.data.pop(DATA_IO_EXECUTOR, None)
+
     # Clean up hass.data but keep uploads_dir reference
     uploads_dir = hass.data.get(DOMAIN, {}).get("uploads_dir")
     hass.data[DOMAIN] = {"uploads_dir": uploads_dir} if uploads_dir else {}
+    hass.data.pop(DATA_ARTIFACT_INPUTS, None)
+    hass.data.pop(DATA_PERSISTED_CONFIG, None)
+    hass.data.pop(DATA_PERSISTED_PRIVATE, None)
+    hass.data.pop(DATA_STORE, None)
+    hass.data.pop(DATA_CONFIG_WATCHER, None)
+    hass.data[DATA_RENDER_CACHE].clear()
 
     return True
 
 
+async def _async_timed[T](phase: str, awaitable: Awaitable[T]) -> T:
+    """Await a setup phase and log how long it took."""
+    started = time.monotonic()
+    try:
+        return await awaitable
+    finally:
+        _LOGGER.debug(
+            "HA Rebrand: Setup phase '%s' took %.1f ms",
+            phase,
+            (time.monotonic() - started) * 1000,
+        )
+
+
+async def _async_io[T](hass: HomeAssistant, target: Callable[..., T], *args: Any) -> T:
+    """Run blocking file I/O on the integration's executor."""
+    if (executor := hass.data.get(DATA_IO_EXECUTOR)) is None:
+        return await hass.async_add_executor_job(target, *args)
+    return await executor.async_run(target, *args)
+
+
+async def _async_io_write[T](
+    hass: HomeAssistant, path: str, target: Callable[..., T], *args: Any
+) -> T:
+    """Run a blocking write to path, serialized with other writes to it."""
+    if (executor := hass.data.get(DATA_IO_EXECUTOR)) is None:
+        return await hass.async_add_executor_job(target, *args)
+    return await executor.async_write(path, target, *args)
+
+
+@callback
+def _async_config_changed(hass: HomeAssistant) -> None:
+    """Rebuild the profile index and drop the artifacts the change affects.
+
+    Each profile's effective fields are compared with the previous ones, so
+    a change to the default profile only invalidates profiles inheriting it,
+    and only the artifacts rendered from the changed fields.
+    """
+    config = hass.data[DOMAIN]
+    config[PROFILE_CONFIGS], config[PROFILE_HOSTS] = build_profiles(
+        config, config.get(CONF_PROFILES, {})
+    )
+
+    inputs = {DEFAULT_PROFILE: snapshot(config)}
+    inputs.update(
+        (name, snapshot(profile)) for name, profile in config[PROFILE_CONFIGS].items()
+    )
+    previous: dict[str, dict[str, Any]] = hass.data.get(DATA_ARTIFACT_INPUTS, {})
+    hass.data[DATA_ARTIFACT_INPUTS] = inputs
+
+    cache: ArtifactCache = hass.data[DATA_RENDER_CACHE]
+    for profile in previous.keys() | inputs.keys():
+        kinds = affected_artifacts(previous.get(profile), inputs.get(profile))
+        if kinds and (dropped := cache.invalidate(profile, kinds)):
+            _LOGGER.debug(
+                "HA Rebrand: Dropped %d cached artifacts (%s) for profile %s",
+                dropped,
+                ", ".join(sorted(kinds)),
+                profile,
+            )
+
+    # Let open frontends fetch the new config
+    revision = hass.data.get(DATA_CONFIG_REVISION, 0) + 1
+    hass.data[DATA_CONFIG_REVISION] = revision
+    async_dispatcher_send(hass, SIGNAL_CONFIG_UPDATED, revision)
+
+
+@callback
+def _async_assets_replaced(hass: HomeAssistant) -> None:
+    """Drop artifacts derived from image content after uploads are written.
+
+    An upload may replace a file under the same name, which leaves the
+    config (and so the tracked inputs) unchanged.
+    """
+    cache: ArtifactCache = hass.data[DATA_RENDER_CACHE]
+    for profile in hass.data.get(DATA_ARTIFACT_INPUTS, {}):
+        cache.invalidate(profile, {ARTIFACT_MANIFEST})
+
+
+@callback
+def _async_resolve_branding(
+    hass: HomeAssistant, request: web.Request | None
+) -> tuple[str, str | None, Mapping[str, Any]]:
+    """Return the profile, negotiated locale and profile config for a request.
+
+    An explicit ``lang`` query parameter takes precedence over the
+    Accept-Language header. The config is not localized yet so callers can
+    skip that work when serving a cached artifact.
+    """
+    if request is None:
+        return DEFAULT_PROFILE, None, hass.data.get(DOMAIN, {})
+    profile, config = resolve_profile(hass.data.get(DOMAIN, {}), request.host)
+    locale = None
+    if locales := available_locales(config):
+        locale = negotiate_locale(
+            request.query.get("lang") or request.headers.get(hdrs.ACCEPT_LANGUAGE, ""),
+            locales,
+        )
+    return profile, locale, config
+
+
+@callback
+def _async_asset_urls(hass: HomeAssistant) -> dict[str, str] | None:
+    """Return the content-hashed URLs of the static assets, once loaded."""
+    assets: StaticAssets | None = hass.data.get(DATA_STATIC_ASSETS)
+    return assets.urls if assets else None
+
+
+def _etag_matches(request: web.Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match matches an entity tag.
+
+    Uses the weak comparison If-None-Match calls for, so ``W/"x"`` matches
+    ``"x"``; ``*`` matches any tag.
+    """
+    if (tags := request.if_none_match) is None:
+        return False
+    return any(tag.value in (etag, "*") for tag in tags)
+
+
+def _color_scheme_hint(request: web.Request | None) -> str | None:
+    """Return the color scheme from a request's client hint, if sent."""
+    if request is None:
+        return None
+    scheme = request.headers.get(HEADER_COLOR_SCHEME, "").strip('" ')
+    return scheme if scheme in COLOR_SCHEMES else None
+
+
+@callback
+def _async_preload_header(
+    hass: HomeAssistant,
+    request: web.Request,
+    page: BrandedPage,
+    modules: tuple[str, ...] = (),
+) -> str:
+    """Return the Link header preloading a branded page's assets."""
+    profile, _, config = _async_resolve_branding(hass, request)
+    color_scheme = _color_scheme_hint(request)
+    cache: ArtifactCache = hass.data[DATA_RENDER_CACHE]
+    key = (profile, ARTIFACT_PRELOAD, page.name, color_scheme, modules)
+    if (link := cache.get(key)) is None:
+        link = cache.put(key, ", ".join(preload_links(config, color_scheme, modules)))
+    return str(link)
+
+
+def _config_payload(config: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the public branding payload for a profile config."""
+    payload = {key: config.get(key) for key in BRANDING_KEYS}
+    payload[CONF_SYSTEM_NAME] = config.get(CONF_SYSTEM_NAME, DEFAULT_SYSTEM_NAME)
+    payload[CONF_HIDE_OPEN_HOME_FOUNDATION] = config.get(
+        CONF_HIDE_OPEN_HOME_FOUNDATION, True
+    )
+    return payload
+
+
+def _client_payload(config: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the branding payload served to the frontend injector.
+
+    Adds the CSS variables of the primary color palette, so the browser
+    applies them as they are.
+    """
+    payload = _config_payload(config)
+    palette = derive_palette(config.get(CONF_PRIMARY_COLOR))
+    payload["palette"] = palette_variables(palette) if palette else None
+    return payload
+
+
+def _build_config(config: Mapping[str, Any], uploads_dir: str) -> dict[str, Any]:
+    """Return the runtime config for a loaded or imported config.json."""
+    return {
+        CONF_SYSTEM_NAME: config.get(CONF_SYSTEM_NAME, DEFAULT_SYSTEM_NAME),
+        CONF_LOGO: config.get(CONF_LOGO),
+        CONF_LOGO_DARK: config.get(CONF_LOGO_DARK),
+        CONF_FAVICON: config.get(CONF_FAVICON),
+        CONF_SIDEBAR_TEXT: config.get(
+            CONF_SIDEBAR_TEXT, config.get(CONF_SYSTEM_NAME, DEFAULT_SYSTEM_NAME)
+        ),
+        CONF_BROWSER_TAB_TITLE: config.get(
+            CONF_BROWSER_TAB_TITLE, config.get(CONF_SYSTEM_NAME, DEFAULT_SYSTEM_NAME)
+        ),
+        CONF_HIDE_OPEN_HOME_FOUNDATION: config.get(
+            CONF_HIDE_OPEN_HOME_FOUNDATION, True
+        ),
+        CONF_PRIMARY_COLOR: config.get(CONF_PRIMARY_COLOR),
+        CONF_TRANSLATIONS: config.get(CONF_TRANSLATIONS),
+        CONF_PROFILES: config.get(CONF_PROFILES) or {},
+        CONF_IMAGE_SIZES: config.get(CONF_IMAGE_SIZES) or {},
+        "uploads_dir": uploads_dir,
+    }
+
+
+@callback
+def _async_record_image_size(
+    config: dict[str, Any], url_path: str, info: ImageInfo
+) -> None:
+    """Remember the intrinsic size of an uploaded image."""
+    sizes = config.setdefault(CONF_IMAGE_SIZES, {})
+    if info.width and info.height:
+        sizes[url_path] = [info.width, info.height]
+    else:
+        sizes.pop(url_path, None)
+
+
+@callback
+def _async_apply_uploads(
+    hass: HomeAssistant, profile: str, uploads: Mapping[str, tuple[str, ImageInfo]]
+) -> dict[str, str]:
+    """Point a profile at newly written uploads and return their URL paths.
+
+    ``uploads`` maps file types to the stored filename and image info.
+    """
+    config = hass.data[DOMAIN]
+    paths = {
+        file_type: f"/local/ha_rebrand/{filename}"
+        for file_type, (filename, _) in uploads.items()
+    }
+    if profile == DEFAULT_PROFILE:
+        config.update(paths)
+    else:
+        config.setdefault(CONF_PROFILES, {}).setdefault(profile, {}).update(paths)
+    for file_type, (_, info) in uploads.items():
+        _async_record_image_size(config, paths[file_type], info)
+    _async_config_changed(hass)
+    _async_assets_replaced(hass)
+    return paths
+
+
+def _draft_config(
+    config: Mapping[str, Any], profile: str, draft: Mapping[str, Any]
+) -> dict[str, Any]:
+    """Return a profile's effective config with unsaved draft values applied.
+
+    As when saving, None resets a field: to unset on the default profile, to
+    the default profile's value on others.
+    """
+    if profile == DEFAULT_PROFILE:
+        effective = dict(config)
+    else:
+        effective = dict(config.get(PROFILE_CONFIGS, {}).get(profile, config))
+    for key, value in draft.items():
+        if value is not None:
+            effective[key] = value
+        elif profile == DEFAULT_PROFILE:
+            effective.pop(key, None)
+        else:
+            effective[key] = config.get(key)
+    return effective
+
+
+def _upload_filename(profile: str, file_type: str, ext: str) -> str:
+    """Return the stored filename of an upload."""
+    prefix = "" if profile == DEFAULT_PROFILE else f"{profile}-"
+    return f"{prefix}{file_type}{ext}"
+
+
 def _create_directory(path: str) -> None:
     """Create directory if it doesn't exist."""
     if not os.path.exists(path):
@@ -281,56 +724,143 @@ def _migrate_config(config: dict[str, Any]) -> tuple[dict[str, Any], bool]:
     return config, migrated
 
 
+def _read_config_json(path: str) -> dict[str, Any] | None:
+    """Read config from JSON file and migrate old keys if needed.
+
+    Returns None if the file is missing or can't be used.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            result = json.load(f)
+    except json.JSONDecodeError as e:
+        _LOGGER.warning("Invalid JSON in config file %s: %s", path, e)
+        return None
+    except OSError as e:
+        _LOGGER.warning("Could not read config file %s: %s", path, e)
+        return None
+    if not isinstance(result, dict):
+        _LOGGER.warning("Config file %s does not contain an object", path)
+        return None
+    # Migrate old config keys to new names; setup writes the migrated
+    # config back with the initial config.json write
+    result, _ = _migrate_config(result)
+    return result
+
+
 def _load_config_json(path: str) -> dict[str, Any]:
-    """Load config from JSON file and migrate old keys if needed."""
-    if os.path.exists(path):
-        try:
-            with open(path, encoding="utf-8") as f:
-                result: dict[str, Any] = json.load(f)
-                # Migrate old config keys to new names
-                result, was_migrated = _migrate_config(result)
-                if was_migrated:
-                    # Write back the migrated config
-                    try:
-                        with open(path, "w", encoding="utf-8") as fw:
-                            json.dump(result, fw, ensure_ascii=False, indent=2)
-                        _LOGGER.info(
-                            "HA Rebrand: Saved migrated config to %s", path
-                        )
-                    except OSError as e:
-                        _LOGGER.warning(
-                            "Could not save migrated config to %s: %s", path, e
-                        )
-                return result
-        except json.JSONDecodeError as e:
-            _LOGGER.warning("Invalid JSON in config file %s: %s", path, e)
-        except OSError as e:
-            _LOGGER.warning("Could not read config file %s: %s", path, e)
-    return {}
+    """Load config from JSON file, or an empty config if there is none."""
+    return _read_config_json(path) or {}
 
 
 def _write_config_json(path: str, config: dict) -> None:
-    """Write config to JSON file for static serving."""
-    with open(path, "w", encoding="utf-8") as f:
+    """Write config to JSON file for static serving.
+
+    The file is replaced atomically so readers never see a partial write.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(config, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _private_config(config: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the parts of the runtime config that are never served."""
+    return {key: value for key in _PRIVATE_KEYS if (value := config.get(key))}
+
+
+def _config_json(config: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the complete persisted form of the runtime config, as exported."""
+    return {**_config_payload(config), **_private_config(config)}
 
 
 async def _async_write_config_json(hass: HomeAssistant) -> None:
-    """Write current config to JSON file."""
+    """Persist the current config, skipping the parts that are unchanged.
+
+    The public branding goes to config.json, profiles and image sizes to
+    the private store.
+    """
     config = hass.data.get(DOMAIN, {})
-    config_json = {
-        "system_name": config.get(CONF_SYSTEM_NAME, DEFAULT_SYSTEM_NAME),
-        "logo": config.get(CONF_LOGO),
-        "logo_dark": config.get(CONF_LOGO_DARK),
-        "favicon": config.get(CONF_FAVICON),
-        "sidebar_text": config.get(CONF_SIDEBAR_TEXT),
-        "browser_tab_title": config.get(CONF_BROWSER_TAB_TITLE),
-        "hide_open_home_foundation": config.get(CONF_HIDE_OPEN_HOME_FOUNDATION, True),
-        "primary_color": config.get(CONF_PRIMARY_COLOR),
-    }
-    uploads_dir = config.get("uploads_dir", hass.config.path("www", "ha_rebrand"))
+    public = _config_payload(config)
+    if public != hass.data.get(DATA_PERSISTED_CONFIG):
+        persisted = copy.deepcopy(public)
+        uploads_dir = config.get("uploads_dir", hass.config.path("www", "ha_rebrand"))
+        config_json_path = os.path.join(uploads_dir, "config.json")
+        await _async_io_write(
+            hass, config_json_path, _write_config_json, config_json_path, persisted
+        )
+        hass.data[DATA_PERSISTED_CONFIG] = persisted
+    private = _private_config(config)
+    store: Store[dict[str, Any]] | None = hass.data.get(DATA_STORE)
+    if store is not None and private != hass.data.get(DATA_PERSISTED_PRIVATE):
+        persisted = copy.deepcopy(private)
+        await store.async_save(persisted)
+        hass.data[DATA_PERSISTED_PRIVATE] = persisted
+
+
+async def _async_reload_config_json(hass: HomeAssistant) -> None:
+    """Apply config.json after it changed on disk.
+
+    Changes matching what was last written or loaded, including our own
+    writes, are ignored. A file that doesn't validate leaves the running
+    config in place. The file is not written back. Profiles and image sizes
+    come from the store unless the file brings its own.
+    """
+    uploads_dir = hass.data.get(DOMAIN, {}).get("uploads_dir")
+    if uploads_dir is None:
+        return
     config_json_path = os.path.join(uploads_dir, "config.json")
-    await hass.async_add_executor_job(_write_config_json, config_json_path, config_json)
+    # Serialized with our own writes to the file
+    loaded = await _async_io_write(
+        hass, config_json_path, _read_config_json, config_json_path
+    )
+    if loaded is None or loaded == hass.data.get(DATA_PERSISTED_CONFIG):
+        return
+    try:
+        validated = CONFIG_JSON_SCHEMA(
+            {**_private_config(hass.data.get(DOMAIN, {})), **copy.deepcopy(loaded)}
+        )
+    except vol.Invalid as err:
+        _LOGGER.warning(
+            "HA Rebrand: Ignoring changed %s, it is invalid: %s", config_json_path, err
+        )
+        return
+
+    hass.data[DOMAIN] = _build_config(validated, uploads_dir)
+    hass.data[DATA_PERSISTED_CONFIG] = loaded
+    _async_config_changed(hass)
+    _async_assets_replaced(hass)
+    _LOGGER.info("HA Rebrand: Reloaded %s after it changed on disk", config_json_path)
+
+
+def _remove_orphan_assets(uploads_dir: str, referenced: set[str]) -> None:
+    """Delete uploads no longer referenced by any profile.
+
+    Only files named like uploads are considered, so frontend files and
+    manually placed images are never touched. Abandoned chunked upload
+    staging files are removed as well.
+    """
+    cutoff = time.time() - ORPHAN_MIN_AGE
+    with os.scandir(uploads_dir) as entries:
+        for entry in entries:
+            try:
+                if (
+                    entry.name.startswith(STAGING_PREFIX)
+                    and entry.is_file()
+                    and entry.stat().st_mtime < cutoff
+                ) or (
+                    _UPLOAD_FILENAME.match(entry.name)
+                    and entry.name not in referenced
+                    and entry.is_file()
+                    and entry.stat().st_mtime < cutoff
+                ):
+                    os.remove(entry.path)
+                else:
+                    continue
+                _LOGGER.info("HA Rebrand: Removed orphaned %s", entry.name)
+            except OSError as e:
+                _LOGGER.warning("Could not remove %s: %s", entry.path, e)
 
 
 def _copy_frontend_files(frontend_src: str, frontend_dest: str) -> None:
@@ -345,14 +875,16 @@ def _copy_frontend_files(frontend_src: str, frontend_dest: str) -> None:
             shutil.copy2(src_file, dest_file)
 
 
-async def _async_register_frontend(hass: HomeAssistant) -> None:
-    """Register frontend resources."""
+async def _async_register_frontend(hass: HomeAssistant) -> str:
+    """Register frontend resources and return the panel's content hash."""
     component_dir = os.path.dirname(__file__)
     frontend_src = os.path.join(component_dir, "frontend")
     frontend_dest = hass.config.path("www", "ha_rebrand")
 
     # Copy frontend files using executor
-    await hass.async_add_executor_job(_copy_frontend_files, frontend_src, frontend_dest)
+    await _async_io_write(
+        hass, frontend_dest, _copy_frontend_files, frontend_src, frontend_dest
+    )
 
     # Register the rebrand static path using new API
     # IMPORTANT: Uses cache_headers=False to prevent CDN/proxy caching issues
@@ -363,205 +895,143 @@ async def _async_register_frontend(hass: HomeAssistant) -> None:
     # Get content hash for cache busting (defense in depth for CDN/proxies)
     # This ensures that even if a CDN ignores cache-control headers,
     # the URL changes when file content changes
-    injector_path = os.path.join(frontend_dest, "ha-rebrand-injector.js")
-    injector_hash = await hass.async_add_executor_job(_get_file_hash, injector_path)
+    injector_hash, panel_hash = await asyncio.gather(
+        _async_io(
+            hass, _get_file_hash, os.path.join(frontend_dest, "ha-rebrand-injector.js")
+        ),
+        _async_io(
+            hass, _get_file_hash, os.path.join(frontend_dest, "ha-rebrand-panel.js")
+        ),
+    )
 
     # Register the injector script to be loaded on every page (for post-auth pages)
     # Uses /ha_rebrand/ path (not /local/) because /local/ has 31-day cache headers
     # from HA core, which causes CDN/proxy caching issues
-    frontend.add_extra_js_url(hass, f"/ha_rebrand/ha-rebrand-injector.js?v={injector_hash}")
+    injector_url = f"/ha_rebrand/ha-rebrand-injector.js?v={injector_hash}"
+    frontend.add_extra_js_url(hass, injector_url)
+    hass.data[DATA_INJECTOR_URL] = injector_url
+    return panel_hash
 
-    # Patch IndexView to inject early branding script for loading screen
-    _patch_index_view(hass)
 
+@callback
+def _async_hook_index_view(hass: HomeAssistant) -> IndexViewHook | None:
+    """Hook IndexView to brand the loading screen and preload its assets.
 
-def _unregister_static_path(hass: HomeAssistant, path: str) -> bool:
-    """Remove an existing static path so we can register a custom view.
+    The hook brands each response for its request's host, language and
+    color scheme, reading the current config, so it is installed once per
+    entry setup and removed again on unload.
+    """
 
-    Args:
-        hass: Home Assistant instance
-        path: The URL path to unregister (e.g., "/auth/authorize", "/onboarding")
+    @callback
+    def link(request: web.Request) -> str | None:
+        injector_url = hass.data.get(DATA_INJECTOR_URL)
+        return _async_preload_header(
+            hass, request, INDEX_PAGE, (injector_url,) if injector_url else ()
+        )
 
-    Returns True if successfully removed, False otherwise.
-    """
-    try:
-        app = hass.http.app
-        router = app.router
-
-        # Find and remove the resource for the given path
-        resources_to_remove = []
-        for resource in router.resources():
-            # Check if this resource matches the path
-            if hasattr(resource, "_path") and resource._path == path:
-                resources_to_remove.append(resource)
-            elif hasattr(resource, "canonical") and resource.canonical == path:
-                resources_to_remove.append(resource)
-            elif hasattr(resource, "url_for"):
-                try:
-                    # Try to get the URL - note: StaticResource requires filename arg
-                    # so we skip those by catching TypeError
-                    url = str(resource.url_for())
-                    if url == path:
-                        resources_to_remove.append(resource)
-                except (ValueError, KeyError, TypeError):
-                    # url_for() may fail for some resource types
-                    # StaticResource requires filename argument
-                    pass
-
-        if not resources_to_remove:
-            _LOGGER.debug(
-                "HA Rebrand: No existing %s resource found to remove", path
-            )
-            return False
-
-        for resource in resources_to_remove:
-            # aiohttp doesn't have a clean way to remove resources,
-            # but we can unindex it from the router's name lookup
-            if hasattr(router, "unindex_resource"):
-                router.unindex_resource(resource)
-            # Also remove from _resources list if possible
-            if hasattr(router, "_resources") and resource in router._resources:
-                router._resources.remove(resource)
-            _LOGGER.info(
-                "HA Rebrand: Removed existing %s resource: %s", path, resource
+    @callback
+    def render(request: web.Request, html: str) -> str:
+        # The latest upstream launch screen, for previews
+        hass.data[DATA_INDEX_HTML] = html
+        profile, locale, config = _async_resolve_branding(hass, request)
+        color_scheme = _color_scheme_hint(request)
+        # Keyed by the upstream HTML too, which changes with the frontend's
+        # extra modules and theme color
+        cache: ArtifactCache = hass.data[DATA_RENDER_CACHE]
+        key = (profile, INDEX_PAGE.name, locale, color_scheme, html)
+        if (rendered := cache.get(key)) is None:
+            rendered = cache.put(
+                key,
+                INDEX_PAGE.render(
+                    html,
+                    localize(config, locale),
+                    color_scheme,
+                    _async_asset_urls(hass),
+                ),
+                extra=len(html),
             )
+        return str(rendered)
 
-        return True
-
-    except (AttributeError, RuntimeError, TypeError) as e:
-        _LOGGER.error(
-            "HA Rebrand: Failed to remove %s route: %s", path, e
+    try:
+        hook = IndexViewHook(
+            frontend.IndexView,
+            link,
+            render,
+            {
+                "Accept-CH": HEADER_COLOR_SCHEME,
+                hdrs.VARY: f"Accept-Language, {HEADER_COLOR_SCHEME}",
+            },
         )
-        return False
+        if not hook.async_install():
+            return None
+    except AttributeError as e:
+        _LOGGER.warning("Failed to patch IndexView: %s", e)
+        return None
+    _LOGGER.info("Successfully patched IndexView for early branding injection")
+    return hook
 
 
-def _patch_index_view(hass: HomeAssistant) -> None:
-    """Patch IndexView to inject early branding script for loading screen."""
-    try:
-        original_get_template = frontend.IndexView.get_template
-
-        def patched_get_template(self: Any) -> Any:
-            tpl = original_get_template(self)
-            original_render = tpl.render
-
-            def patched_render(*args: Any, **kwargs: Any) -> str:
-                html: str = original_render(*args, **kwargs)
-                config = hass.data.get(DOMAIN, {})
-
-                # Always inject OHF hiding CSS if configured (independent of logo)
-                hide_ohf = config.get(CONF_HIDE_OPEN_HOME_FOUNDATION, True)
-                if hide_ohf:
-                    ohf_hide_css = """<style>
-/* Hide Open Home Foundation badge on loading screen */
-.ohf-logo,
-#ha-launch-screen .ohf-logo,
-a[href*="openhomefoundation"],
-#ha-launch-screen a[href*="openhomefoundation"],
-img[src*="ohf-badge"],
-img[alt*="Open Home Foundation"] {
-  display: none !important;
-  visibility: hidden !important;
-  width: 0 !important;
-  height: 0 !important;
-}
-</style>"""
-                    html = html.replace("</head>", ohf_hide_css + "</head>")
-
-                # Only inject logo replacement if we have a logo configured
-                logo = config.get(CONF_LOGO)
-                if not logo:
-                    return html
-
-                logo_dark = config.get(CONF_LOGO_DARK) or logo
-                system_name = config.get(CONF_SYSTEM_NAME, DEFAULT_SYSTEM_NAME)
-
-                # Strategy 1: Enhanced CSS to immediately hide SVG and show img
-                # Multiple selectors to ensure hiding works in all scenarios
-                # Includes body-level SVG selectors for login/logout loading screen
-                # Note: OHF hiding CSS is now injected separately (independent of logo)
-                css_style = """<style>
-#ha-launch-screen svg,
-#ha-launch-screen ha-svg-icon,
-home-assistant svg[viewBox="0 0 240 240"],
-body svg[viewBox="0 0 240 240"],
-svg[viewBox="0 0 240 240"] {
-  display: none !important;
-  visibility: hidden !important;
-  width: 0 !important;
-  height: 0 !important;
-  opacity: 0 !important;
-  position: absolute !important;
-  pointer-events: none !important;
+@callback
+def _async_rate_limit(hass: HomeAssistant, request: web.Request) -> web.Response | None:
+    """Return a 429 response if the client exceeded the configured rate."""
+    limiter: TokenBucketLimiter | None = hass.data.get(DATA_RATE_LIMITER)
+    if limiter is None:
+        return None
+    retry_after = limiter.acquire(request.remote or "")
+    if not retry_after:
+        return None
+    _LOGGER.debug("HA Rebrand: Rate limited %s on %s", request.remote, request.path)
+    return web.Response(
+        text="Too many requests",
+        status=429,
+        headers={"Retry-After": str(math.ceil(retry_after))},
+    )
+
+
+# Branding fields accepted from the panel; None resets a field
+BRANDING_SCHEMA = {
+    vol.Optional("system_name"): vol.Any(cv.string, None),
+    vol.Optional("logo"): vol.Any(cv.string, None),
+    vol.Optional("logo_dark"): vol.Any(cv.string, None),
+    vol.Optional("favicon"): vol.Any(cv.string, None),
+    vol.Optional("sidebar_text"): vol.Any(cv.string, None),
+    vol.Optional("browser_tab_title"): vol.Any(cv.string, None),
+    vol.Optional("hide_open_home_foundation"): vol.Any(cv.boolean, None),
+    vol.Optional("primary_color"): vol.Any(cv.string, None),
+    vol.Optional("translations"): vol.Any(
+        None,
+        {
+            cv.string: {
+                vol.Optional("system_name"): cv.string,
+                vol.Optional("sidebar_text"): cv.string,
+                vol.Optional("browser_tab_title"): cv.string,
+            }
+        },
+    ),
 }
-#ha-launch-screen > img,
-#ha-launch-screen img.ha-rebrand-logo {
-  display: block !important;
-  height: 120px;
-  width: auto;
-  max-width: 200px;
-  object-fit: contain;
-  margin: 0 auto;
+
+# config.json as written by other tools, checked before it is reloaded
+CONFIG_JSON_SCHEMA = vol.Schema(
+    {
+        **BRANDING_SCHEMA,
+        vol.Optional(CONF_PROFILES): vol.Any(
+            None,
+            {
+                cv.slug: vol.Schema(
+                    {vol.Optional(CONF_HOSTS): [cv.string], **BRANDING_SCHEMA},
+                    extra=vol.ALLOW_EXTRA,
+                )
+            },
+        ),
+        vol.Optional(CONF_IMAGE_SIZES): vol.Any(None, {cv.string: list}),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+# Pages that can be previewed, by the name the panel uses
+PREVIEW_PAGES = {
+    page.name: page for page in (AUTHORIZE_PAGE, ONBOARDING_PAGE, INDEX_PAGE)
 }
-</style>"""
-
-                # Strategy 2: Direct HTML replacement - replace the SVG with img tag
-                # Use html_escape to prevent XSS via logo URL or system_name
-                img_tag = f'<img src="{html_escape(logo)}" alt="{html_escape(system_name)}" class="ha-rebrand-logo">'
-
-                # Replace the SVG in #ha-launch-screen using pre-compiled pattern
-                html = _SVG_PATTERN.sub(img_tag, html, count=1)
-
-                # Strategy 3: JavaScript backup - monitor and fix if JS recreates SVG
-                # Use _escape_js_string to prevent XSS via JavaScript string injection
-                # Dark mode detection uses: 1) color-scheme meta tag, 2) CSS variable luminance, 3) system preference
-                backup_script = f'''<script>
-(function(){{
-  var logo="{_escape_js_string(logo)}",logoD="{_escape_js_string(logo_dark)}",brand="{_escape_js_string(system_name)}";
-  function isDark(){{
-    var meta=document.querySelector('meta[name="color-scheme"]');
-    if(meta){{var c=meta.getAttribute("content");if(c==="dark")return true;if(c==="light")return false;}}
-    var bg=getComputedStyle(document.documentElement).getPropertyValue("--primary-background-color").trim();
-    if(bg&&bg.startsWith("#")){{var hex=bg.slice(1);if(hex.length===3)hex=hex[0]+hex[0]+hex[1]+hex[1]+hex[2]+hex[2];var r=parseInt(hex.slice(0,2),16),g=parseInt(hex.slice(2,4),16),b=parseInt(hex.slice(4,6),16);var lum=0.2126*(r/255)+0.7152*(g/255)+0.0722*(b/255);if(lum<0.2)return true;}}
-    if(document.body.classList.contains("dark"))return true;
-    if(window.matchMedia&&window.matchMedia("(prefers-color-scheme:dark)").matches)return true;
-    return false;
-  }}
-  function fix(){{
-    var ls=document.getElementById("ha-launch-screen");
-    if(!ls)return;
-    var svg=ls.querySelector("svg");
-    if(svg){{svg.style.display="none";svg.style.visibility="hidden";}}
-    var img=ls.querySelector("img.ha-rebrand-logo");
-    if(!img){{
-      img=document.createElement("img");
-      img.src=logo;
-      img.alt=brand;
-      img.className="ha-rebrand-logo";
-      img.style.cssText="display:block;height:120px;width:auto;max-width:200px;object-fit:contain;margin:0 auto;";
-      if(logoD&&isDark()){{img.src=logoD;}}
-      if(svg){{svg.parentNode.insertBefore(img,svg);}}
-      else{{ls.insertBefore(img,ls.firstChild);}}
-    }}
-  }}
-  fix();
-  var obs=new MutationObserver(fix);
-  obs.observe(document.body,{{childList:true,subtree:true}});
-  setTimeout(function(){{obs.disconnect();}},15000);
-}})();
-</script>'''
-
-                # Inject CSS and script into head
-                html = html.replace("</head>", css_style + backup_script + "</head>")
-
-                return html
-
-            tpl.render = patched_render
-            return tpl
-
-        frontend.IndexView.get_template = patched_get_template
-        _LOGGER.info("Successfully patched IndexView for early branding injection")
-    except (AttributeError, TypeError) as e:
-        _LOGGER.warning("Failed to patch IndexView: %s", e)
 
 
 @callback
@@ -580,35 +1050,22 @@ def _async_register_websocket_commands(hass: HomeAssistant) -> None:
         connection: websocket_api.ActiveConnection,
         msg: dict[str, Any],
     ) -> None:
-        """Get rebrand configuration."""
+        """Get rebrand configuration, including per-host profile overrides."""
         config = hass.data.get(DOMAIN, {})
         connection.send_result(
             msg["id"],
             {
-                "system_name": config.get(CONF_SYSTEM_NAME, DEFAULT_SYSTEM_NAME),
-                "logo": config.get(CONF_LOGO),
-                "logo_dark": config.get(CONF_LOGO_DARK),
-                "favicon": config.get(CONF_FAVICON),
-                "sidebar_text": config.get(CONF_SIDEBAR_TEXT),
-                "browser_tab_title": config.get(CONF_BROWSER_TAB_TITLE),
-                "hide_open_home_foundation": config.get(
-                    CONF_HIDE_OPEN_HOME_FOUNDATION, True
-                ),
-                "primary_color": config.get(CONF_PRIMARY_COLOR),
+                **_config_payload(config),
+                CONF_PROFILES: config.get(CONF_PROFILES, {}),
             },
         )
 
     @websocket_api.websocket_command(
         {
             vol.Required("type"): "ha_rebrand/update_config",
-            vol.Optional("system_name"): cv.string,
-            vol.Optional("logo"): vol.Any(cv.string, None),
-            vol.Optional("logo_dark"): vol.Any(cv.string, None),
-            vol.Optional("favicon"): vol.Any(cv.string, None),
-            vol.Optional("sidebar_text"): cv.string,
-            vol.Optional("browser_tab_title"): cv.string,
-            vol.Optional("hide_open_home_foundation"): cv.boolean,
-            vol.Optional("primary_color"): vol.Any(cv.string, None),
+            vol.Optional("profile", default=DEFAULT_PROFILE): cv.slug,
+            vol.Optional(CONF_HOSTS): [cv.string],
+            **BRANDING_SCHEMA,
         }
     )
     @websocket_api.require_admin
@@ -618,35 +1075,355 @@ def _async_register_websocket_commands(hass: HomeAssistant) -> None:
         connection: websocket_api.ActiveConnection,
         msg: dict[str, Any],
     ) -> None:
-        """Update rebrand configuration. Requires admin privileges."""
+        """Update rebrand configuration. Requires admin privileges.
+
+        With a profile other than the default, the values are stored as that
+        profile's overrides and None resets a key to the default profile.
+        """
         config = hass.data.get(DOMAIN, {})
 
-        if "system_name" in msg:
-            config[CONF_SYSTEM_NAME] = msg["system_name"]
-        if "logo" in msg:
-            config[CONF_LOGO] = msg["logo"]
-        if "logo_dark" in msg:
-            config[CONF_LOGO_DARK] = msg["logo_dark"]
-        if "favicon" in msg:
-            config[CONF_FAVICON] = msg["favicon"]
-        if "sidebar_text" in msg:
-            config[CONF_SIDEBAR_TEXT] = msg["sidebar_text"]
-        if "browser_tab_title" in msg:
-            config[CONF_BROWSER_TAB_TITLE] = msg["browser_tab_title"]
-        if "hide_open_home_foundation" in msg:
-            config[CONF_HIDE_OPEN_HOME_FOUNDATION] = msg["hide_open_home_foundation"]
-        if "primary_color" in msg:
-            config[CONF_PRIMARY_COLOR] = msg["primary_color"]
+        if msg["profile"] == DEFAULT_PROFILE:
+            target = config
+        else:
+            target = config.setdefault(CONF_PROFILES, {}).setdefault(msg["profile"], {})
+            if CONF_HOSTS in msg:
+                target[CONF_HOSTS] = [normalize_host(host) for host in msg[CONF_HOSTS]]
+
+        for key in BRANDING_KEYS:
+            if key in msg:
+                target[key] = msg[key]
 
         hass.data[DOMAIN] = config
+        _async_config_changed(hass)
 
         # Write updated config to static JSON file
         await _async_write_config_json(hass)
 
         connection.send_result(msg["id"], {"success": True})
 
+    @websocket_api.websocket_command(
+        {
+            vol.Required("type"): "ha_rebrand/delete_profile",
+            vol.Required("profile"): cv.slug,
+        }
+    )
+    @websocket_api.require_admin
+    @websocket_api.async_response
+    async def websocket_delete_profile(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict[str, Any],
+    ) -> None:
+        """Delete a branding profile. Requires admin privileges."""
+        config = hass.data.get(DOMAIN, {})
+        if config.get(CONF_PROFILES, {}).pop(msg["profile"], None) is None:
+            connection.send_error(msg["id"], "not_found", "Profile not found")
+            return
+
+        _async_config_changed(hass)
+        await _async_write_config_json(hass)
+
+        connection.send_result(msg["id"], {"success": True})
+
+    @websocket_api.websocket_command(
+        {
+            vol.Required("type"): "ha_rebrand/upload_begin",
+            vol.Required("file_type"): vol.In(ALLOWED_FILE_TYPES),
+            vol.Required("filename"): cv.string,
+            vol.Required("size"): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=MAX_FILE_SIZE)
+            ),
+            vol.Optional("profile", default=DEFAULT_PROFILE): cv.slug,
+            vol.Optional("upload_id"): cv.string,
+        }
+    )
+    @websocket_api.require_admin
+    @websocket_api.async_response
+    async def websocket_upload_begin(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict[str, Any],
+    ) -> None:
+        """Start a chunked upload, or resume one given its upload_id.
+
+        A resumed upload returns the offset to continue from; an unknown or
+        mismatched upload_id starts over.
+        """
+        uploads: ChunkedUploads = hass.data[DATA_CHUNKED_UPLOADS]
+        for expired in uploads.pop_expired():
+            await _async_io_write(
+                hass, expired.staging_path, remove_staging, expired.staging_path
+            )
+
+        ext = os.path.splitext(msg["filename"])[1].lower()
+        if ext not in ALLOWED_EXTENSIONS:
+            connection.send_error(
+                msg["id"],
+                "invalid_format",
+                f"Invalid file extension. Allowed: {', '.join(ALLOWED_EXTENSIONS)}",
+            )
+            return
+
+        user_id = connection.user.id
+        if upload_id := msg.get("upload_id"):
+            try:
+                session = uploads.get(upload_id, user_id)
+            except UploadError:
+                session = None
+            if session is not None and (
+                session.file_type,
+                session.ext,
+                session.size,
+                session.profile,
+            ) == (msg["file_type"], ext, msg["size"], msg["profile"]):
+                connection.send_result(
+                    msg["id"],
+                    {
+                        "upload_id": session.upload_id,
+                        "offset": session.offset,
+                        "chunk_size": CHUNK_SIZE,
+                    },
+                )
+                return
+
+        session = uploads.begin(
+            user_id,
+            msg["profile"],
+            msg["file_type"],
+            ext,
+            msg["size"],
+            hass.data[DOMAIN]["uploads_dir"],
+        )
+        await _async_io_write(
+            hass, session.staging_path, create_staging, session.staging_path
+        )
+        connection.send_result(
+            msg["id"],
+            {"upload_id": session.upload_id, "offset": 0, "chunk_size": CHUNK_SIZE},
+        )
+
+    @websocket_api.websocket_command(
+        {
+            vol.Required("type"): "ha_rebrand/upload_chunk",
+            vol.Required("upload_id"): cv.string,
+            vol.Required("offset"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            # Base64 encoded chunk data and the hex SHA-256 of the decoded bytes
+            vol.Required("data"): cv.string,
+            vol.Optional("sha256"): cv.string,
+        }
+    )
+    @websocket_api.require_admin
+    @websocket_api.async_response
+    async def websocket_upload_chunk(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict[str, Any],
+    ) -> None:
+        """Append a chunk to an upload and return the next offset."""
+        uploads: ChunkedUploads = hass.data[DATA_CHUNKED_UPLOADS]
+        try:
+            session = uploads.get(msg["upload_id"], connection.user.id)
+            try:
+                data = base64.b64decode(msg["data"], validate=True)
+            except binascii.Error as err:
+                raise UploadError("invalid_format", "Chunk is not base64") from err
+            if not data or len(data) > MAX_CHUNK_SIZE:
+                raise UploadError(
+                    "invalid_format",
+                    f"Chunks must be between 1 and {MAX_CHUNK_SIZE} bytes",
+                )
+            async with session.lock:
+                if session.check_chunk(msg["offset"], data, msg.get("sha256")):
+                    await _async_io_write(
+                        hass,
+                        session.staging_path,
+                        write_chunk,
+                        session.staging_path,
+                        msg["offset"],
+                        data,
+                    )
+                    session.advance(data)
+        except UploadError as err:
+            connection.send_error(msg["id"], err.code, str(err))
+            return
+        except ImageError as err:
+            # Not worth resuming: the content is not an acceptable image
+            await _async_discard_upload(hass, session)
+            connection.send_error(msg["id"], "invalid_image", str(err))
+            return
+
+        connection.send_result(
+            msg["id"], {"offset": session.offset, "complete": session.complete}
+        )
+
+    @websocket_api.websocket_command(
+        {
+            vol.Required("type"): "ha_rebrand/upload_commit",
+            vol.Required("upload_id"): cv.string,
+            # Optional hex SHA-256 of the whole file
+            vol.Optional("sha256"): cv.string,
+        }
+    )
+    @websocket_api.require_admin
+    @websocket_api.async_response
+    async def websocket_upload_commit(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict[str, Any],
+    ) -> None:
+        """Store a completed upload and apply it to the profile."""
+        uploads: ChunkedUploads = hass.data[DATA_CHUNKED_UPLOADS]
+        try:
+            session = uploads.get(msg["upload_id"], connection.user.id)
+        except UploadError as err:
+            connection.send_error(msg["id"], err.code, str(err))
+            return
+
+        async with session.lock:
+            if not session.complete or session.info is None:
+                connection.send_error(
+                    msg["id"],
+                    "incomplete",
+                    f"Received {session.offset} of {session.size} bytes",
+                )
+                return
+            if (sha256 := msg.get("sha256")) is not None and (
+                session.digest.hexdigest() != sha256.lower()
+            ):
+                await _async_discard_upload(hass, session)
+                connection.send_error(
+                    msg["id"], "checksum_mismatch", "File checksum does not match"
+                )
+                return
+
+            filename = _upload_filename(session.profile, session.file_type, session.ext)
+            file_path = os.path.join(hass.data[DOMAIN]["uploads_dir"], filename)
+            try:
+                await _async_io_write(
+                    hass, file_path, os.replace, session.staging_path, file_path
+                )
+            except OSError as err:
+                # The staging file is left in place, so the commit can be
+                # retried until the session expires
+                _LOGGER.warning("Could not store upload %s: %s", filename, err)
+                connection.send_error(
+                    msg["id"], "write_failed", f"Could not store {filename}"
+                )
+                return
+            uploads.pop(session.upload_id)
+
+        paths = _async_apply_uploads(
+            hass, session.profile, {session.file_type: (filename, session.info)}
+        )
+        await _async_write_config_json(hass)
+        connection.send_result(
+            msg["id"],
+            {
+                "success": True,
+                "path": paths[session.file_type],
+                "filename": filename,
+            },
+        )
+
+    @websocket_api.websocket_command(
+        {
+            vol.Required("type"): "ha_rebrand/preview",
+            vol.Required("page"): vol.In(PREVIEW_PAGES),
+            vol.Optional("profile", default=DEFAULT_PROFILE): cv.slug,
+            vol.Optional("draft", default={}): BRANDING_SCHEMA,
+            vol.Optional("language"): cv.string,
+            vol.Optional("color_scheme"): vol.In(COLOR_SCHEMES),
+        }
+    )
+    @websocket_api.require_admin
+    @websocket_api.async_response
+    async def websocket_preview(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict[str, Any],
+    ) -> None:
+        """Render a page against an unsaved draft of a profile's branding.
+
+        Nothing is written or invalidated; renders are cached by the draft's
+        hash in a cache of their own.
+        """
+        page = PREVIEW_PAGES[msg["page"]]
+        if page is INDEX_PAGE:
+            template = hass.data.get(DATA_INDEX_HTML)
+        else:
+            templates: FrontendTemplates | None = hass.data.get(DATA_TEMPLATES)
+            template = templates.async_get(f"{page.name}.html") if templates else None
+        if template is None:
+            connection.send_error(
+                msg["id"], "not_available", f"The {page.name} page is not loaded yet"
+            )
+            return
+
+        draft = _draft_config(hass.data.get(DOMAIN, {}), msg["profile"], msg["draft"])
+        locale = None
+        if (language := msg.get("language")) and (locales := available_locales(draft)):
+            locale = negotiate_locale(language, locales)
+        color_scheme = msg.get("color_scheme")
+        digest = hashlib.sha256(
+            json_bytes([snapshot(draft), page.name, locale, color_scheme])
+        ).hexdigest()[:16]
+
+        cache: ArtifactCache = hass.data[DATA_PREVIEW_CACHE]
+        key = (digest, hashlib.md5(template.encode()).hexdigest())
+        if (html := cache.get(key)) is None:
+            html = cache.put(
+                key,
+                page.render(
+                    template,
+                    localize(draft, locale),
+                    color_scheme,
+                    _async_asset_urls(hass),
+                ),
+            )
+        connection.send_result(msg["id"], {"html": html, "hash": digest})
+
+    @websocket_api.websocket_command(
+        {
+            vol.Required("type"): "ha_rebrand/subscribe_config",
+        }
+    )
+    @callback
+    def websocket_subscribe_config(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict[str, Any],
+    ) -> None:
+        """Send the config revision to the client whenever the config changes."""
+
+        @callback
+        def forward(revision: int) -> None:
+            connection.send_message(
+                websocket_api.event_message(msg["id"], {"revision": revision})
+            )
+
+        connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+            hass, SIGNAL_CONFIG_UPDATED, forward
+        )
+        connection.send_result(
+            msg["id"], {"revision": hass.data.get(DATA_CONFIG_REVISION, 0)}
+        )
+
     websocket_api.async_register_command(hass, websocket_get_config)
+    websocket_api.async_register_command(hass, websocket_subscribe_config)
     websocket_api.async_register_command(hass, websocket_update_config)
+    websocket_api.async_register_command(hass, websocket_preview)
+    websocket_api.async_register_command(hass, websocket_delete_profile)
+    websocket_api.async_register_command(hass, websocket_upload_begin)
+    websocket_api.async_register_command(hass, websocket_upload_chunk)
+    websocket_api.async_register_command(hass, websocket_upload_commit)
+
+
+async def _async_discard_upload(hass: HomeAssistant, session: UploadSession) -> None:
+    """Drop a chunked upload and its staging file."""
+    hass.data[DATA_CHUNKED_UPLOADS].pop(session.upload_id)
+    await _async_io_write(
+        hass, session.staging_path, remove_staging, session.staging_path
+    )
 
 
 class RebrandConfigView(HomeAssistantView):
@@ -662,20 +1439,19 @@ class RebrandConfigView(HomeAssistantView):
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle GET request."""
-        config = self.hass.data.get(DOMAIN, {})
-        return self.json(
-            {
-                "system_name": config.get(CONF_SYSTEM_NAME, DEFAULT_SYSTEM_NAME),
-                "logo": config.get(CONF_LOGO),
-                "logo_dark": config.get(CONF_LOGO_DARK),
-                "favicon": config.get(CONF_FAVICON),
-                "sidebar_text": config.get(CONF_SIDEBAR_TEXT),
-                "browser_tab_title": config.get(CONF_BROWSER_TAB_TITLE),
-                "hide_open_home_foundation": config.get(
-                    CONF_HIDE_OPEN_HOME_FOUNDATION, True
-                ),
-                "primary_color": config.get(CONF_PRIMARY_COLOR),
-            }
+        if (limited := _async_rate_limit(self.hass, request)) is not None:
+            return limited
+
+        profile, locale, config = _async_resolve_branding(self.hass, request)
+        cache: ArtifactCache = self.hass.data[DATA_RENDER_CACHE]
+        key = (profile, ARTIFACT_BRAND_CONFIG, locale)
+        if (body := cache.get(key)) is None:
+            body = cache.put(key, json_bytes(_client_payload(localize(config, locale))))
+
+        return web.Response(
+            body=body,
+            content_type="application/json",
+            headers={"Cache-Control": "no-cache", "Vary": "Accept-Language"},
         )
 
 
@@ -696,11 +1472,34 @@ class RebrandUploadView(HomeAssistantView):
         if not request["hass_user"].is_admin:
             return self.json({"error": "Admin privileges required"}, status_code=403)
 
-        data = await request.post()
-        file_field = data.get("file")
-        file_type = data.get("type", "logo")
-
-        if not file_field:
+        file_type = "logo"
+        upload: tuple[str, bytes, ImageInfo] | None = None
+        reader = await request.multipart()
+        async for part in reader:
+            if part.name == "type":
+                file_type = await part.text()
+                continue
+            if part.name != "file":
+                continue
+
+            # Get and validate file extension
+            ext = os.path.splitext(part.filename or "")[1].lower()
+            if ext not in ALLOWED_EXTENSIONS:
+                return self.json(
+                    {
+                        "error": f"Invalid file extension. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
+                    },
+                    status_code=400,
+                )
+
+            # Check the image header before reading the rest of the file
+            try:
+                content, info = await read_image(part, ext)
+            except ImageError as err:
+                return self.json({"error": str(err)}, status_code=400)
+            upload = (ext, content, info)
+
+        if upload is None:
             return self.json({"error": "No file provided"}, status_code=400)
 
         # Validate file_type against allowlist
@@ -712,39 +1511,22 @@ class RebrandUploadView(HomeAssistantView):
                 status_code=400,
             )
 
-        # Get and validate file extension
-        filename = file_field.filename
-        ext = os.path.splitext(filename)[1].lower()
-
-        if ext not in ALLOWED_EXTENSIONS:
-            return self.json(
-                {
-                    "error": f"Invalid file extension. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
-                },
-                status_code=400,
-            )
-
-        # Read file with size limit
-        content = file_field.file.read(MAX_FILE_SIZE + 1)
-        if len(content) > MAX_FILE_SIZE:
-            return self.json(
-                {
-                    "error": f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB."
-                },
-                status_code=400,
-            )
-
         # Save file using executor to avoid blocking
-        uploads_dir = self.hass.data[DOMAIN]["uploads_dir"]
+        ext, content, info = upload
+        config = self.hass.data[DOMAIN]
         new_filename = f"{file_type}{ext}"
-        file_path = os.path.join(uploads_dir, new_filename)
+        file_path = os.path.join(config["uploads_dir"], new_filename)
 
-        await self.hass.async_add_executor_job(
-            partial(self._write_file, file_path, content)
+        await _async_io_write(
+            self.hass, file_path, self._write_file, file_path, content
         )
 
         # Return the URL path
         url_path = f"/local/ha_rebrand/{new_filename}"
+        _async_record_image_size(config, url_path, info)
+        _async_config_changed(self.hass)
+        _async_assets_replaced(self.hass)
+        await _async_write_config_json(self.hass)
 
         return self.json(
             {
@@ -761,280 +1543,286 @@ class RebrandUploadView(HomeAssistantView):
             f.write(content)
 
 
-class RebrandAuthorizeView(HomeAssistantView):
-    """Custom authorize view that serves modified authorize.html with custom branding."""
+class RebrandBatchUploadView(HomeAssistantView):
+    """View to upload several branding images in one request.
 
-    url = "/auth/authorize"
-    name = "api:ha_rebrand:authorize"
-    requires_auth = False  # Must be accessible without auth
+    Each multipart part is named after its file type (``logo``, ``logo_dark``,
+    ``favicon``); an optional ``profile`` part selects the profile to update.
+    Every part is validated before anything is written, the files are written
+    concurrently and the config is updated and persisted once.
+    """
+
+    url = "/api/ha_rebrand/upload_batch"
+    name = "api:ha_rebrand:upload_batch"
+    requires_auth = True
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the view."""
         self.hass = hass
-        self._authorize_html = None
 
-    def _read_authorize_html(self) -> str | None:
-        """Read authorize.html from hass_frontend package."""
-        try:
-            import hass_frontend
-
-            frontend_path = Path(hass_frontend.__file__).parent
-            authorize_path = frontend_path / "authorize.html"
-            if authorize_path.exists():
-                return authorize_path.read_text("utf-8")
-        except ImportError:
-            _LOGGER.warning("Could not import hass_frontend package")
-        except OSError as e:
-            _LOGGER.warning("Error reading authorize.html: %s", e)
-        return None
+    async def post(self, request: web.Request) -> web.Response:
+        """Handle a batch upload with security checks."""
+        if not request["hass_user"].is_admin:
+            return self.json({"error": "Admin privileges required"}, status_code=403)
 
-    async def get(self, request: web.Request) -> web.Response:
-        """Serve modified authorize.html with custom logo."""
-        # Read original HTML (cache it for performance)
-        if self._authorize_html is None:
-            self._authorize_html = await self.hass.async_add_executor_job(
-                self._read_authorize_html
-            )
+        profile = DEFAULT_PROFILE
+        files: dict[str, tuple[str, bytes, ImageInfo]] = {}
+        reader = await request.multipart()
+        async for part in reader:
+            if part.name == "profile":
+                try:
+                    profile = cv.slug(await part.text())
+                except vol.Invalid:
+                    return self.json({"error": "Invalid profile"}, status_code=400)
+                continue
+
+            if part.name not in ALLOWED_FILE_TYPES or part.name in files:
+                return self.json(
+                    {
+                        "error": f"Invalid file type. Allowed: {', '.join(ALLOWED_FILE_TYPES)}"
+                    },
+                    status_code=400,
+                )
+
+            ext = os.path.splitext(part.filename or "")[1].lower()
+            if ext not in ALLOWED_EXTENSIONS:
+                return self.json(
+                    {
+                        "error": f"Invalid file extension. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
+                    },
+                    status_code=400,
+                )
+
+            try:
+                content, info = await read_image(part, ext)
+            except ImageError as err:
+                return self.json({"error": f"{part.name}: {err}"}, status_code=400)
+            files[part.name] = (ext, content, info)
+
+        if not files:
+            return self.json({"error": "No file provided"}, status_code=400)
 
-        if self._authorize_html is None:
-            _LOGGER.error(
-                "Could not read authorize.html from hass_frontend - "
-                "serving minimal fallback page"
-            )
-            # Return a simple redirect page that won't be cached by proxies
-            # Avoids 404 which can cause caching issues with Cloudflare/Nginx
-            return web.Response(
-                text=(
-                    '<html><head><meta http-equiv="refresh" content="0;url=/">'
-                    "</head><body>Redirecting to login...</body></html>"
-                ),
-                content_type="text/html",
-                status=200,
-                headers={
-                    "Cache-Control": "no-cache, no-store, must-revalidate",
-                    "Pragma": "no-cache",
-                    "Expires": "0",
-                },
+        config = self.hass.data[DOMAIN]
+        filenames = {
+            file_type: _upload_filename(profile, file_type, ext)
+            for file_type, (ext, _, _) in files.items()
+        }
+        file_paths = {
+            file_type: os.path.join(config["uploads_dir"], filename)
+            for file_type, filename in filenames.items()
+        }
+        await asyncio.gather(
+            *(
+                _async_io_write(
+                    self.hass,
+                    file_paths[file_type],
+                    RebrandUploadView._write_file,
+                    file_paths[file_type],
+                    content,
+                )
+                for file_type, (_, content, _) in files.items()
             )
+        )
+
+        # Apply all new paths in one update and a single config.json write
+        paths = _async_apply_uploads(
+            self.hass,
+            profile,
+            {
+                file_type: (filenames[file_type], info)
+                for file_type, (_, _, info) in files.items()
+            },
+        )
+        await _async_write_config_json(self.hass)
+
+        return self.json({"success": True, "paths": paths})
+
+
+class RebrandExportView(HomeAssistantView):
+    """View to download the branding config and its assets as a bundle."""
 
-        html_content = self._authorize_html
+    url = "/api/ha_rebrand/export"
+    name = "api:ha_rebrand:export"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request) -> web.StreamResponse:
+        """Stream a gzipped tar of config.json and the referenced assets."""
+        if not request["hass_user"].is_admin:
+            return self.json({"error": "Admin privileges required"}, status_code=403)
 
-        # Get custom branding config
         config = self.hass.data.get(DOMAIN, {})
-        logo_url = config.get(CONF_LOGO)
-        system_name = config.get(CONF_SYSTEM_NAME) or DEFAULT_SYSTEM_NAME
-        browser_tab_title = config.get(CONF_BROWSER_TAB_TITLE) or system_name
-
-        # Only modify if we have a custom logo
-        if logo_url:
-            # Replace the logo image src (use html_escape to prevent XSS)
-            html_content = html_content.replace(
-                'src="/static/icons/favicon-192x192.png"',
-                f'src="{html_escape(logo_url)}"',
-            )
+        if "uploads_dir" not in config:
+            return self.json({"error": "HA Rebrand is not set up"}, status_code=404)
 
-        # Replace alt text (use html_escape to prevent XSS)
-        html_content = html_content.replace(
-            'alt="Home Assistant"', f'alt="{html_escape(system_name)}"'
+        response = web.StreamResponse(
+            headers={
+                hdrs.CONTENT_TYPE: "application/gzip",
+                hdrs.CONTENT_DISPOSITION: 'attachment; filename="ha_rebrand.tar.gz"',
+                hdrs.CACHE_CONTROL: "no-store",
+            }
         )
+        await response.prepare(request)
+        writer = AsyncStreamWriter(self.hass.loop, response.write)
+        # Streaming runs as long as the client takes to download, so it stays
+        # on the shared executor rather than occupying a rebrand I/O worker.
+        # A client that goes away stops the job at its next write.
+        try:
+            await self.hass.async_add_executor_job(
+                write_bundle, writer, _config_json(config), config["uploads_dir"]
+            )
+            await response.write_eof()
+        except ConnectionResetError:
+            writer.abort()
+            _LOGGER.debug("HA Rebrand: Export stopped, the client disconnected")
+        except asyncio.CancelledError:
+            writer.abort()
+            raise
+        return response
 
-        # Replace page title (use html_escape to prevent XSS)
-        html_content = html_content.replace(
-            "<title>Home Assistant</title>",
-            f"<title>{html_escape(browser_tab_title)}</title>",
-        )
 
-        # Inject favicon link tags for login page
-        favicon_url = config.get(CONF_FAVICON)
-        if favicon_url:
-            # Replace existing favicon.ico reference from _header.html.template
-            html_content = html_content.replace(
-                'href="/static/icons/favicon.ico"',
-                f'href="{html_escape(favicon_url)}"',
+class RebrandImportView(HomeAssistantView):
+    """View to restore a bundle created by the export view.
+
+    The request body is the raw bundle. It is extracted into a staging
+    directory while it streams in and only applied once fully validated.
+    """
+
+    url = "/api/ha_rebrand/import"
+    name = "api:ha_rebrand:import"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    async def post(self, request: web.Request) -> web.Response:
+        """Import a bundle and apply its config."""
+        if not request["hass_user"].is_admin:
+            return self.json({"error": "Admin privileges required"}, status_code=403)
+
+        uploads_dir = self.hass.data.get(DOMAIN, {}).get("uploads_dir")
+        if uploads_dir is None:
+            return self.json({"error": "HA Rebrand is not set up"}, status_code=404)
+        if (request.content_length or 0) > MAX_BUNDLE_SIZE:
+            return self.json(
+                {
+                    "error": f"Bundle too large. Maximum size is {MAX_BUNDLE_SIZE // (1024 * 1024)}MB."
+                },
+                status_code=413,
             )
-            # Also replace any favicon-192x192.png references
-            html_content = html_content.replace(
-                'href="/static/icons/favicon-192x192.png"',
-                f'href="{html_escape(favicon_url)}"',
+
+        # Staged in private storage, not in the served uploads directory;
+        # both live in the config directory so the final moves are renames
+        staging_dir = await _async_io(
+            self.hass, create_import_staging, self.hass.config.path(STORAGE_DIR)
+        )
+        try:
+            # Extraction is paced by the upload, see RebrandExportView
+            reader = AsyncStreamReader(self.hass.loop, request.content.read)
+            config = await self.hass.async_add_executor_job(
+                extract_bundle, reader, staging_dir
+            )
+            config, _ = _migrate_config(config)
+            try:
+                config = CONFIG_JSON_SCHEMA(config)
+            except vol.Invalid as err:
+                raise BundleError(f"Invalid config.json: {err}") from err
+            assets = await _async_io_write(
+                self.hass, uploads_dir, commit_bundle, staging_dir, uploads_dir
+            )
+        except BundleError as err:
+            return self.json({"error": str(err)}, status_code=400)
+        finally:
+            await _async_io(
+                self.hass, partial(shutil.rmtree, staging_dir, ignore_errors=True)
             )
 
-        # Add additional favicon meta tags before </head> for better browser support
-        favicon_to_use = favicon_url or logo_url
-        if favicon_to_use:
-            favicon_meta = f'''<link rel="icon" type="image/png" sizes="192x192" href="{html_escape(favicon_to_use)}" />
-<link rel="icon" type="image/png" sizes="32x32" href="{html_escape(favicon_to_use)}" />
-<link rel="apple-touch-icon" href="{html_escape(logo_url or favicon_to_use)}" />'''
-            html_content = html_content.replace("</head>", favicon_meta + "\n</head>")
-
-        # Inject primary color CSS for login page styling
-        # Validate color to prevent CSS injection attacks
-        primary_color = _validate_color(config.get(CONF_PRIMARY_COLOR))
-        if primary_color:
-            color_style = f"""<style>
-:root, html {{
-  --primary-color: {primary_color} !important;
-  --light-primary-color: {primary_color}40 !important;
-  --dark-primary-color: {primary_color} !important;
-  --mdc-theme-primary: {primary_color} !important;
-  --ha-color-fill-primary-loud-resting: {primary_color} !important;
-  --ha-color-fill-primary-loud-active: {primary_color} !important;
-  --ha-color-fill-primary-loud-hover: {primary_color} !important;
-  --ha-color-fill-primary-normal-resting: {primary_color} !important;
-  --ha-color-fill-primary-normal-active: {primary_color} !important;
-  --ha-color-fill-primary-normal-hover: {primary_color} !important;
-}}
-ha-authorize, ha-auth-flow, ha-local-auth-flow, ha-pick-auth-provider {{
-  --primary-color: {primary_color} !important;
-  --mdc-theme-primary: {primary_color} !important;
-  --mdc-theme-on-primary: #ffffff !important;
-  --ha-color-fill-primary-loud-resting: {primary_color} !important;
-  --ha-color-fill-primary-loud-active: {primary_color} !important;
-  --ha-color-fill-primary-loud-hover: {primary_color} !important;
-}}
-mwc-button, ha-button {{
-  --mdc-theme-primary: {primary_color} !important;
-  --mdc-theme-on-primary: #ffffff !important;
-  --ha-color-fill-primary-loud-resting: {primary_color} !important;
-}}
-</style>"""
-            html_content = html_content.replace("</head>", color_style + "</head>")
-
-            # Inject tsParticles color override script for login page particles animation
-            # Uses dual-layer interception: pre-load patch + post-load update fallback
-            particles_script = f"""<script>
-(function(){{
-  var customColor = "{_escape_js_string(primary_color)}";
-  var patched = false;
-
-  function patchLoad() {{
-    if (typeof window.tsParticles === "undefined" || patched) return false;
-    patched = true;
-
-    var origLoad = window.tsParticles.load.bind(window.tsParticles);
-    window.tsParticles.load = function(params) {{
-      if (params && params.options && params.options.particles) {{
-        params.options.particles.color = {{ value: customColor }};
-        if (params.options.particles.links) {{
-          params.options.particles.links.color = {{ value: customColor }};
-        }}
-      }}
-      return origLoad(params);
-    }};
-    return true;
-  }}
-
-  function updateExisting() {{
-    if (typeof window.tsParticles === "undefined") return;
-    try {{
-      var containers = window.tsParticles.dom();
-      for (var i = 0; i < containers.length; i++) {{
-        var c = containers[i];
-        if (c && c.options && c.options.particles) {{
-          c.options.particles.color.value = customColor;
-          if (c.options.particles.links) {{
-            c.options.particles.links.color.value = customColor;
-          }}
-          c.refresh();
-        }}
-      }}
-    }} catch(e) {{}}
-  }}
-
-  // Try immediate patch
-  if (!patchLoad()) {{
-    // Poll for tsParticles availability
-    var iv = setInterval(function() {{
-      if (patchLoad()) {{
-        clearInterval(iv);
-        updateExisting();
-      }}
-    }}, 50);
-    setTimeout(function() {{ clearInterval(iv); }}, 10000);
-  }}
-
-  // Fallback: observe for particles container (wait for body to exist)
-  function setupObserver() {{
-    if (!document.body) {{
-      setTimeout(setupObserver, 10);
-      return;
-    }}
-    var obs = new MutationObserver(function() {{
-      if (document.getElementById("particles") || document.querySelector("canvas.tsparticles-canvas-el")) {{
-        setTimeout(updateExisting, 200);
-      }}
-    }});
-    obs.observe(document.body, {{ childList: true, subtree: true }});
-    setTimeout(function() {{ obs.disconnect(); }}, 15000);
-  }}
-  setupObserver();
-}})();
-</script>"""
-            html_content = html_content.replace("</head>", particles_script + "</head>")
+        self.hass.data[DOMAIN] = _build_config(config, uploads_dir)
+        _async_config_changed(self.hass)
+        _async_assets_replaced(self.hass)
+        await _async_write_config_json(self.hass)
+        _LOGGER.info("HA Rebrand: Imported bundle with %d assets", len(assets))
 
-        _LOGGER.debug(
-            "Serving custom authorize page with logo: %s, primary_color: %s",
-            logo_url,
-            primary_color,
-        )
+        return self.json({"success": True, "assets": assets})
+
+
+class RebrandAssetView(HomeAssistantView):
+    """Serve the scripts and stylesheets referenced by the branded pages.
 
+    Requested by their content-hashed name they are immutable; the plain
+    name is served too, revalidated on every use.
+    """
+
+    url = ASSETS_URL + "/{filename}"
+    name = "ha_rebrand:assets"
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request, filename: str) -> web.Response:
+        """Serve a static asset from memory."""
+        assets: StaticAssets | None = self.hass.data.get(DATA_STATIC_ASSETS)
+        if assets is None or (found := assets.get(filename)) is None:
+            return web.Response(status=404)
+        asset, hashed = found
         return web.Response(
-            text=html_content,
-            content_type="text/html",
+            body=asset.body,
+            content_type=asset.content_type,
             charset="utf-8",
             headers={
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Expires": "0",
+                hdrs.CACHE_CONTROL: (
+                    "public, max-age=31536000, immutable" if hashed else "no-cache"
+                ),
                 "X-Content-Type-Options": "nosniff",
             },
         )
 
 
-class RebrandOnboardingView(HomeAssistantView):
-    """Custom onboarding view that serves modified onboarding.html with custom branding."""
+class RebrandPageView:
+    """Base view that serves a branded copy of a hass_frontend page.
 
-    url = "/onboarding"
-    name = "api:ha_rebrand:onboarding"
-    requires_auth = False  # Must be accessible without auth
+    Served through the route override table without auth, like the static
+    page it replaces.
+    """
+
+    url: str
+    page: BrandedPage
+    template_name: str
+    fallback_message: str = "Redirecting..."
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the view."""
         self.hass = hass
-        self._onboarding_html = None
-
-    def _read_onboarding_html(self) -> str | None:
-        """Read onboarding.html from hass_frontend package."""
-        try:
-            import hass_frontend
-
-            frontend_path = Path(hass_frontend.__file__).parent
-            onboarding_path = frontend_path / "onboarding.html"
-            if onboarding_path.exists():
-                return onboarding_path.read_text("utf-8")
-        except ImportError:
-            _LOGGER.warning("Could not import hass_frontend package")
-        except OSError as e:
-            _LOGGER.warning("Error reading onboarding.html: %s", e)
-        return None
 
     async def get(self, request: web.Request) -> web.Response:
-        """Serve modified onboarding.html with custom branding."""
-        # Read original HTML (cache it for performance)
-        if self._onboarding_html is None:
-            self._onboarding_html = await self.hass.async_add_executor_job(
-                self._read_onboarding_html
-            )
+        """Serve the branded page."""
+        if (limited := _async_rate_limit(self.hass, request)) is not None:
+            return limited
+
+        # Templates are preloaded during setup; if that failed they are
+        # retried at most once per revalidation interval
+        templates: FrontendTemplates | None = self.hass.data.get(DATA_TEMPLATES)
+        template = (
+            await templates.async_get_or_load(self.template_name) if templates else None
+        )
 
-        if self._onboarding_html is None:
+        if template is None:
             _LOGGER.error(
-                "Could not read onboarding.html from hass_frontend - "
-                "serving minimal fallback page"
+                "Could not read %s from hass_frontend - serving minimal fallback page",
+                self.template_name,
             )
             # Return a simple redirect page that won't be cached by proxies
+            # Avoids 404 which can cause caching issues with Cloudflare/Nginx
             return web.Response(
                 text=(
                     '<html><head><meta http-equiv="refresh" content="0;url=/">'
-                    "</head><body>Redirecting...</body></html>"
+                    f"</head><body>{self.fallback_message}</body></html>"
                 ),
                 content_type="text/html",
                 status=200,
@@ -1045,168 +1833,123 @@ class RebrandOnboardingView(HomeAssistantView):
                 },
             )
 
-        html_content = self._onboarding_html
-
-        # Get custom branding config
-        config = self.hass.data.get(DOMAIN, {})
-        logo_url = config.get(CONF_LOGO)
-        system_name = config.get(CONF_SYSTEM_NAME) or DEFAULT_SYSTEM_NAME
-        browser_tab_title = config.get(CONF_BROWSER_TAB_TITLE) or system_name
-
-        # Replace the logo image src if we have a custom logo
-        if logo_url:
-            html_content = html_content.replace(
-                'src="/static/icons/favicon-192x192.png"',
-                f'src="{html_escape(logo_url)}"',
+        profile, locale, config = _async_resolve_branding(self.hass, request)
+        color_scheme = _color_scheme_hint(request)
+        cache: ArtifactCache = self.hass.data[DATA_RENDER_CACHE]
+        revision = templates.revision if templates else 0
+        key = (profile, self.page.name, locale, color_scheme, revision)
+        if (body := cache.get(key)) is None:
+            page_config = localize(config, locale)
+            body = cache.put(
+                key,
+                self.page.render(
+                    template, page_config, color_scheme, _async_asset_urls(self.hass)
+                ).encode(),
+            )
+            _LOGGER.debug(
+                "Rendered custom %s page for profile %s (locale %s) with logo: %s, "
+                "primary_color: %s",
+                self.page.name,
+                profile,
+                locale,
+                config.get(CONF_LOGO),
+                config.get(CONF_PRIMARY_COLOR),
             )
 
-        # Replace alt text
-        html_content = html_content.replace(
-            'alt="Home Assistant"', f'alt="{html_escape(system_name)}"'
+        headers = {
+            "Cache-Control": "no-cache, no-store, must-revalidate",
+            "Pragma": "no-cache",
+            "Expires": "0",
+            "X-Content-Type-Options": "nosniff",
+            # Ask for the color scheme hint on later requests (the index too)
+            "Accept-CH": HEADER_COLOR_SCHEME,
+            "Vary": f"Accept-Language, {HEADER_COLOR_SCHEME}",
+        }
+        # Let the browser fetch the logo and favicon while the page renders
+        if link := _async_preload_header(self.hass, request, self.page):
+            headers[hdrs.LINK] = link
+        return web.Response(
+            body=body, content_type="text/html", charset="utf-8", headers=headers
         )
 
-        # Replace page title
-        html_content = html_content.replace(
-            "<title>Home Assistant</title>",
-            f"<title>{html_escape(browser_tab_title)}</title>",
-        )
 
-        # Inject favicon link tags
-        favicon_url = config.get(CONF_FAVICON)
-        if favicon_url:
-            html_content = html_content.replace(
-                'href="/static/icons/favicon.ico"',
-                f'href="{html_escape(favicon_url)}"',
-            )
-            html_content = html_content.replace(
-                'href="/static/icons/favicon-192x192.png"',
-                f'href="{html_escape(favicon_url)}"',
-            )
+class RebrandAuthorizeView(RebrandPageView):
+    """Custom authorize view that serves modified authorize.html with custom branding."""
 
-        # Add additional favicon meta tags before </head>
-        favicon_to_use = favicon_url or logo_url
-        if favicon_to_use:
-            favicon_meta = f'''<link rel="icon" type="image/png" sizes="192x192" href="{html_escape(favicon_to_use)}" />
-<link rel="icon" type="image/png" sizes="32x32" href="{html_escape(favicon_to_use)}" />
-<link rel="apple-touch-icon" href="{html_escape(logo_url or favicon_to_use)}" />'''
-            html_content = html_content.replace("</head>", favicon_meta + "\n</head>")
-
-        # Inject primary color CSS for onboarding page styling
-        primary_color = _validate_color(config.get(CONF_PRIMARY_COLOR))
-        if primary_color:
-            color_style = f"""<style>
-:root, html {{
-  --primary-color: {primary_color} !important;
-  --light-primary-color: {primary_color}40 !important;
-  --dark-primary-color: {primary_color} !important;
-  --mdc-theme-primary: {primary_color} !important;
-  --ha-color-fill-primary-loud-resting: {primary_color} !important;
-  --ha-color-fill-primary-loud-active: {primary_color} !important;
-  --ha-color-fill-primary-loud-hover: {primary_color} !important;
-}}
-ha-onboarding {{
-  --primary-color: {primary_color} !important;
-  --mdc-theme-primary: {primary_color} !important;
-  --mdc-theme-on-primary: #ffffff !important;
-}}
-mwc-button, ha-button {{
-  --mdc-theme-primary: {primary_color} !important;
-  --mdc-theme-on-primary: #ffffff !important;
-  --ha-color-fill-primary-loud-resting: {primary_color} !important;
-}}
-</style>"""
-            html_content = html_content.replace("</head>", color_style + "</head>")
-
-            # Inject tsParticles color override script for onboarding page particles animation
-            # Uses dual-layer interception: pre-load patch + post-load update fallback
-            particles_script = f"""<script>
-(function(){{
-  var customColor = "{_escape_js_string(primary_color)}";
-  var patched = false;
-
-  function patchLoad() {{
-    if (typeof window.tsParticles === "undefined" || patched) return false;
-    patched = true;
-
-    var origLoad = window.tsParticles.load.bind(window.tsParticles);
-    window.tsParticles.load = function(params) {{
-      if (params && params.options && params.options.particles) {{
-        params.options.particles.color = {{ value: customColor }};
-        if (params.options.particles.links) {{
-          params.options.particles.links.color = {{ value: customColor }};
-        }}
-      }}
-      return origLoad(params);
-    }};
-    return true;
-  }}
-
-  function updateExisting() {{
-    if (typeof window.tsParticles === "undefined") return;
-    try {{
-      var containers = window.tsParticles.dom();
-      for (var i = 0; i < containers.length; i++) {{
-        var c = containers[i];
-        if (c && c.options && c.options.particles) {{
-          c.options.particles.color.value = customColor;
-          if (c.options.particles.links) {{
-            c.options.particles.links.color.value = customColor;
-          }}
-          c.refresh();
-        }}
-      }}
-    }} catch(e) {{}}
-  }}
-
-  // Try immediate patch
-  if (!patchLoad()) {{
-    // Poll for tsParticles availability
-    var iv = setInterval(function() {{
-      if (patchLoad()) {{
-        clearInterval(iv);
-        updateExisting();
-      }}
-    }}, 50);
-    setTimeout(function() {{ clearInterval(iv); }}, 10000);
-  }}
-
-  // Fallback: observe for particles container (wait for body to exist)
-  function setupObserver() {{
-    if (!document.body) {{
-      setTimeout(setupObserver, 10);
-      return;
-    }}
-    var obs = new MutationObserver(function() {{
-      if (document.getElementById("particles") || document.querySelector("canvas.tsparticles-canvas-el")) {{
-        setTimeout(updateExisting, 200);
-      }}
-    }});
-    obs.observe(document.body, {{ childList: true, subtree: true }});
-    setTimeout(function() {{ obs.disconnect(); }}, 15000);
-  }}
-  setupObserver();
-}})();
-</script>"""
-            html_content = html_content.replace("</head>", particles_script + "</head>")
+    url = "/auth/authorize"
+    page = AUTHORIZE_PAGE
+    template_name = "authorize.html"
+    fallback_message = "Redirecting to login..."
 
-        _LOGGER.debug(
-            "Serving custom onboarding page with logo: %s, primary_color: %s",
-            logo_url,
-            primary_color,
-        )
 
+class RebrandOnboardingView(RebrandPageView):
+    """Custom onboarding view that serves modified onboarding.html with custom branding."""
+
+    url = "/onboarding"
+    page = ONBOARDING_PAGE
+    template_name = "onboarding.html"
+
+
+class RebrandManifestView:
+    """Serve the web app manifest with the profile's name and icons.
+
+    Served through the route override table in place of the frontend's
+    manifest. The serialized manifest and its ETag are cached until the
+    branding or the frontend's theme color changes, so repeated install and
+    update checks cost a lookup.
+    """
+
+    url = "/manifest.json"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Serve the branded manifest, or 304 if the client has it."""
+        if (limited := _async_rate_limit(self.hass, request)) is not None:
+            return limited
+
+        profile, locale, config = _async_resolve_branding(self.hass, request)
+        # The frontend updates its manifest's theme color with the theme
+        base = getattr(getattr(frontend, "MANIFEST_JSON", None), "manifest", {})
+        cache: ArtifactCache = self.hass.data[DATA_RENDER_CACHE]
+        key = (profile, ARTIFACT_MANIFEST, locale, base.get("theme_color"))
+        etag_key = (*key, "etag")
+        if (body := cache.get(key)) is None:
+            body = cache.put(
+                key, await self._async_render(base, localize(config, locale))
+            )
+        if (etag := cache.get(etag_key)) is None:
+            etag = cache.put(etag_key, hashlib.md5(body).hexdigest())
+        etag = str(etag)
+
+        headers = {
+            hdrs.CACHE_CONTROL: "no-cache",
+            hdrs.ETAG: f'"{etag}"',
+            hdrs.VARY: "Accept-Language",
+        }
+        if _etag_matches(request, etag):
+            return web.Response(status=304, headers=headers)
         return web.Response(
-            text=html_content,
-            content_type="text/html",
-            charset="utf-8",
-            headers={
-                "Cache-Control": "no-cache, no-store, must-revalidate",
-                "Pragma": "no-cache",
-                "Expires": "0",
-                "X-Content-Type-Options": "nosniff",
-            },
+            body=body, content_type="application/manifest+json", headers=headers
         )
 
+    async def _async_render(
+        self, base: Mapping[str, Any], config: Mapping[str, Any]
+    ) -> bytes:
+        """Build a profile's manifest, generating its icons if needed."""
+        icons = None
+        if source := icon_source(config):
+            icons = await _async_io(
+                self.hass,
+                generate_icons,
+                self.hass.data[DOMAIN]["uploads_dir"],
+                source,
+                icon_background(config),
+            )
+        return json_bytes(build_manifest(base, config, icons or fallback_icons(config)))
+
 
 class RebrandSaveConfigView(HomeAssistantView):
     """View to save configuration to file."""
@@ -1245,8 +1988,8 @@ class RebrandSaveConfigView(HomeAssistantView):
 
         # Write to file using executor to avoid blocking
         config_path = self.hass.config.path("ha_rebrand.yaml")
-        await self.hass.async_add_executor_job(
-            partial(self._write_yaml, config_path, yaml_config)
+        await _async_io_write(
+            self.hass, config_path, self._write_yaml, config_path, yaml_config
         )
 
         return self.json(
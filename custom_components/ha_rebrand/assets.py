@@ -0,0 +1,81 @@
+"""Content-hashed static assets referenced by the branded pages."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass
+
+ASSETS_URL = "/ha_rebrand_assets"
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "static")
+
+AUTH_SCRIPT = "ha-rebrand-auth.js"
+AUTH_STYLE = "ha-rebrand-auth.css"
+LAUNCH_SCRIPT = "ha-rebrand-launch.js"
+LAUNCH_STYLE = "ha-rebrand-launch.css"
+LOGO_STYLE = "ha-rebrand-logo.css"
+OHF_STYLE = "ha-rebrand-ohf.css"
+
+_CONTENT_TYPES = {
+    ".js": "text/javascript",
+    ".css": "text/css",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class StaticAsset:
+    """A static file kept in memory with its content hash."""
+
+    name: str
+    body: bytes
+    content_type: str
+    digest: str
+
+    @property
+    def hashed_name(self) -> str:
+        """Return the filename with the content hash before the extension."""
+        stem, ext = os.path.splitext(self.name)
+        return f"{stem}.{self.digest}{ext}"
+
+
+class StaticAssets:
+    """The branded pages' scripts and stylesheets.
+
+    Each asset is served under its content-hashed name, which never changes
+    meaning and can be cached forever, and under its plain name.
+    """
+
+    def __init__(self, assets: list[StaticAsset]) -> None:
+        """Index the assets by plain and hashed name."""
+        self.urls = {
+            asset.name: f"{ASSETS_URL}/{asset.hashed_name}" for asset in assets
+        }
+        self._by_name: dict[str, tuple[StaticAsset, bool]] = {}
+        for asset in assets:
+            self._by_name[asset.name] = (asset, False)
+            self._by_name[asset.hashed_name] = (asset, True)
+
+    def get(self, filename: str) -> tuple[StaticAsset, bool] | None:
+        """Return an asset and whether it was requested by its hashed name."""
+        return self._by_name.get(filename)
+
+
+def load_static_assets(directory: str = ASSETS_DIR) -> StaticAssets:
+    """Read every asset in directory."""
+    assets = []
+    for name in sorted(os.listdir(directory)):
+        if (content_type := _CONTENT_TYPES.get(os.path.splitext(name)[1])) is None:
+            continue
+        with open(os.path.join(directory, name), "rb") as file:
+            body = file.read()
+        assets.append(
+            StaticAsset(name, body, content_type, hashlib.md5(body).hexdigest()[:8])
+        )
+    return StaticAssets(assets)
+
+
+def asset_url(urls: dict[str, str] | None, name: str) -> str:
+    """Return an asset's hashed URL, or its plain URL if not loaded."""
+    if urls and (url := urls.get(name)):
+        return url
+    return f"{ASSETS_URL}/{name}"
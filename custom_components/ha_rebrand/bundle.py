@@ -0,0 +1,307 @@
+"""Branding bundle export and import for HA Rebrand.
+
+A bundle is a gzipped tar stream holding ``config.json`` and every asset the
+config references under ``/local/ha_rebrand/`` as ``assets/<filename>``.
+Both directions run in the executor against file-like adapters over the
+aiohttp streams, so an archive is never held in memory. Imports are staged
+outside the publicly served uploads directory and applied all at once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import io
+import json
+import logging
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from typing import Any
+
+from .const import (
+    ALLOWED_EXTENSIONS,
+    CONF_FAVICON,
+    CONF_IMAGE_SIZES,
+    CONF_LOGO,
+    CONF_LOGO_DARK,
+    CONF_PROFILES,
+    MAX_BUNDLE_FILES,
+    MAX_BUNDLE_SIZE,
+    MAX_FILE_SIZE,
+)
+from .image import ImageError, validate_image
+
+_LOGGER = logging.getLogger(__name__)
+
+BUNDLE_CONFIG = "config.json"
+BUNDLE_ASSETS = "assets/"
+UPLOADS_URL = "/local/ha_rebrand/"
+
+# Import staging directories, created under a private directory
+IMPORT_PREFIX = "ha_rebrand_import-"
+
+_ASSET_KEYS = (CONF_LOGO, CONF_LOGO_DARK, CONF_FAVICON)
+_MAX_CONFIG_SIZE = 1024 * 1024
+_PREVIOUS_DIR = ".previous"
+
+
+class BundleError(Exception):
+    """Raised when a bundle cannot be imported."""
+
+
+class AsyncStreamWriter(io.RawIOBase):
+    """Blocking writer that forwards data to an async write coroutine.
+
+    Used from an executor thread; every write waits for the event loop to
+    accept the chunk, which gives natural backpressure. Once aborted, the
+    pending and every later write raise ConnectionResetError.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        write: Callable[[bytes], Awaitable[None]],
+    ) -> None:
+        """Initialize the writer."""
+        super().__init__()
+        self._loop = loop
+        self._write = write
+        self._aborted = False
+        self._pending: concurrent.futures.Future[None] | None = None
+
+    def abort(self) -> None:
+        """Stop writing because the client went away; called from the loop."""
+        self._aborted = True
+        if (pending := self._pending) is not None:
+            pending.cancel()
+
+    def writable(self) -> bool:
+        """Return True, this stream is writable."""
+        return True
+
+    def write(self, data: Any) -> int:
+        """Write data to the async stream."""
+        if self._aborted:
+            raise ConnectionResetError("Client disconnected")
+        chunk = bytes(data)
+        self._pending = asyncio.run_coroutine_threadsafe(self._write(chunk), self._loop)
+        try:
+            self._pending.result()
+        except concurrent.futures.CancelledError as err:
+            raise ConnectionResetError("Client disconnected") from err
+        return len(chunk)
+
+
+class AsyncStreamReader(io.RawIOBase):
+    """Blocking reader over an async read coroutine with a total size limit."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        read: Callable[[int], Awaitable[bytes]],
+        limit: int = MAX_BUNDLE_SIZE,
+    ) -> None:
+        """Initialize the reader."""
+        super().__init__()
+        self._loop = loop
+        self._read = read
+        self._limit = limit
+        self._total = 0
+
+    def readable(self) -> bool:
+        """Return True, this stream is readable."""
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Read from the async stream into buffer."""
+        data = asyncio.run_coroutine_threadsafe(
+            self._read(len(buffer)), self._loop
+        ).result()
+        self._total += len(data)
+        if self._total > self._limit:
+            raise BundleError(
+                f"Bundle too large. Maximum size is {self._limit // (1024 * 1024)}MB."
+            )
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _iter_asset_urls(config: Mapping[str, Any]) -> Iterator[str]:
+    """Yield every asset URL referenced by the config and its profiles."""
+    for key in _ASSET_KEYS:
+        if isinstance(value := config.get(key), str):
+            yield value
+    profiles = config.get(CONF_PROFILES)
+    if isinstance(profiles, Mapping):
+        for profile in profiles.values():
+            if isinstance(profile, Mapping):
+                yield from _iter_asset_urls(
+                    {key: profile.get(key) for key in _ASSET_KEYS}
+                )
+
+
+def referenced_assets(config: Mapping[str, Any]) -> set[str]:
+    """Return filenames of uploaded assets referenced by the config."""
+    names = set()
+    for url in _iter_asset_urls(config):
+        path = url.split("?", 1)[0]
+        if path.startswith(UPLOADS_URL):
+            names.add(path[len(UPLOADS_URL) :])
+    return names
+
+
+def _valid_asset_name(name: str) -> bool:
+    """Return True if name is a plain, allowed asset filename."""
+    return (
+        bool(name)
+        and name == os.path.basename(name)
+        and not name.startswith(".")
+        and os.path.splitext(name)[1].lower() in ALLOWED_EXTENSIONS
+    )
+
+
+def write_bundle(
+    fileobj: io.RawIOBase, config_json: dict[str, Any], uploads_dir: str
+) -> None:
+    """Stream a bundle of config_json and its referenced assets to fileobj."""
+    with tarfile.open(fileobj=fileobj, mode="w|gz") as tar:
+        data = json.dumps(config_json, ensure_ascii=False, indent=2).encode()
+        info = tarfile.TarInfo(BUNDLE_CONFIG)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        tar.addfile(info, io.BytesIO(data))
+
+        for name in sorted(referenced_assets(config_json)):
+            path = os.path.join(uploads_dir, name)
+            if not _valid_asset_name(name) or not os.path.isfile(path):
+                _LOGGER.warning("HA Rebrand: Skipping missing asset %s in export", name)
+                continue
+            tar.add(path, arcname=BUNDLE_ASSETS + name, recursive=False)
+
+
+def extract_bundle(fileobj: io.RawIOBase, staging_dir: str) -> dict[str, Any]:
+    """Extract a bundle into staging_dir and return its validated config.
+
+    Only ``config.json`` and allowed asset files are accepted; anything else
+    (links, directories, nested paths) rejects the whole bundle, as does an
+    asset that isn't an image of its extension's format. The image sizes in
+    the returned config are the ones read from the assets themselves.
+    """
+    config: dict[str, Any] | None = None
+    image_sizes: dict[str, list[int]] = {}
+    count = 0
+    try:
+        with tarfile.open(fileobj=fileobj, mode="r|gz") as tar:
+            for member in tar:
+                count += 1
+                if count > MAX_BUNDLE_FILES:
+                    raise BundleError("Bundle contains too many files")
+                if not member.isfile():
+                    raise BundleError(f"Unexpected bundle entry: {member.name}")
+                source = tar.extractfile(member)
+                if source is None:
+                    raise BundleError(f"Unreadable bundle entry: {member.name}")
+
+                if member.name == BUNDLE_CONFIG:
+                    if member.size > _MAX_CONFIG_SIZE:
+                        raise BundleError("Bundle config.json is too large")
+                    try:
+                        config = json.loads(source.read())
+                    except ValueError as err:
+                        raise BundleError(f"Invalid config.json: {err}") from err
+                    continue
+
+                name = member.name.removeprefix(BUNDLE_ASSETS)
+                if name == member.name or not _valid_asset_name(name):
+                    raise BundleError(f"Unexpected bundle entry: {member.name}")
+                if member.size > MAX_FILE_SIZE:
+                    raise BundleError(f"Asset {name} is too large")
+                content = source.read()
+                try:
+                    info = validate_image(content, os.path.splitext(name)[1].lower())
+                except ImageError as err:
+                    raise BundleError(f"Invalid asset {name}: {err}") from err
+                if info.width and info.height:
+                    image_sizes[UPLOADS_URL + name] = [info.width, info.height]
+                with open(os.path.join(staging_dir, name), "wb") as dest:
+                    dest.write(content)
+    except (tarfile.TarError, EOFError, OSError) as err:
+        raise BundleError(f"Invalid bundle: {err}") from err
+
+    if not isinstance(config, dict):
+        raise BundleError("Bundle has no config.json")
+    if not isinstance(config.get(CONF_PROFILES) or {}, dict):
+        raise BundleError("Bundle profiles must be a mapping")
+    missing = referenced_assets(config) - set(os.listdir(staging_dir))
+    if missing:
+        raise BundleError(f"Bundle is missing assets: {', '.join(sorted(missing))}")
+    config[CONF_IMAGE_SIZES] = image_sizes
+    return config
+
+
+def create_import_staging(parent: str) -> str:
+    """Create and return a new import staging directory under parent."""
+    os.makedirs(parent, exist_ok=True)
+    return tempfile.mkdtemp(prefix=IMPORT_PREFIX, dir=parent)
+
+
+def remove_import_staging(parent: str) -> None:
+    """Delete staging directories left behind by interrupted imports."""
+    try:
+        entries = list(os.scandir(parent))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        if entry.name.startswith(IMPORT_PREFIX) and entry.is_dir():
+            shutil.rmtree(entry.path, ignore_errors=True)
+            _LOGGER.info("HA Rebrand: Removed leftover import %s", entry.name)
+
+
+def _keep_previous(path: str, backup: str) -> None:
+    """Keep a copy of path at backup, linking when the filesystem allows."""
+    try:
+        os.link(path, backup)
+    except OSError:
+        shutil.copy2(path, backup)
+
+
+def commit_bundle(staging_dir: str, uploads_dir: str) -> list[str]:
+    """Move staged assets into uploads_dir, all of them or none.
+
+    Each file is replaced atomically. The files being replaced are kept
+    aside first, so if any move fails the assets already moved are put
+    back and uploads_dir is left as it was.
+    """
+    names = sorted(os.listdir(staging_dir))
+    previous_dir = os.path.join(staging_dir, _PREVIOUS_DIR)
+    replaced: list[str] = []
+    moved: list[str] = []
+    try:
+        os.mkdir(previous_dir)
+        for name in names:
+            if os.path.exists(target := os.path.join(uploads_dir, name)):
+                _keep_previous(target, os.path.join(previous_dir, name))
+                replaced.append(name)
+        for name in names:
+            os.replace(os.path.join(staging_dir, name), os.path.join(uploads_dir, name))
+            moved.append(name)
+    except OSError as err:
+        for name in moved:
+            target = os.path.join(uploads_dir, name)
+            try:
+                if name in replaced:
+                    os.replace(os.path.join(previous_dir, name), target)
+                else:
+                    os.remove(target)
+            except OSError as restore_err:
+                _LOGGER.error(
+                    "HA Rebrand: Could not restore %s after a failed import: %s",
+                    name,
+                    restore_err,
+                )
+        raise BundleError(f"Could not apply bundle: {err}") from err
+    return names
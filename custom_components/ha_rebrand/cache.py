@@ -0,0 +1,64 @@
+"""Precomputed artifact cache for HA Rebrand."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Collection, Hashable
+
+
+class ArtifactCache:
+    """LRU cache of rendered pages and payloads bounded by a byte budget.
+
+    Keys are tuples starting with the profile name, e.g.
+    ``("default", "authorize", 3)``. When the budget is exceeded the least
+    recently used artifacts are evicted first.
+    """
+
+    def __init__(self, budget: int) -> None:
+        """Initialize the cache."""
+        self.budget = budget
+        self.size = 0
+        self._entries: OrderedDict[Hashable, tuple[bytes | str, int]] = OrderedDict()
+
+    def get(self, key: Hashable) -> bytes | str | None:
+        """Return a cached artifact and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, value: bytes | str, extra: int = 0) -> bytes | str:
+        """Store an artifact and return it.
+
+        ``extra`` accounts for memory held by the key itself. Artifacts larger
+        than the whole budget are returned without being cached.
+        """
+        size = len(value) + extra
+        if (previous := self._entries.pop(key, None)) is not None:
+            self.size -= previous[1]
+        if size > self.budget:
+            return value
+
+        self._entries[key] = (value, size)
+        self.size += size
+        while self.size > self.budget:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size -= evicted
+        return value
+
+    def invalidate(self, profile: str, kinds: Collection[str]) -> int:
+        """Drop a profile's artifacts of the given kinds and return how many."""
+        stale = [
+            key
+            for key in self._entries
+            if isinstance(key, tuple) and key[:1] == (profile,) and key[1] in kinds
+        ]
+        for key in stale:
+            self.size -= self._entries.pop(key)[1]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached artifact."""
+        self._entries.clear()
+        self.size = 0
@@ -11,6 +11,33 @@ CONF_SIDEBAR_TEXT = "sidebar_text"
 CONF_BROWSER_TAB_TITLE = "browser_tab_title"
 CONF_HIDE_OPEN_HOME_FOUNDATION = "hide_open_home_foundation"
 CONF_PRIMARY_COLOR = "primary_color"
+CONF_TRANSLATIONS = "translations"
+
+# Branding profiles selected by request Host
+CONF_PROFILES = "profiles"
+CONF_HOSTS = "hosts"
+DEFAULT_PROFILE = "default"
+
+# Branding keys exposed to clients and overridable per profile
+BRANDING_KEYS = (
+    CONF_SYSTEM_NAME,
+    CONF_LOGO,
+    CONF_LOGO_DARK,
+    CONF_FAVICON,
+    CONF_SIDEBAR_TEXT,
+    CONF_BROWSER_TAB_TITLE,
+    CONF_HIDE_OPEN_HOME_FOUNDATION,
+    CONF_PRIMARY_COLOR,
+    CONF_TRANSLATIONS,
+)
+
+# Intrinsic size of uploaded images, keyed by their /local/ path
+CONF_IMAGE_SIZES = "image_sizes"
+
+# Server options (YAML only, never part of the public branding config)
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RATE_LIMIT_BURST = "rate_limit_burst"
+CONF_WATCH_CONFIG_FILE = "watch_config_file"
 
 # Old configuration keys (for migration compatibility)
 CONF_BRAND_NAME_OLD = "brand_name"
@@ -24,6 +51,21 @@ DEFAULT_SYSTEM_NAME = "Home Assistant"
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
 ALLOWED_FILE_TYPES = {"logo", "logo_dark", "favicon"}
 ALLOWED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".svg", ".ico", ".webp"}
+MAX_IMAGE_DIMENSION = 8192
+MAX_BUNDLE_SIZE = 32 * 1024 * 1024  # 32MB
+MAX_BUNDLE_FILES = 64
+
+# Memory budget for precomputed pages and payloads across all profiles
+RENDER_CACHE_BUDGET = 4 * 1024 * 1024  # 4MB
+
+# Memory budget for rendered draft previews, kept apart from live pages
+PREVIEW_CACHE_BUDGET = 1024 * 1024  # 1MB
+
+# Admission control for unauthenticated endpoints (disabled unless configured)
+DEFAULT_RATE_LIMIT_BURST = 10
+
+# Dispatcher signal sent with the config revision after every change
+SIGNAL_CONFIG_UPDATED = f"{DOMAIN}_config_updated"
 
 # Panel constants
 PANEL_URL_PATH = "ha-rebrand"
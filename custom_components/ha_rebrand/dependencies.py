@@ -0,0 +1,78 @@
+"""Config field to derived artifact dependencies for HA Rebrand."""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Mapping
+from typing import Any
+
+from .const import (
+    BRANDING_KEYS,
+    CONF_BROWSER_TAB_TITLE,
+    CONF_FAVICON,
+    CONF_HIDE_OPEN_HOME_FOUNDATION,
+    CONF_IMAGE_SIZES,
+    CONF_LOGO,
+    CONF_LOGO_DARK,
+    CONF_PRIMARY_COLOR,
+    CONF_SIDEBAR_TEXT,
+    CONF_SYSTEM_NAME,
+    CONF_TRANSLATIONS,
+)
+from .pages import AUTHORIZE_PAGE, INDEX_PAGE, ONBOARDING_PAGE
+
+# Artifact kinds, the second element of every render cache key
+ARTIFACT_BRAND_CONFIG = "brand_config"
+ARTIFACT_PRELOAD = "preload"
+ARTIFACT_MANIFEST = "manifest"
+ARTIFACT_INDEX = INDEX_PAGE.name
+ARTIFACT_AUTHORIZE = AUTHORIZE_PAGE.name
+ARTIFACT_ONBOARDING = ONBOARDING_PAGE.name
+
+ALL_ARTIFACTS = frozenset(
+    {
+        ARTIFACT_BRAND_CONFIG,
+        ARTIFACT_PRELOAD,
+        ARTIFACT_MANIFEST,
+        ARTIFACT_INDEX,
+        ARTIFACT_AUTHORIZE,
+        ARTIFACT_ONBOARDING,
+    }
+)
+_AUTH_PAGES = frozenset({ARTIFACT_AUTHORIZE, ARTIFACT_ONBOARDING})
+_PAGES = _AUTH_PAGES | {ARTIFACT_INDEX}
+
+# Which artifacts each config field is rendered into
+FIELD_ARTIFACTS: dict[str, frozenset[str]] = {
+    CONF_SYSTEM_NAME: _PAGES | {ARTIFACT_BRAND_CONFIG, ARTIFACT_MANIFEST},
+    CONF_LOGO: ALL_ARTIFACTS,
+    CONF_LOGO_DARK: ALL_ARTIFACTS - {ARTIFACT_MANIFEST},
+    CONF_FAVICON: _AUTH_PAGES
+    | {ARTIFACT_BRAND_CONFIG, ARTIFACT_PRELOAD, ARTIFACT_MANIFEST},
+    CONF_SIDEBAR_TEXT: frozenset({ARTIFACT_BRAND_CONFIG}),
+    CONF_BROWSER_TAB_TITLE: _AUTH_PAGES | {ARTIFACT_BRAND_CONFIG},
+    CONF_HIDE_OPEN_HOME_FOUNDATION: frozenset({ARTIFACT_INDEX, ARTIFACT_BRAND_CONFIG}),
+    CONF_PRIMARY_COLOR: _AUTH_PAGES | {ARTIFACT_BRAND_CONFIG, ARTIFACT_MANIFEST},
+    CONF_TRANSLATIONS: _PAGES | {ARTIFACT_BRAND_CONFIG, ARTIFACT_MANIFEST},
+    CONF_IMAGE_SIZES: _PAGES | {ARTIFACT_MANIFEST},
+}
+
+TRACKED_FIELDS = (*BRANDING_KEYS, CONF_IMAGE_SIZES)
+
+
+def snapshot(config: Mapping[str, Any]) -> dict[str, Any]:
+    """Return a copy of the fields of a profile config artifacts depend on."""
+    return copy.deepcopy({key: config.get(key) for key in TRACKED_FIELDS})
+
+
+def affected_artifacts(
+    previous: Mapping[str, Any] | None, current: Mapping[str, Any] | None
+) -> frozenset[str]:
+    """Return the artifact kinds to rebuild between two profile snapshots."""
+    if previous is None or current is None:
+        return ALL_ARTIFACTS
+    affected: set[str] = set()
+    for key in TRACKED_FIELDS:
+        if previous.get(key) != current.get(key):
+            affected |= FIELD_ARTIFACTS.get(key, ALL_ARTIFACTS)
+    return frozenset(affected)
@@ -0,0 +1,37 @@
+"""Diagnostics support for HA Rebrand."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import (
+    DATA_CONFIG_REVISION,
+    DATA_CONFIG_WATCHER,
+    DATA_IO_EXECUTOR,
+    DATA_RENDER_CACHE,
+    DATA_TEMPLATES,
+)
+from .cache import ArtifactCache
+from .executor import IOExecutor
+from .templates import FrontendTemplates
+from .watcher import ConfigFileWatcher
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    executor: IOExecutor | None = hass.data.get(DATA_IO_EXECUTOR)
+    cache: ArtifactCache = hass.data[DATA_RENDER_CACHE]
+    templates: FrontendTemplates | None = hass.data.get(DATA_TEMPLATES)
+    watcher: ConfigFileWatcher | None = hass.data.get(DATA_CONFIG_WATCHER)
+    return {
+        "io_executor": executor.stats if executor else None,
+        "render_cache": {"size": cache.size, "budget": cache.budget},
+        "templates_revision": templates.revision if templates else None,
+        "config_revision": hass.data.get(DATA_CONFIG_REVISION, 0),
+        "config_watcher": watcher.mode if watcher else None,
+    }
@@ -0,0 +1,104 @@
+"""Dedicated file I/O executor for HA Rebrand."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+IO_MAX_WORKERS = 2
+
+# Jobs that waited longer than this for a worker are logged
+SLOW_WAIT = 0.5
+
+
+class IOExecutor:
+    """Small thread pool for the integration's blocking file operations.
+
+    Keeps uploads and config writes off Home Assistant's shared executor.
+    Writes to the same path run one after another in submission order, and
+    queue depth and wait times are tracked for diagnostics.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_workers: int = IO_MAX_WORKERS) -> None:
+        """Initialize the executor."""
+        self.hass = hass
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ha_rebrand_io"
+        )
+        # One lock per path being written, with the number of jobs holding
+        # or waiting for it; dropped once that reaches zero, as staging
+        # files give every upload a path of its own
+        self._write_locks: dict[str, tuple[asyncio.Lock, int]] = {}
+        self._stats_lock = threading.Lock()
+        self._queued = 0
+        self._jobs = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def async_run[T](self, target: Callable[..., T], *args: Any) -> T:
+        """Run target in the pool and return its result."""
+        submitted = time.monotonic()
+        with self._stats_lock:
+            self._queued += 1
+
+        def _job() -> T:
+            waited = time.monotonic() - submitted
+            with self._stats_lock:
+                self._queued -= 1
+                self._jobs += 1
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+            if waited > SLOW_WAIT:
+                _LOGGER.debug(
+                    "HA Rebrand: %s waited %.2fs for an I/O worker",
+                    getattr(target, "__name__", target),
+                    waited,
+                )
+            return target(*args)
+
+        return await self.hass.loop.run_in_executor(self._pool, _job)
+
+    async def async_write[T](
+        self, path: str, target: Callable[..., T], *args: Any
+    ) -> T:
+        """Run a job that writes path once earlier writes to it have finished."""
+        lock, users = self._write_locks.get(path) or (asyncio.Lock(), 0)
+        self._write_locks[path] = (lock, users + 1)
+        try:
+            async with lock:
+                return await self.async_run(target, *args)
+        finally:
+            lock, users = self._write_locks[path]
+            if users > 1:
+                self._write_locks[path] = (lock, users - 1)
+            else:
+                del self._write_locks[path]
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth and wait time statistics."""
+        with self._stats_lock:
+            return {
+                "workers": self.max_workers,
+                "queue_depth": self._queued,
+                "jobs": self._jobs,
+                "average_wait_ms": round(
+                    1000 * self._total_wait / self._jobs if self._jobs else 0.0, 2
+                ),
+                "max_wait_ms": round(1000 * self._max_wait, 2),
+            }
+
+    async def async_shutdown(self) -> None:
+        """Let queued jobs finish, then stop the worker threads."""
+        await self.hass.async_add_executor_job(partial(self._pool.shutdown, wait=True))
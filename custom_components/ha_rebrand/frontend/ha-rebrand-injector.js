@@ -25,6 +25,7 @@
   let isApplying = false;  // Re-entrance guard to prevent feedback loops
   let titleObserverCreated = false;  // Prevent multiple title observers
   let waitForSidebarRafPending = false;  // Prevent multiple RAF callbacks flooding
+  let configSubscribed = false;  // Subscribed to server-side config changes
 
   // Cached element references for performance
   let cachedSidebar = null;
@@ -158,13 +159,29 @@
     window.matchMedia('(prefers-color-scheme: dark)').addEventListener('change', updateLogosForTheme);
   }
 
+  /**
+   * Get the UI language the user picked in their HA profile, if any
+   * HA persists it in localStorage, so it is available before hass is
+   */
+  function getSelectedLanguage() {
+    try {
+      const stored = localStorage.getItem('selectedLanguage');
+      return stored ? JSON.parse(stored) : null;
+    } catch (e) {
+      return null;
+    }
+  }
+
   /**
    * Fetch rebrand configuration from the API
    * Uses browser caching for better performance - config.json is updated on save
+   * The server localizes names for the requested language (or Accept-Language)
    */
   async function fetchConfig() {
     try {
-      const response = await fetch(REBRAND_CONFIG_URL, {
+      const lang = getSelectedLanguage();
+      const url = lang ? `${REBRAND_CONFIG_URL}?lang=${encodeURIComponent(lang)}` : REBRAND_CONFIG_URL;
+      const response = await fetch(url, {
         credentials: 'same-origin'  // Include auth cookies
       });
       if (response.ok) {
@@ -730,10 +747,15 @@
 
   /**
    * Apply primary color to the entire interface
-   * This changes --primary-color CSS variable which affects buttons, links, etc.
+   * The server derives the palette (shades, hover/active states and text
+   * colors) and sends it as CSS variables, applied here as they are
    */
   function applyPrimaryColor() {
-    if (!config?.primary_color) return;
+    if (!config?.palette) {
+      // The color may have been cleared since it was applied
+      document.getElementById('ha-rebrand-colors')?.remove();
+      return;
+    }
 
     // Create or update style element for color overrides
     let styleEl = document.getElementById('ha-rebrand-colors');
@@ -743,17 +765,13 @@
       document.head.appendChild(styleEl);
     }
 
-    // Apply the primary color via CSS custom properties
+    // Apply the palette via CSS custom properties
+    const declarations = Object.entries(config.palette)
+      .map(([name, value]) => `${name}: ${value} !important;`)
+      .join('\n        ');
     styleEl.textContent = `
-      :root {
-        --primary-color: ${config.primary_color} !important;
-        --light-primary-color: ${config.primary_color}40 !important;
-        --dark-primary-color: ${config.primary_color} !important;
-      }
-      html {
-        --primary-color: ${config.primary_color} !important;
-        --light-primary-color: ${config.primary_color}40 !important;
-        --dark-primary-color: ${config.primary_color} !important;
+      :root, html {
+        ${declarations}
       }
     `;
 
@@ -935,6 +953,28 @@
     }
   }
 
+  /**
+   * Reload the configuration whenever it changes on the server (saves,
+   * uploads, imports, or config.json edited on disk)
+   * The websocket library resubscribes by itself after reconnecting
+   */
+  async function subscribeConfigUpdates() {
+    const connection = document.querySelector('home-assistant')?.hass?.connection;
+    if (!connection || configSubscribed) return;
+    configSubscribed = true;
+    try {
+      await connection.subscribeMessage(async (event) => {
+        console.log('[HA Rebrand] Configuration changed, revision', event.revision);
+        if (await fetchConfig()) {
+          applyRebrand();
+        }
+      }, { type: 'ha_rebrand/subscribe_config' });
+    } catch (error) {
+      configSubscribed = false;
+      console.warn('[HA Rebrand] Could not subscribe to configuration changes:', error);
+    }
+  }
+
   /**
    * Initialize the rebrand injector
    */
@@ -964,6 +1004,9 @@
 
     // Set up dialog observer for dialog logo replacement
     watchDialogs();
+
+    // Follow configuration changes without a page refresh
+    subscribeConfigUpdates();
   }
 
   // Start when DOM is ready
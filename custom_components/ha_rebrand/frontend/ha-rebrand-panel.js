@@ -10,6 +10,41 @@ import {
   css,
 } from "https://unpkg.com/lit-element@2.4.0/lit-element.js?module";
 
+// Largest dimensions kept per upload slot (2x the largest display size) and
+// the format images are re-encoded to before upload
+const IMAGE_LIMITS = {
+  logo: { maxWidth: 1024, maxHeight: 512, type: "image/webp" },
+  logo_dark: { maxWidth: 1024, maxHeight: 512, type: "image/webp" },
+  favicon: { maxWidth: 256, maxHeight: 256, type: "image/png" },
+};
+const IMAGE_QUALITY = 0.9;
+const IMAGE_EXTENSIONS = { "image/webp": ".webp", "image/png": ".png" };
+// Vector and multi-resolution formats are uploaded as they are
+const KEEP_AS_IS = ["image/svg+xml", "image/x-icon", "image/vnd.microsoft.icon"];
+
+// Decodes, downscales and re-encodes an image off the main thread
+const OPTIMIZE_WORKER = `
+self.onmessage = async (event) => {
+  const { file, maxWidth, maxHeight, type, quality } = event.data;
+  try {
+    const bitmap = await createImageBitmap(file);
+    const scale = Math.min(1, maxWidth / bitmap.width, maxHeight / bitmap.height);
+    const canvas = new OffscreenCanvas(
+      Math.max(1, Math.round(bitmap.width * scale)),
+      Math.max(1, Math.round(bitmap.height * scale))
+    );
+    const ctx = canvas.getContext("2d");
+    ctx.imageSmoothingQuality = "high";
+    ctx.drawImage(bitmap, 0, 0, canvas.width, canvas.height);
+    bitmap.close();
+    const blob = await canvas.convertToBlob({ type, quality });
+    self.postMessage({ blob, scaled: scale < 1 });
+  } catch (error) {
+    self.postMessage({ error: String(error) });
+  }
+};
+`;
+
 class HaRebrandPanel extends LitElement {
   static get properties() {
     return {
@@ -22,6 +57,11 @@ class HaRebrandPanel extends LitElement {
       _uploadingLogo: { type: Boolean },
       _uploadingLogoDark: { type: Boolean },
       _uploadingFavicon: { type: Boolean },
+      _keepOriginal: { type: Boolean },
+      _optimized: { type: Object },
+      _pending: { type: Object },
+      _preview: { type: Object },
+      _previewing: { type: String },
       _message: { type: Object },
     };
   }
@@ -278,6 +318,15 @@ class HaRebrandPanel extends LitElement {
         margin-top: 24px;
       }
 
+      .preview-frame {
+        width: 100%;
+        height: 480px;
+        margin-top: 16px;
+        border: 1px solid var(--divider-color);
+        border-radius: 8px;
+        background: #fff;
+      }
+
       .loading {
         display: flex;
         justify-content: center;
@@ -395,6 +444,11 @@ class HaRebrandPanel extends LitElement {
     this._uploadingLogo = false;
     this._uploadingLogoDark = false;
     this._uploadingFavicon = false;
+    this._keepOriginal = false;
+    this._optimized = {};
+    this._pending = {};
+    this._preview = null;
+    this._previewing = null;
     this._message = null;
   }
 
@@ -431,9 +485,37 @@ class HaRebrandPanel extends LitElement {
     return path.split('?')[0];
   }
 
+  // Render a page with the unsaved settings; nothing is written server-side
+  async _showPreview(page) {
+    this._previewing = page;
+    try {
+      const draft = {
+        ...this._config,
+        logo: this._stripCacheBuster(this._config.logo),
+        logo_dark: this._stripCacheBuster(this._config.logo_dark),
+        favicon: this._stripCacheBuster(this._config.favicon),
+      };
+      const result = await this.hass.callWS({
+        type: "ha_rebrand/preview",
+        page,
+        draft,
+        language: this.hass.language,
+        color_scheme: this.hass.themes && this.hass.themes.darkMode ? "dark" : "light",
+      });
+      this._preview = { page, html: result.html, hash: result.hash };
+    } catch (error) {
+      console.error("Failed to render preview:", error);
+      this._showMessage("error", "Failed to render preview: " + error.message);
+    }
+    this._previewing = null;
+  }
+
   async _saveToFile() {
     this._saving = true;
     try {
+      // Upload the images chosen since the last save, all in one request
+      await this._uploadPending();
+
       // Prepare config without cache busters for saving
       const configToSave = {
         ...this._config,
@@ -474,16 +556,306 @@ class HaRebrandPanel extends LitElement {
     this._saving = false;
   }
 
-  async _uploadFile(type, file) {
-    const uploadingKey = `_uploading${type.charAt(0).toUpperCase() + type.slice(1).replace('_', '')}`;
-    this[uploadingKey] = true;
+  async _exportBundle() {
+    try {
+      const response = await fetch("/api/ha_rebrand/export", {
+        headers: {
+          "Authorization": `Bearer ${this.hass.auth.data.access_token}`,
+        },
+      });
+      if (!response.ok) {
+        throw new Error(`HTTP ${response.status}`);
+      }
+      const url = URL.createObjectURL(await response.blob());
+      const link = document.createElement("a");
+      link.href = url;
+      link.download = "ha_rebrand.tar.gz";
+      link.click();
+      URL.revokeObjectURL(url);
+    } catch (error) {
+      console.error("Failed to export bundle:", error);
+      this._showMessage("error", "Failed to export bundle: " + error.message);
+    }
+  }
+
+  async _importBundle(e) {
+    const file = e.target.files[0];
+    e.target.value = "";
+    if (!file) return;
+    try {
+      const response = await fetch("/api/ha_rebrand/import", {
+        method: "POST",
+        headers: {
+          "Authorization": `Bearer ${this.hass.auth.data.access_token}`,
+          "Content-Type": "application/gzip",
+        },
+        body: file,
+      });
+      const result = await response.json();
+      if (!result.success) {
+        throw new Error(result.error || "Failed to import");
+      }
+      await this._loadConfig();
+      if (window.HARebrand) {
+        await window.HARebrand.reloadConfig();
+      }
+      this._showMessage("success", "Bundle imported!");
+    } catch (error) {
+      console.error("Failed to import bundle:", error);
+      this._showMessage("error", "Failed to import bundle: " + error.message);
+    }
+  }
+
+  _uploadingKey(type) {
+    return `_uploading${type.charAt(0).toUpperCase() + type.slice(1).replace('_', '')}`;
+  }
+
+  // Prepare a chosen image and keep it until the configuration is saved,
+  // so several new images go to the server together
+  async _queueFile(type, file) {
+    const key = this._uploadingKey(type);
+    this[key] = true;
+    try {
+      const upload = this._keepOriginal ? file : await this._optimizeImage(type, file);
+      this._optimized = { ...this._optimized, [type]: { before: file.size, after: upload.size } };
+      this._dropPending(type);
+      this._pending = {
+        ...this._pending,
+        [type]: { file: upload, url: URL.createObjectURL(upload) },
+      };
+    } catch (error) {
+      console.error("Failed to prepare image:", error);
+      this._showMessage("error", `${type} 處理失敗: ${error.message}`);
+    }
+    this[key] = false;
+  }
+
+  _dropPending(type) {
+    const pending = this._pending[type];
+    if (!pending) return;
+    URL.revokeObjectURL(pending.url);
+    const { [type]: _, ...rest } = this._pending;
+    this._pending = rest;
+  }
+
+  // Image shown for a slot: the pending one, otherwise the configured one
+  _imageSrc(type) {
+    return this._pending[type]?.url || this._config[type];
+  }
+
+  // A single image goes in resumable chunks over the websocket; several go
+  // to the batch endpoint so they are stored and applied in one step
+  async _uploadPending() {
+    const types = Object.keys(this._pending);
+    if (!types.length) return;
+    let paths;
+    if (types.length === 1) {
+      const [type] = types;
+      paths = { [type]: await this._uploadSingle(type, this._pending[type].file) };
+    } else {
+      const files = {};
+      for (const type of types) {
+        files[type] = this._pending[type].file;
+      }
+      paths = await this._uploadFiles(files);
+    }
+    types.forEach((type) => this._dropPending(type));
+    // The paths are applied by the upload; keep a cache buster for the preview
+    const cacheBuster = `?t=${Date.now()}`;
+    const updates = {};
+    for (const [type, path] of Object.entries(paths)) {
+      updates[type] = path + cacheBuster;
+    }
+    this._config = { ...this._config, ...updates };
+  }
+
+  async _uploadSingle(type, file) {
+    const key = this._uploadingKey(type);
+    this[key] = true;
+    try {
+      return await this._uploadChunked(type, file);
+    } finally {
+      this[key] = false;
+    }
+  }
+
+  // Upload one image in chunks over the websocket connection the panel
+  // already holds; an interrupted upload resumes from the last stored chunk
+  async _uploadChunked(type, file) {
+    // Remember the upload id per file so a retry or reload can resume
+    const resumeKey = `ha_rebrand_upload:${type}:${file.name}:${file.size}:${file.lastModified}`;
+    const begin = async () => {
+      const uploadId = localStorage.getItem(resumeKey);
+      const result = await this.hass.callWS({
+        type: "ha_rebrand/upload_begin",
+        file_type: type,
+        filename: file.name,
+        size: file.size,
+        ...(uploadId ? { upload_id: uploadId } : {}),
+      });
+      localStorage.setItem(resumeKey, result.upload_id);
+      return result;
+    };
+    const fatal = ["invalid_format", "invalid_image", "too_large", "not_found"];
+
+    try {
+      let session = await begin();
+      let offset = session.offset;
+      let failures = 0;
+      while (offset < file.size) {
+        const chunk = new Uint8Array(
+          await file.slice(offset, offset + session.chunk_size).arrayBuffer()
+        );
+        try {
+          const result = await this.hass.callWS({
+            type: "ha_rebrand/upload_chunk",
+            upload_id: session.upload_id,
+            offset,
+            data: this._toBase64(chunk),
+            ...(await this._sha256(chunk)),
+          });
+          offset = result.offset;
+          failures = 0;
+        } catch (error) {
+          if (fatal.includes(error.code) || ++failures > 5) throw error;
+          // Wait for the connection to recover, then ask where to continue
+          await new Promise((resolve) => setTimeout(resolve, 1000 * failures));
+          session = await begin();
+          offset = session.offset;
+        }
+      }
+
+      const result = await this.hass.callWS({
+        type: "ha_rebrand/upload_commit",
+        upload_id: session.upload_id,
+        ...(await this._sha256(new Uint8Array(await file.arrayBuffer()))),
+      });
+      localStorage.removeItem(resumeKey);
+      return result.path;
+    } catch (error) {
+      if (fatal.includes(error.code) || error.code === "checksum_mismatch") {
+        localStorage.removeItem(resumeKey);
+      }
+      throw error;
+    }
+  }
+
+  // Downscale and re-encode an image for its slot; the original is kept
+  // when it can't be decoded or the result wouldn't be smaller
+  async _optimizeImage(type, file) {
+    const limits = IMAGE_LIMITS[type];
+    if (!limits || KEEP_AS_IS.includes(file.type) || file.name.toLowerCase().endsWith(".svg")) {
+      return file;
+    }
+    const options = { file, ...limits, quality: IMAGE_QUALITY };
+    let result;
+    try {
+      result = typeof OffscreenCanvas !== "undefined" && typeof Worker !== "undefined"
+        ? await this._optimizeInWorker(options)
+        : await this._optimizeOnCanvas(options);
+    } catch (error) {
+      console.warn("Image optimization failed, uploading original:", error);
+      return file;
+    }
+    if (!result.scaled && result.blob.size >= file.size) return file;
+
+    const ext = IMAGE_EXTENSIONS[result.blob.type] || ".png";
+    const name = file.name.replace(/\.[^.]*$/, "") + ext;
+    return new File([result.blob], name, { type: result.blob.type });
+  }
+
+  _optimizeInWorker(options) {
+    const url = URL.createObjectURL(new Blob([OPTIMIZE_WORKER], { type: "text/javascript" }));
+    const worker = new Worker(url);
+    return new Promise((resolve, reject) => {
+      worker.onmessage = (event) => {
+        if (event.data.error) reject(new Error(event.data.error));
+        else resolve(event.data);
+      };
+      worker.onerror = (event) => reject(new Error(event.message));
+      worker.postMessage(options);
+    }).finally(() => {
+      worker.terminate();
+      URL.revokeObjectURL(url);
+    });
+  }
+
+  // Fallback for browsers without OffscreenCanvas
+  async _optimizeOnCanvas({ file, maxWidth, maxHeight, type, quality }) {
+    const bitmap = await createImageBitmap(file);
+    const scale = Math.min(1, maxWidth / bitmap.width, maxHeight / bitmap.height);
+    const canvas = document.createElement("canvas");
+    canvas.width = Math.max(1, Math.round(bitmap.width * scale));
+    canvas.height = Math.max(1, Math.round(bitmap.height * scale));
+    const ctx = canvas.getContext("2d");
+    ctx.imageSmoothingQuality = "high";
+    ctx.drawImage(bitmap, 0, 0, canvas.width, canvas.height);
+    bitmap.close();
+    const blob = await new Promise((resolve, reject) => {
+      canvas.toBlob((b) => (b ? resolve(b) : reject(new Error("Encoding failed"))), type, quality);
+    });
+    return { blob, scaled: scale < 1 };
+  }
+
+  _formatBytes(bytes) {
+    if (bytes < 1024) return `${bytes} B`;
+    if (bytes < 1024 * 1024) return `${(bytes / 1024).toFixed(1)} KB`;
+    return `${(bytes / (1024 * 1024)).toFixed(1)} MB`;
+  }
+
+  _renderCurrent(type) {
+    if (this._pending[type]) {
+      return html`
+        <p class="current-path">New: ${this._pending[type].file.name} (uploaded on save)</p>
+      `;
+    }
+    if (!this._config[type]) return "";
+    return html`<p class="current-path">Current: ${this._config[type]}</p>`;
+  }
+
+  _renderOptimized(type) {
+    const sizes = this._optimized[type];
+    if (!sizes) return "";
+    return html`
+      <p class="current-path">
+        ${sizes.after < sizes.before
+          ? `Optimized: ${this._formatBytes(sizes.before)} → ${this._formatBytes(sizes.after)}`
+          : `Kept as is: ${this._formatBytes(sizes.before)}`}
+      </p>
+    `;
+  }
+
+  _toBase64(bytes) {
+    let binary = "";
+    for (let i = 0; i < bytes.length; i += 0x8000) {
+      binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+    }
+    return btoa(binary);
+  }
+
+  // SubtleCrypto is only available in secure contexts; without it the
+  // checksum is left out and the server skips the check
+  async _sha256(bytes) {
+    if (!window.crypto?.subtle) return {};
+    const digest = await window.crypto.subtle.digest("SHA-256", bytes);
+    return {
+      sha256: Array.from(new Uint8Array(digest), (b) => b.toString(16).padStart(2, "0")).join(""),
+    };
+  }
+
+  // Upload several images in one request; the server stores them together
+  // and updates the configuration in a single write. Returns the new paths.
+  async _uploadFiles(files) {
+    const types = Object.keys(files);
+    types.forEach((type) => { this[this._uploadingKey(type)] = true; });
 
     try {
       const formData = new FormData();
-      formData.append("file", file);
-      formData.append("type", type);
+      for (const type of types) {
+        formData.append(type, files[type]);
+      }
 
-      const response = await fetch("/api/ha_rebrand/upload", {
+      const response = await fetch("/api/ha_rebrand/upload_batch", {
         method: "POST",
         headers: {
           "Authorization": `Bearer ${this.hass.auth.data.access_token}`,
@@ -505,28 +877,19 @@ class HaRebrandPanel extends LitElement {
       }
 
       const result = await response.json();
-
-      if (result.success) {
-        // Update config with new path (add cache buster for preview)
-        const configKey = type === "logo_dark" ? "logo_dark" : type;
-        const cacheBuster = `?t=${Date.now()}`;
-        this._config = { ...this._config, [configKey]: result.path + cacheBuster };
-        this._showMessage("success", `${type} 上傳成功！`);
-      } else {
+      if (!result.success) {
         throw new Error(result.error || "上傳失敗");
       }
-    } catch (error) {
-      console.error("Upload failed:", error);
-      this._showMessage("error", `${type} 上傳失敗: ${error.message}`);
+      return result.paths;
+    } finally {
+      types.forEach((type) => { this[this._uploadingKey(type)] = false; });
     }
-
-    this[uploadingKey] = false;
   }
 
   _handleFileSelect(type, event) {
     const file = event.target.files[0];
     if (file) {
-      this._uploadFile(type, file);
+      this._queueFile(type, file);
     }
   }
 
@@ -545,11 +908,12 @@ class HaRebrandPanel extends LitElement {
 
     const file = event.dataTransfer.files[0];
     if (file) {
-      this._uploadFile(type, file);
+      this._queueFile(type, file);
     }
   }
 
   _clearImage(type) {
+    this._dropPending(type);
     this._config = { ...this._config, [type]: "" };
   }
 
@@ -660,8 +1024,8 @@ class HaRebrandPanel extends LitElement {
               @dragleave=${this._handleDragLeave}
               @drop=${(e) => this._handleDrop("logo", e)}
             >
-              ${this._config.logo ? html`
-                <img class="preview-image" src="${this._config.logo}" alt="Logo preview" />
+              ${this._imageSrc("logo") ? html`
+                <img class="preview-image" src="${this._imageSrc("logo")}" alt="Logo preview" />
               ` : html`
                 <div class="preview-placeholder">
                   <svg viewBox="0 0 24 24"><path fill="currentColor" d="M21,3H3C2,3 1,4 1,5V19A2,2 0 0,0 3,21H21C22,21 23,20 23,19V5C23,4 22,3 21,3M5,17L8.5,12.5L11,15.5L14.5,11L19,17H5Z"/></svg>
@@ -679,15 +1043,14 @@ class HaRebrandPanel extends LitElement {
                       ?disabled=${this._uploadingLogo}
                     />
                   </label>
-                  ${this._config.logo ? html`
+                  ${this._imageSrc("logo") ? html`
                     <button class="btn btn-danger btn-small" @click=${() => this._clearImage("logo")}>
                       Remove
                     </button>
                   ` : ""}
                 </div>
-                ${this._config.logo ? html`
-                  <p class="current-path">Current: ${this._config.logo}</p>
-                ` : ""}
+                ${this._renderCurrent("logo")}
+                ${this._renderOptimized("logo")}
               </div>
             </div>
           </div>
@@ -701,8 +1064,8 @@ class HaRebrandPanel extends LitElement {
               @dragleave=${this._handleDragLeave}
               @drop=${(e) => this._handleDrop("logo_dark", e)}
             >
-              ${this._config.logo_dark ? html`
-                <img class="preview-image" src="${this._config.logo_dark}" alt="Dark logo preview" style="background: #333;" />
+              ${this._imageSrc("logo_dark") ? html`
+                <img class="preview-image" src="${this._imageSrc("logo_dark")}" alt="Dark logo preview" style="background: #333;" />
               ` : html`
                 <div class="preview-placeholder" style="background: #333;">
                   <svg viewBox="0 0 24 24"><path fill="currentColor" d="M21,3H3C2,3 1,4 1,5V19A2,2 0 0,0 3,21H21C22,21 23,20 23,19V5C23,4 22,3 21,3M5,17L8.5,12.5L11,15.5L14.5,11L19,17H5Z"/></svg>
@@ -720,15 +1083,14 @@ class HaRebrandPanel extends LitElement {
                       ?disabled=${this._uploadingLogoDark}
                     />
                   </label>
-                  ${this._config.logo_dark ? html`
+                  ${this._imageSrc("logo_dark") ? html`
                     <button class="btn btn-danger btn-small" @click=${() => this._clearImage("logo_dark")}>
                       Remove
                     </button>
                   ` : ""}
                 </div>
-                ${this._config.logo_dark ? html`
-                  <p class="current-path">Current: ${this._config.logo_dark}</p>
-                ` : ""}
+                ${this._renderCurrent("logo_dark")}
+                ${this._renderOptimized("logo_dark")}
               </div>
             </div>
           </div>
@@ -756,6 +1118,21 @@ class HaRebrandPanel extends LitElement {
             </label>
           </div>
 
+          <div class="toggle-row">
+            <div class="toggle-label">
+              <div class="title">Keep Original Images</div>
+              <div class="description">上傳原始圖片，不先縮小尺寸與重新編碼（預設會在瀏覽器中最佳化後再上傳）</div>
+            </div>
+            <label class="toggle-switch">
+              <input
+                type="checkbox"
+                .checked=${this._keepOriginal}
+                @change=${(e) => { this._keepOriginal = e.target.checked; }}
+              />
+              <span class="toggle-slider"></span>
+            </label>
+          </div>
+
           <div class="form-group" style="margin-top: 20px; padding-top: 16px; border-top: 1px solid var(--divider-color);">
             <label>Primary Color (主色調)</label>
             <p class="hint" style="margin-bottom: 8px;"><strong>顯示位置：</strong>整個 Home Assistant 界面的主色調，包括歡迎卡片背景、按鈕、連結等</p>
@@ -798,8 +1175,8 @@ class HaRebrandPanel extends LitElement {
               @dragleave=${this._handleDragLeave}
               @drop=${(e) => this._handleDrop("favicon", e)}
             >
-              ${this._config.favicon ? html`
-                <img class="preview-image" src="${this._config.favicon}" alt="Favicon preview" style="width: 48px; height: 48px;" />
+              ${this._imageSrc("favicon") ? html`
+                <img class="preview-image" src="${this._imageSrc("favicon")}" alt="Favicon preview" style="width: 48px; height: 48px;" />
               ` : html`
                 <div class="preview-placeholder" style="width: 48px; height: 48px;">
                   <svg viewBox="0 0 24 24" style="width: 24px; height: 24px;"><path fill="currentColor" d="M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10,10 0 0,0 12,2Z"/></svg>
@@ -817,23 +1194,62 @@ class HaRebrandPanel extends LitElement {
                       ?disabled=${this._uploadingFavicon}
                     />
                   </label>
-                  ${this._config.favicon ? html`
+                  ${this._imageSrc("favicon") ? html`
                     <button class="btn btn-danger btn-small" @click=${() => this._clearImage("favicon")}>
                       Remove
                     </button>
                   ` : ""}
                 </div>
-                ${this._config.favicon ? html`
-                  <p class="current-path">Current: ${this._config.favicon}</p>
-                ` : ""}
+                ${this._renderCurrent("favicon")}
+                ${this._renderOptimized("favicon")}
               </div>
             </div>
           </div>
         </div>
 
+        <!-- Preview Card -->
+        <div class="card">
+          <h2 class="card-title">
+            <svg viewBox="0 0 24 24"><path fill="currentColor" d="M12,9A3,3 0 0,0 9,12A3,3 0 0,0 12,15A3,3 0 0,0 15,12A3,3 0 0,0 12,9M12,17A5,5 0 0,1 7,12A5,5 0 0,1 12,7A5,5 0 0,1 17,12A5,5 0 0,1 12,17M12,4.5C7,4.5 2.73,7.61 1,12C2.73,16.39 7,19.5 12,19.5C17,19.5 21.27,16.39 23,12C21.27,7.61 17,4.5 12,4.5Z"/></svg>
+            Preview
+          </h2>
+          <p class="hint">預覽尚未儲存的設定（不會寫入檔案）</p>
+          <div class="upload-actions">
+            ${[
+              ["authorize", "Login Page"],
+              ["onboarding", "Onboarding"],
+              ["index", "Loading Screen"],
+            ].map(([page, label]) => html`
+              <button class="btn btn-secondary btn-small" @click=${() => this._showPreview(page)} ?disabled=${this._previewing !== null}>
+                ${this._previewing === page ? "Rendering..." : label}
+              </button>
+            `)}
+            ${this._preview ? html`
+              <button class="btn btn-secondary btn-small" @click=${() => { this._preview = null; }}>
+                Close
+              </button>
+            ` : ""}
+          </div>
+          ${this._preview ? html`
+            <iframe
+              class="preview-frame"
+              title="Preview"
+              sandbox=${this._preview.page === "index" ? "" : "allow-scripts"}
+              .srcdoc=${this._preview.html}
+            ></iframe>
+          ` : ""}
+        </div>
+
         <!-- Actions -->
         <div class="card">
           <div class="actions-bar" style="border-top: none; margin-top: 0; padding-top: 0;">
+            <button class="btn btn-secondary" @click=${this._exportBundle}>
+              Export Bundle
+            </button>
+            <button class="btn btn-secondary" @click=${() => this.shadowRoot.getElementById("bundle-input").click()}>
+              Import Bundle
+            </button>
+            <input type="file" id="bundle-input" accept=".tar.gz,.tgz,application/gzip" style="display: none" @change=${this._importBundle}>
             <button class="btn btn-primary" @click=${this._saveToFile} ?disabled=${this._saving}>
               ${this._saving ? "Saving..." : "Save Configuration"}
             </button>
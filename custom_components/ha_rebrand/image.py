@@ -0,0 +1,239 @@
+"""Header-only image sniffing for HA Rebrand uploads.
+
+Only the first chunk of an upload is inspected: the format is identified from
+its magic bytes and the intrinsic size is read from the image header, so a
+mismatched or oversized file is rejected before the rest is received. JPEG
+metadata segments can push the size past the first chunk; the sniffer then
+asks for as many bytes as the segment lengths say it needs.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import struct
+from dataclasses import dataclass
+from typing import Any
+
+from .const import MAX_FILE_SIZE, MAX_IMAGE_DIMENSION
+
+# Enough for most headers, including JPEGs with typical EXIF/ICC segments
+SNIFF_SIZE = 64 * 1024
+
+_EXTENSION_FORMATS = {
+    ".png": "png",
+    ".jpg": "jpeg",
+    ".jpeg": "jpeg",
+    ".webp": "webp",
+    ".ico": "ico",
+    ".svg": "svg",
+}
+
+# JPEG start-of-frame markers (DHT, JPG and DAC share the range)
+_JPEG_SOF = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# The XML declaration, processing instructions, comments and doctype that
+# may come before the root element; a doctype's internal subset can hold ">"
+_XML_PROLOG = re.compile(
+    rb"\s*(?:<\?.*?\?>|<!--.*?-->|<!DOCTYPE\b[^>\[]*(?:\[[^\]]*\][^>]*)?>)",
+    re.IGNORECASE | re.DOTALL,
+)
+_SVG_ROOT = re.compile(rb"\s*(<svg\b[^>]*>)", re.IGNORECASE)
+_SVG_ATTR = r'\b{}\s*=\s*["\']([^"\']*)["\']'
+_SVG_LENGTH = re.compile(r"^\s*([0-9]*\.?[0-9]+)\s*(?:px)?\s*$")
+
+
+class ImageError(Exception):
+    """Raised when an upload is not an acceptable image."""
+
+
+class HeaderIncomplete(ImageError):
+    """Raised when the header continues past the bytes given.
+
+    ``size`` is the number of leading bytes needed to read further; an image
+    that ends before that is truncated.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize the error with the number of bytes needed."""
+        super().__init__("Image header is truncated")
+        self.size = size
+
+
+@dataclass(frozen=True, slots=True)
+class ImageInfo:
+    """Format and intrinsic size of an image.
+
+    SVGs without width, height or viewBox have no intrinsic size.
+    """
+
+    format: str
+    width: int | None = None
+    height: int | None = None
+
+
+def _png(head: bytes) -> ImageInfo:
+    if head[12:16] != b"IHDR" or len(head) < 24:
+        raise ImageError("PNG header is truncated")
+    width, height = struct.unpack(">II", head[16:24])
+    return ImageInfo("png", width, height)
+
+
+def _jpeg(head: bytes) -> ImageInfo:
+    index = 2
+    while index + 4 <= len(head):
+        if head[index] != 0xFF:
+            raise ImageError("Corrupt JPEG header")
+        marker = head[index + 1]
+        if marker == 0xFF:
+            # Fill byte
+            index += 1
+            continue
+        if marker in (0x01, *range(0xD0, 0xD8)):
+            index += 2
+            continue
+        if marker in _JPEG_SOF:
+            if index + 9 > len(head):
+                raise HeaderIncomplete(index + 9)
+            height, width = struct.unpack(">HH", head[index + 5 : index + 9])
+            return ImageInfo("jpeg", width, height)
+        if marker in (0xD9, 0xDA):
+            raise ImageError("JPEG dimensions not found in header")
+        # Skip the segment by its length; EXIF and ICC data can be large
+        index += 2 + struct.unpack(">H", head[index + 2 : index + 4])[0]
+    raise HeaderIncomplete(index + 4)
+
+
+def _webp(head: bytes) -> ImageInfo:
+    chunk = head[12:16]
+    if chunk == b"VP8X" and len(head) >= 30:
+        width = 1 + int.from_bytes(head[24:27], "little")
+        height = 1 + int.from_bytes(head[27:30], "little")
+    elif chunk == b"VP8 " and len(head) >= 30:
+        width, height = struct.unpack("<HH", head[26:30])
+        width, height = width & 0x3FFF, height & 0x3FFF
+    elif chunk == b"VP8L" and len(head) >= 25:
+        bits = int.from_bytes(head[21:25], "little")
+        width = (bits & 0x3FFF) + 1
+        height = ((bits >> 14) & 0x3FFF) + 1
+    else:
+        raise ImageError("Unsupported WebP header")
+    return ImageInfo("webp", width, height)
+
+
+def _ico(head: bytes) -> ImageInfo:
+    if len(head) < 6:
+        raise ImageError("ICO directory is truncated")
+    count = struct.unpack("<H", head[4:6])[0]
+    if not count or len(head) < 6 + 16 * count:
+        raise ImageError("ICO directory is truncated")
+    # The largest icon in the directory; 0 means 256 pixels
+    width, height = max(
+        (head[offset] or 256, head[offset + 1] or 256)
+        for offset in range(6, 6 + 16 * count, 16)
+    )
+    return ImageInfo("ico", width, height)
+
+
+def _svg_length(value: str | None) -> float | None:
+    if value is None or not (match := _SVG_LENGTH.match(value)):
+        return None
+    return float(match.group(1))
+
+
+def _svg_pixels(length: float) -> int:
+    # Sub-pixel lengths count as one pixel rather than as zero
+    return round(length) or math.ceil(length)
+
+
+def _svg_root(head: bytes) -> bytes | None:
+    """Return the root start tag if it is <svg>, after any XML prolog."""
+    pos = 3 if head.startswith(b"\xef\xbb\xbf") else 0
+    while prolog := _XML_PROLOG.match(head, pos):
+        pos = prolog.end()
+    match = _SVG_ROOT.match(head, pos)
+    return match.group(1) if match else None
+
+
+def _svg(head: bytes) -> ImageInfo:
+    if (root := _svg_root(head)) is None:
+        raise ImageError("SVG root element not found in header")
+    tag = root.decode("utf-8", "replace")
+
+    def attr(name: str) -> str | None:
+        found = re.search(_SVG_ATTR.format(name), tag, re.IGNORECASE)
+        return found.group(1) if found else None
+
+    width = _svg_length(attr("width"))
+    height = _svg_length(attr("height"))
+    if (width is None or height is None) and (view_box := attr("viewBox")):
+        try:
+            _, _, box_width, box_height = map(float, view_box.replace(",", " ").split())
+        except ValueError as err:
+            raise ImageError("Invalid SVG viewBox") from err
+        width, height = width or box_width, height or box_height
+    if width is None or height is None:
+        return ImageInfo("svg")
+    return ImageInfo("svg", _svg_pixels(width), _svg_pixels(height))
+
+
+def sniff_image(head: bytes) -> ImageInfo:
+    """Identify an image from its first bytes and read its intrinsic size."""
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return _png(head)
+    if head.startswith(b"\xff\xd8"):
+        return _jpeg(head)
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return _webp(head)
+    if head.startswith(b"\x00\x00\x01\x00"):
+        return _ico(head)
+    if head.lstrip(b"\xef\xbb\xbf \t\r\n").startswith(b"<"):
+        return _svg(head)
+    raise ImageError("Unrecognized image format")
+
+
+def validate_image(head: bytes, ext: str) -> ImageInfo:
+    """Sniff an image and check it against its extension and size limits."""
+    info = sniff_image(head)
+    if _EXTENSION_FORMATS.get(ext) != info.format:
+        raise ImageError(f"File content is {info.format.upper()}, not {ext}")
+    if (
+        info.width is not None
+        and info.height is not None
+        and not (
+            0 < info.width <= MAX_IMAGE_DIMENSION
+            and 0 < info.height <= MAX_IMAGE_DIMENSION
+        )
+    ):
+        raise ImageError(
+            f"Image dimensions must be between 1 and {MAX_IMAGE_DIMENSION} pixels"
+        )
+    return info
+
+
+async def read_image(
+    part: Any, ext: str, max_size: int = MAX_FILE_SIZE
+) -> tuple[bytes, ImageInfo]:
+    """Read an uploaded multipart part, validating its header first.
+
+    The header is checked as soon as ``SNIFF_SIZE`` bytes (or the whole part)
+    have arrived, or later if it continues past them; the remainder is only
+    read for files that pass.
+    """
+    content = bytearray()
+    info: ImageInfo | None = None
+    head_size = SNIFF_SIZE
+    while chunk := await part.read_chunk():
+        content.extend(chunk)
+        if len(content) > max_size:
+            raise ImageError(
+                f"File too large. Maximum size is {max_size // (1024 * 1024)}MB."
+            )
+        while info is None and len(content) >= head_size:
+            try:
+                info = validate_image(bytes(content[:head_size]), ext)
+            except HeaderIncomplete as err:
+                head_size = err.size
+    if info is None:
+        info = validate_image(bytes(content), ext)
+    return bytes(content), info
@@ -0,0 +1,100 @@
+"""Reversible hook into the frontend's IndexView for HA Rebrand."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from aiohttp import hdrs, web
+from homeassistant.core import callback
+
+_LOGGER = logging.getLogger(__name__)
+
+# Set on the function the hook installs, pointing at the hook
+_MARKER = "_ha_rebrand_hook"
+
+
+class IndexViewHook:
+    """Single hook around ``IndexView.get``.
+
+    The frontend renders its index through a cache keyed on the template,
+    so the template's ``render`` doesn't run per request. The hook rewrites
+    the finished response instead, with the live request at hand. It is
+    installed at most once: installing over a ``get`` that already carries
+    a hook is refused, and ``async_remove`` restores the original, so
+    reloading the entry doesn't stack wrappers.
+    """
+
+    def __init__(
+        self,
+        view_cls: type,
+        link: Callable[[web.Request], str | None],
+        render: Callable[[web.Request, str], str],
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """Initialize the hook with its request and render callbacks.
+
+        headers are added to every branded response, for the request headers
+        the render depends on, along with the Link header returned by link.
+        """
+        self._view_cls = view_cls
+        self._link = link
+        self._render = render
+        self._headers = dict(headers or {})
+        self._original_get: Any = None
+
+    @property
+    def installed(self) -> bool:
+        """Return True while the hook is installed."""
+        return self._original_get is not None
+
+    @callback
+    def async_install(self) -> bool:
+        """Install the hook, refusing if one is already in place."""
+        cls = self._view_cls
+        if self.installed:
+            return True
+        if getattr(cls.get, _MARKER, None) is not None:
+            _LOGGER.warning(
+                "HA Rebrand: IndexView is already patched, not patching again"
+            )
+            return False
+
+        original_get = cls.get
+
+        async def get(view: Any, request: web.Request) -> web.StreamResponse:
+            response: web.StreamResponse = await original_get(view, request)
+            if response.prepared:
+                return response
+            if (
+                isinstance(response, web.Response)
+                and response.status == 200
+                and response.content_type == "text/html"
+                and (html := response.text)
+            ):
+                response.text = self._render(request, html)
+                response.headers.update(self._headers)
+                if link := self._link(request):
+                    response.headers[hdrs.LINK] = link
+            return response
+
+        setattr(get, _MARKER, self)
+        self._original_get = original_get
+        cls.get = get
+        return True
+
+    @callback
+    def async_remove(self) -> None:
+        """Restore the original method."""
+        cls = self._view_cls
+        if not self.installed:
+            return
+        if getattr(cls.get, _MARKER, None) is self:
+            cls.get = self._original_get
+        else:
+            _LOGGER.warning(
+                "HA Rebrand: IndexView.get was replaced by someone else, "
+                "leaving it in place"
+            )
+        self._original_get = None
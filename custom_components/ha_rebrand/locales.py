@@ -0,0 +1,92 @@
+"""Per-locale branding for HA Rebrand."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any
+
+from .const import (
+    CONF_BROWSER_TAB_TITLE,
+    CONF_SIDEBAR_TEXT,
+    CONF_SYSTEM_NAME,
+    CONF_TRANSLATIONS,
+)
+
+# Keys that may be translated per locale
+LOCALIZED_KEYS = (CONF_SYSTEM_NAME, CONF_SIDEBAR_TEXT, CONF_BROWSER_TAB_TITLE)
+
+# Regional tags browsers send for locales usually configured by script
+_LOCALE_ALIASES = {
+    "zh-tw": "zh-hant",
+    "zh-hk": "zh-hant",
+    "zh-mo": "zh-hant",
+    "zh-cn": "zh-hans",
+    "zh-sg": "zh-hans",
+}
+
+
+def parse_accept_language(header: str) -> list[str]:
+    """Return the language tags of an Accept-Language header by preference."""
+    weighted: list[tuple[float, int, str]] = []
+    for index, part in enumerate(header.split(",")):
+        tag, _, params = part.strip().partition(";")
+        tag = tag.strip()
+        if not tag or tag == "*":
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                continue
+        if quality > 0:
+            weighted.append((-quality, index, tag))
+    return [tag for _, _, tag in sorted(weighted)]
+
+
+@lru_cache(maxsize=512)
+def negotiate_locale(accept_language: str, available: tuple[str, ...]) -> str | None:
+    """Pick the configured locale that best matches an Accept-Language header.
+
+    Results are memoized per header and locale set, so repeat visitors cost a
+    single dict lookup.
+    """
+    if not accept_language or not available:
+        return None
+    index = {locale.lower(): locale for locale in available}
+    for tag in parse_accept_language(accept_language):
+        tag = tag.lower()
+        language = tag.partition("-")[0]
+        for candidate in (tag, _LOCALE_ALIASES.get(tag), language):
+            if candidate and candidate in index:
+                return index[candidate]
+        for locale, original in index.items():
+            if locale.partition("-")[0] == language:
+                return original
+    return None
+
+
+def available_locales(config: Mapping[str, Any]) -> tuple[str, ...]:
+    """Return the locales a config has translations for."""
+    translations = config.get(CONF_TRANSLATIONS)
+    if not isinstance(translations, Mapping):
+        return ()
+    return tuple(translations)
+
+
+def localize(config: Mapping[str, Any], locale: str | None) -> Mapping[str, Any]:
+    """Return config with the translated values for locale applied."""
+    if locale is None:
+        return config
+    values = config[CONF_TRANSLATIONS].get(locale)
+    if not isinstance(values, Mapping):
+        return config
+    localized = dict(config)
+    localized.update(
+        (key, values[key])
+        for key in LOCALIZED_KEYS
+        if isinstance(values.get(key), str) and values[key]
+    )
+    return localized
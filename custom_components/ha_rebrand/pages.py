@@ -0,0 +1,342 @@
+"""Branded page declarations for HA Rebrand.
+
+Each page declares the substitutions it applies to the upstream template
+(logo, alt text, title, favicon hrefs and head injections). The rules are
+compiled once at import time and applied in a single pass per render.
+
+When a dark logo is configured the logo is emitted as a ``<picture>`` with a
+``prefers-color-scheme: dark`` source, so the browser picks the right asset
+on first paint. A ``Sec-CH-Prefers-Color-Scheme`` client hint, when sent,
+selects the asset on the server instead.
+
+Scripts and stylesheets live in content-hashed static assets; pages only
+reference them, passing per-config values in ``data-*`` attributes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from html import escape as html_escape
+from typing import Any
+
+from .assets import (
+    AUTH_SCRIPT,
+    AUTH_STYLE,
+    LAUNCH_SCRIPT,
+    LAUNCH_STYLE,
+    LOGO_STYLE,
+    OHF_STYLE,
+    asset_url,
+)
+from .const import (
+    CONF_BROWSER_TAB_TITLE,
+    CONF_FAVICON,
+    CONF_HIDE_OPEN_HOME_FOUNDATION,
+    CONF_IMAGE_SIZES,
+    CONF_LOGO,
+    CONF_LOGO_DARK,
+    CONF_PRIMARY_COLOR,
+    CONF_SYSTEM_NAME,
+    DEFAULT_SYSTEM_NAME,
+)
+from .palette import derive_palette
+from .rewrite import PageRewriter, Replacement, RewriteRule
+
+_LOGGER = logging.getLogger(__name__)
+
+# Color validation pattern
+_COLOR_PATTERN = re.compile(r"^#[0-9A-Fa-f]{3}(?:[0-9A-Fa-f]{3})?(?:[0-9A-Fa-f]{2})?$")
+
+# Asset URLs that are safe to embed in a CSS attribute selector
+_SAFE_URL_PATTERN = re.compile(r"^[\w\-./:?=&%~]+$", re.ASCII)
+
+# Launch screen SVG logo in the index template
+SVG_LOGO_PATTERN = r'<svg[^>]*viewBox="0 0 240 240"[^>]*>.*?</svg>'
+
+# Logo <img> on the authorize and onboarding pages
+_AUTH_LOGO_SRC = 'src="/static/icons/favicon-192x192.png"'
+_AUTH_LOGO_PATTERN = r'<img\b[^>]*?src="/static/icons/favicon-192x192\.png"[^>]*>'
+
+# Values of the Sec-CH-Prefers-Color-Scheme client hint
+COLOR_SCHEMES = ("light", "dark")
+
+
+def validate_color(color: str | None) -> str:
+    """Validate CSS color value format. Returns empty string if invalid."""
+    if not color:
+        return ""
+    # Only allow #RGB, #RRGGBB, #RRGGBBAA formats
+    if _COLOR_PATTERN.match(color):
+        return color
+    _LOGGER.warning("Invalid color format rejected: %s", color)
+    return ""
+
+
+@dataclass(frozen=True, slots=True)
+class BrandedPage:
+    """A page template together with the substitutions branding applies to it."""
+
+    name: str
+    rewriter: PageRewriter
+    substitutions: Callable[
+        [Mapping[str, Any], str | None, Mapping[str, str] | None],
+        dict[str, Replacement],
+    ]
+
+    def render(
+        self,
+        html: str,
+        config: Mapping[str, Any],
+        color_scheme: str | None = None,
+        assets: Mapping[str, str] | None = None,
+    ) -> str:
+        """Render the branded page from the upstream template.
+
+        ``color_scheme`` is the client's preferred scheme if it sent a hint;
+        ``assets`` maps static asset names to their content-hashed URLs.
+        """
+        return self.rewriter.rewrite(
+            html, self.substitutions(config, color_scheme, assets)
+        )
+
+
+_AUTH_PAGE_RULES = (
+    RewriteRule("logo_img", _AUTH_LOGO_PATTERN, regex=True),
+    RewriteRule("title", "<title>Home Assistant</title>"),
+    RewriteRule("favicon_ico", 'href="/static/icons/favicon.ico"'),
+    RewriteRule("head", "</head>"),
+)
+
+_INDEX_PAGE_RULES = (
+    RewriteRule("launch_logo", SVG_LOGO_PATTERN, regex=True, count=1),
+    RewriteRule("head", "</head>"),
+)
+
+
+def image_size(config: Mapping[str, Any], url: str) -> tuple[int, int] | None:
+    """Return the recorded intrinsic size of an uploaded image URL."""
+    sizes = config.get(CONF_IMAGE_SIZES) or {}
+    size = sizes.get(url.split("?", 1)[0])
+    if (
+        isinstance(size, (list, tuple))
+        and len(size) == 2
+        and all(isinstance(value, int) and value > 0 for value in size)
+    ):
+        return size[0], size[1]
+    return None
+
+
+def _select_logo(
+    config: Mapping[str, Any], color_scheme: str | None
+) -> tuple[str | None, str | None]:
+    """Return the logo <img> src and, if needed, the dark <source> srcset."""
+    logo = config.get(CONF_LOGO)
+    logo_dark = config.get(CONF_LOGO_DARK)
+    if not logo or not logo_dark or logo_dark == logo:
+        return logo, None
+    if color_scheme == "dark":
+        return logo_dark, None
+    if color_scheme == "light":
+        return logo, None
+    return logo, logo_dark
+
+
+def _logo_picture(config: Mapping[str, Any], img: str, dark_src: str | None) -> str:
+    """Wrap a logo <img> in a <picture> with a dark-mode source."""
+    if dark_src is None:
+        return img
+    dimensions = ""
+    if size := image_size(config, dark_src):
+        dimensions = f' width="{size[0]}" height="{size[1]}"'
+    return (
+        f'<picture><source srcset="{html_escape(dark_src)}" '
+        f'media="(prefers-color-scheme: dark)"{dimensions}>{img}</picture>'
+    )
+
+
+def _preload_link(url: str, kind: str, media: str | None = None) -> str | None:
+    """Return a Link header value preloading url, or None if it isn't safe."""
+    if not _SAFE_URL_PATTERN.match(url):
+        return None
+    if kind == "module":
+        return f"<{url}>; rel=modulepreload"
+    link = f"<{url}>; rel=preload; as={kind}"
+    return f'{link}; media="{media}"' if media else link
+
+
+def preload_links(
+    config: Mapping[str, Any],
+    color_scheme: str | None,
+    modules: Iterable[str] = (),
+) -> list[str]:
+    """Return Link header values for the brand assets a page will request.
+
+    Only the logo variant the client will display is preloaded; without a
+    color scheme hint both variants are listed with a media condition.
+    """
+    links: list[str | None] = []
+    src, dark_src = _select_logo(config, color_scheme)
+    if src and dark_src:
+        links.append(_preload_link(src, "image", "(prefers-color-scheme: light)"))
+        links.append(_preload_link(dark_src, "image", "(prefers-color-scheme: dark)"))
+    elif src:
+        links.append(_preload_link(src, "image"))
+    if (favicon := config.get(CONF_FAVICON)) and favicon not in (src, dark_src):
+        links.append(_preload_link(favicon, "image"))
+    links.extend(_preload_link(url, "module") for url in modules)
+    return [link for link in links if link]
+
+
+def _favicon_links(favicon: str, touch_icon: str) -> str:
+    """Return favicon link tags for better browser support."""
+    return f'''<link rel="icon" type="image/png" sizes="192x192" href="{html_escape(favicon)}" />
+<link rel="icon" type="image/png" sizes="32x32" href="{html_escape(favicon)}" />
+<link rel="apple-touch-icon" href="{html_escape(touch_icon)}" />'''
+
+
+def _stylesheet(url: str) -> str:
+    return f'<link rel="stylesheet" href="{html_escape(url)}">'
+
+
+def _script(url: str, data: Mapping[str, str], defer: bool = False) -> str:
+    attrs = "".join(
+        f' data-{name}="{html_escape(value)}"' for name, value in data.items()
+    )
+    return (
+        f'<script src="{html_escape(url)}"{" defer" if defer else ""}{attrs}></script>'
+    )
+
+
+def _auth_page_substitutions(
+    config: Mapping[str, Any],
+    color_scheme: str | None,
+    assets: Mapping[str, str] | None,
+) -> dict[str, Replacement]:
+    """Build substitutions for the authorize and onboarding pages."""
+    logo_url = config.get(CONF_LOGO)
+    system_name = config.get(CONF_SYSTEM_NAME) or DEFAULT_SYSTEM_NAME
+    browser_tab_title = config.get(CONF_BROWSER_TAB_TITLE) or system_name
+    logo_src, dark_src = _select_logo(config, color_scheme)
+
+    # Use html_escape everywhere to prevent XSS
+    alt = f'alt="{html_escape(system_name)}"'
+
+    def logo_img(tag: str) -> str:
+        # Keep the upstream <img> attributes, swapping src and alt; explicit
+        # dimensions let the browser reserve the logo's box at its ratio
+        tag = tag.replace('alt="Home Assistant"', alt)
+        if not logo_src:
+            return tag
+        dimensions = ""
+        if size := image_size(config, logo_src):
+            dimensions = f' width="{size[0]}" height="{size[1]}"'
+        tag = tag.replace(
+            _AUTH_LOGO_SRC,
+            f'src="{html_escape(logo_src)}" class="ha-rebrand-logo"{dimensions}',
+        )
+        return _logo_picture(config, tag, dark_src)
+
+    subs: dict[str, Replacement] = {
+        "logo_img": logo_img,
+        "title": f"<title>{html_escape(browser_tab_title)}</title>",
+    }
+
+    # Replace favicon references from _header.html.template
+    favicon_url = config.get(CONF_FAVICON)
+    if favicon_url:
+        subs["favicon_ico"] = f'href="{html_escape(favicon_url)}"'
+
+    head: list[str] = []
+    if logo_src:
+        head.append(_stylesheet(asset_url(assets, LOGO_STYLE)))
+    favicon_to_use = favicon_url or logo_url
+    if favicon_to_use:
+        head.append(_favicon_links(favicon_to_use, logo_url or favicon_to_use) + "\n")
+
+    # Validate color to prevent CSS injection attacks; the script sets the
+    # derived palette as custom properties before the stylesheet applies
+    primary_color = validate_color(config.get(CONF_PRIMARY_COLOR))
+    if primary_color and (palette := derive_palette(primary_color)):
+        head.append(_stylesheet(asset_url(assets, AUTH_STYLE)))
+        head.append(
+            _script(
+                asset_url(assets, AUTH_SCRIPT),
+                {
+                    "primary-color": palette["primary"],
+                    "palette": json.dumps(dict(palette), separators=(",", ":")),
+                },
+            )
+        )
+
+    if head:
+        subs["head"] = "".join(head) + "</head>"
+    return subs
+
+
+def _index_page_substitutions(
+    config: Mapping[str, Any],
+    color_scheme: str | None,
+    assets: Mapping[str, str] | None,
+) -> dict[str, Replacement]:
+    """Build substitutions for the index (launch screen) template."""
+    subs: dict[str, Replacement] = {}
+    head: list[str] = []
+
+    # Always inject OHF hiding CSS if configured (independent of logo)
+    if config.get(CONF_HIDE_OPEN_HOME_FOUNDATION, True):
+        head.append(_stylesheet(asset_url(assets, OHF_STYLE)))
+
+    # Only inject logo replacement if we have a logo configured
+    logo = config.get(CONF_LOGO)
+    if logo:
+        logo_dark = config.get(CONF_LOGO_DARK) or logo
+        system_name = config.get(CONF_SYSTEM_NAME, DEFAULT_SYSTEM_NAME)
+
+        # Replace the launch screen SVG with an img tag; explicit dimensions
+        # let the browser reserve its box before the image arrives
+        src, dark_src = _select_logo(config, color_scheme)
+        dimensions = ""
+        if size := image_size(config, src):
+            dimensions = f' width="{size[0]}" height="{size[1]}"'
+        subs["launch_logo"] = _logo_picture(
+            config,
+            f'<img src="{html_escape(src)}" alt="{html_escape(system_name)}" '
+            f'class="ha-rebrand-logo"{dimensions}>',
+            dark_src,
+        )
+        # The script puts the logo back if the frontend recreates the SVG
+        head.append(_stylesheet(asset_url(assets, LAUNCH_STYLE)))
+        head.append(
+            _script(
+                asset_url(assets, LAUNCH_SCRIPT),
+                {"logo": logo, "logo-dark": logo_dark, "name": system_name},
+                defer=True,
+            )
+        )
+
+    if head:
+        subs["head"] = "".join(head) + "</head>"
+    return subs
+
+
+AUTHORIZE_PAGE = BrandedPage(
+    "authorize",
+    PageRewriter(_AUTH_PAGE_RULES),
+    _auth_page_substitutions,
+)
+
+ONBOARDING_PAGE = BrandedPage(
+    "onboarding",
+    PageRewriter(_AUTH_PAGE_RULES),
+    _auth_page_substitutions,
+)
+
+INDEX_PAGE = BrandedPage(
+    "index",
+    PageRewriter(_INDEX_PAGE_RULES),
+    _index_page_substitutions,
+)
@@ -0,0 +1,194 @@
+"""Primary color palette derivation for HA Rebrand.
+
+Shades are derived from the configured primary color once per color, in
+OKLCH so that lightness steps look even across hues, and text colors are
+picked by WCAG contrast. Every surface (login and onboarding pages, the
+frontend injector) applies the same precomputed values, so browsers do no
+color math.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
+# Frontend CSS variables set from the palette, by palette entry. Keep in
+# sync with static/ha-rebrand-auth.css, which maps the same variables.
+PALETTE_VARIABLES = {
+    "--primary-color": "primary",
+    "--light-primary-color": "primary-light",
+    "--dark-primary-color": "primary-dark",
+    "--text-primary-color": "on-primary",
+    "--mdc-theme-primary": "primary",
+    "--mdc-theme-on-primary": "on-primary",
+    "--ha-color-fill-primary-loud-resting": "primary",
+    "--ha-color-fill-primary-loud-hover": "primary-hover",
+    "--ha-color-fill-primary-loud-active": "primary-active",
+    "--ha-color-fill-primary-normal-resting": "primary-normal",
+    "--ha-color-fill-primary-normal-hover": "primary-normal-hover",
+    "--ha-color-fill-primary-normal-active": "primary-normal-active",
+    "--ha-color-on-primary-loud": "on-primary",
+    "--ha-color-on-primary-normal": "on-primary-normal",
+}
+
+# Lightness change of the hover and pressed states of primary fills
+STATE_STEP = 0.05
+# Below this lightness states get lighter instead of darker
+DARK_PRIMARY = 0.3
+
+# Tinted fills as (lightness, share of the primary's chroma)
+_LIGHT = (0.9, 0.35)
+_NORMAL = (0.94, 0.2)
+_NORMAL_HOVER = (0.91, 0.3)
+_NORMAL_ACTIVE = (0.88, 0.4)
+
+MIN_TEXT_CONTRAST = 4.5
+
+_HEX_COLOR = re.compile(r"^#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})$")
+
+_WHITE = "#ffffff"
+_BLACK = "#000000"
+
+type RGB = tuple[float, float, float]
+
+
+def _parse_hex(color: str) -> RGB:
+    """Return the sRGB channels of #RGB, #RRGGBB or #RRGGBBAA in 0..1."""
+    digits = color.lstrip("#")
+    if len(digits) == 3:
+        digits = "".join(digit * 2 for digit in digits)
+    return tuple(int(digits[i : i + 2], 16) / 255 for i in (0, 2, 4))  # type: ignore[return-value]
+
+
+def _to_hex(rgb: RGB) -> str:
+    return "#" + "".join(
+        f"{round(min(1.0, max(0.0, channel)) * 255):02x}" for channel in rgb
+    )
+
+
+def _to_linear(channel: float) -> float:
+    if channel <= 0.04045:
+        return channel / 12.92
+    return ((channel + 0.055) / 1.055) ** 2.4
+
+
+def _from_linear(channel: float) -> float:
+    if channel <= 0.0031308:
+        return channel * 12.92
+    return 1.055 * channel ** (1 / 2.4) - 0.055
+
+
+def _to_oklch(rgb: RGB) -> tuple[float, float, float]:
+    """Convert sRGB to OKLCH (lightness, chroma, hue in radians)."""
+    r, g, b = (_to_linear(channel) for channel in rgb)
+    l_ = math.cbrt(0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b)
+    m_ = math.cbrt(0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b)
+    s_ = math.cbrt(0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b)
+    lightness = 0.2104542553 * l_ + 0.7936177850 * m_ - 0.0040720468 * s_
+    a = 1.9779984951 * l_ - 2.4285922050 * m_ + 0.4505937099 * s_
+    b_ = 0.0259040371 * l_ + 0.7827717662 * m_ - 0.8086757660 * s_
+    return lightness, math.hypot(a, b_), math.atan2(b_, a)
+
+
+def _oklch_to_linear(lightness: float, chroma: float, hue: float) -> RGB:
+    a = chroma * math.cos(hue)
+    b = chroma * math.sin(hue)
+    l_ = lightness + 0.3963377774 * a + 0.2158037573 * b
+    m_ = lightness - 0.1055613458 * a - 0.0638541728 * b
+    s_ = lightness - 0.0894841775 * a - 1.2914855480 * b
+    l, m, s = l_**3, m_**3, s_**3
+    return (
+        4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s,
+        -1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s,
+        -0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s,
+    )
+
+
+def _in_gamut(linear: RGB) -> bool:
+    return all(-1e-4 <= channel <= 1 + 1e-4 for channel in linear)
+
+
+def _from_oklch(lightness: float, chroma: float, hue: float) -> str:
+    """Convert OKLCH to hex, reducing chroma until it fits in sRGB."""
+    lightness = min(1.0, max(0.0, lightness))
+    linear = _oklch_to_linear(lightness, chroma, hue)
+    if not _in_gamut(linear):
+        low, high = 0.0, chroma
+        for _ in range(20):
+            mid = (low + high) / 2
+            if _in_gamut(_oklch_to_linear(lightness, mid, hue)):
+                low = mid
+            else:
+                high = mid
+        linear = _oklch_to_linear(lightness, low, hue)
+    return _to_hex(tuple(_from_linear(max(0.0, c)) for c in linear))  # type: ignore[arg-type]
+
+
+def _luminance(color: str) -> float:
+    """Return the WCAG relative luminance of a hex color."""
+    r, g, b = (_to_linear(channel) for channel in _parse_hex(color))
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+def contrast_ratio(first: str, second: str) -> float:
+    """Return the WCAG contrast ratio between two hex colors."""
+    lighter, darker = sorted((_luminance(first), _luminance(second)), reverse=True)
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+def _text_on(background: str) -> str:
+    """Return white or black, whichever reads better on background."""
+    if contrast_ratio(_WHITE, background) >= contrast_ratio(_BLACK, background):
+        return _WHITE
+    return _BLACK
+
+
+def _tinted_text(background: str, chroma: float, hue: float) -> str:
+    """Return the lightest shade of the hue readable on a light background."""
+    lightness = 0.45
+    while lightness > 0:
+        color = _from_oklch(lightness, chroma, hue)
+        if contrast_ratio(color, background) >= MIN_TEXT_CONTRAST:
+            return color
+        lightness -= STATE_STEP
+    return _BLACK
+
+
+@lru_cache(maxsize=32)
+def derive_palette(color: str | None) -> Mapping[str, str] | None:
+    """Return the palette derived from a primary color, None if invalid.
+
+    The alpha of #RRGGBBAA colors is ignored.
+    """
+    if not isinstance(color, str) or not _HEX_COLOR.match(color):
+        return None
+    base = _to_hex(_parse_hex(color))
+    lightness, chroma, hue = _to_oklch(_parse_hex(base))
+    step = -STATE_STEP if lightness >= DARK_PRIMARY else STATE_STEP
+
+    def tint(level: tuple[float, float]) -> str:
+        return _from_oklch(level[0], chroma * level[1], hue)
+
+    normal = tint(_NORMAL)
+    return MappingProxyType(
+        {
+            "primary": base,
+            "primary-light": tint(_LIGHT),
+            "primary-dark": _from_oklch(max(0.05, lightness - 0.1), chroma, hue),
+            "primary-hover": _from_oklch(lightness + step, chroma, hue),
+            "primary-active": _from_oklch(lightness + 2 * step, chroma, hue),
+            "primary-normal": normal,
+            "primary-normal-hover": tint(_NORMAL_HOVER),
+            "primary-normal-active": tint(_NORMAL_ACTIVE),
+            "on-primary": _text_on(base),
+            "on-primary-normal": _tinted_text(normal, chroma, hue),
+        }
+    )
+
+
+def palette_variables(palette: Mapping[str, str]) -> dict[str, str]:
+    """Return the frontend CSS variables set from a palette."""
+    return {name: palette[entry] for name, entry in PALETTE_VARIABLES.items()}
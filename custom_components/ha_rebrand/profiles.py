@@ -0,0 +1,97 @@
+"""Host-based branding profiles for HA Rebrand."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping
+from typing import Any
+
+from .const import (
+    BRANDING_KEYS,
+    CONF_BROWSER_TAB_TITLE,
+    CONF_HOSTS,
+    CONF_IMAGE_SIZES,
+    CONF_SIDEBAR_TEXT,
+    CONF_SYSTEM_NAME,
+    CONF_TRANSLATIONS,
+    DEFAULT_PROFILE,
+)
+from .locales import LOCALIZED_KEYS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Derived keys kept next to the raw profiles in hass.data[DOMAIN]
+PROFILE_CONFIGS = "profile_configs"
+PROFILE_HOSTS = "profile_hosts"
+
+
+def normalize_host(host: str | None) -> str:
+    """Return host lowercased and without a port."""
+    if not host:
+        return ""
+    host = host.strip().lower()
+    if host.startswith("["):
+        # Bracketed IPv6 literal, optionally followed by a port
+        return host[: host.find("]") + 1] if "]" in host else host
+    if host.count(":") == 1:
+        return host.partition(":")[0]
+    return host
+
+
+def build_profiles(
+    base: Mapping[str, Any], profiles: Mapping[str, Any]
+) -> tuple[dict[str, dict[str, Any]], dict[str, str]]:
+    """Merge every profile over the base config and index profiles by host.
+
+    Profile keys that are missing or None inherit the base value. A profile
+    that renames the system without setting the sidebar text or tab title
+    uses its own system name for those too, and a profile that overrides any
+    localized name without its own translations drops the inherited ones.
+    """
+    configs: dict[str, dict[str, Any]] = {}
+    hosts: dict[str, str] = {}
+
+    for name, overrides in profiles.items():
+        if name == DEFAULT_PROFILE or not isinstance(overrides, Mapping):
+            _LOGGER.warning("HA Rebrand: Ignoring invalid profile '%s'", name)
+            continue
+
+        merged = {key: base.get(key) for key in BRANDING_KEYS}
+        merged[CONF_IMAGE_SIZES] = base.get(CONF_IMAGE_SIZES)
+        merged.update(
+            (key, value)
+            for key, value in overrides.items()
+            if key in BRANDING_KEYS and value is not None
+        )
+        if overrides.get(CONF_SYSTEM_NAME) is not None:
+            for key in (CONF_SIDEBAR_TEXT, CONF_BROWSER_TAB_TITLE):
+                if overrides.get(key) is None:
+                    merged[key] = overrides[CONF_SYSTEM_NAME]
+        if overrides.get(CONF_TRANSLATIONS) is None and any(
+            overrides.get(key) is not None for key in LOCALIZED_KEYS
+        ):
+            merged[CONF_TRANSLATIONS] = None
+        configs[name] = merged
+
+        for host in overrides.get(CONF_HOSTS) or ():
+            host = normalize_host(host)
+            if host in hosts:
+                _LOGGER.warning(
+                    "HA Rebrand: Host '%s' is claimed by profiles '%s' and '%s'",
+                    host,
+                    hosts[host],
+                    name,
+                )
+            hosts[host] = name
+
+    return configs, hosts
+
+
+def resolve_profile(
+    data: Mapping[str, Any], host: str | None
+) -> tuple[str, Mapping[str, Any]]:
+    """Return the profile name and config that apply to a request host."""
+    name = data.get(PROFILE_HOSTS, {}).get(normalize_host(host))
+    if name is None:
+        return DEFAULT_PROFILE, data
+    return name, data[PROFILE_CONFIGS][name]
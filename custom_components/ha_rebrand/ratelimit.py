@@ -0,0 +1,44 @@
+"""Per-client admission control for unauthenticated HA Rebrand endpoints."""
+
+from __future__ import annotations
+
+import time
+
+# Upper bound on tracked clients; the least recently seen are evicted first
+MAX_TRACKED_CLIENTS = 4096
+
+
+class TokenBucketLimiter:
+    """Token bucket rate limiter keyed by client address.
+
+    Each client may burst up to ``burst`` requests and then refills at
+    ``rate`` tokens per second. Buckets are kept in least-recently-seen
+    order so the table stays bounded under address churn.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize the limiter."""
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def acquire(self, key: str) -> float:
+        """Take a token for key.
+
+        Returns 0 when the request is admitted, otherwise the number of
+        seconds until a token becomes available.
+        """
+        now = time.monotonic()
+        tokens, last = self._buckets.pop(key, (float(self.burst), now))
+        tokens = min(float(self.burst), tokens + (now - last) * self.rate)
+
+        if tokens >= 1:
+            retry_after = 0.0
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / self.rate
+
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > MAX_TRACKED_CLIENTS:
+            del self._buckets[next(iter(self._buckets))]
+        return retry_after
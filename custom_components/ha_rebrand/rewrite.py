@@ -0,0 +1,88 @@
+"""Single-pass HTML rewrite engine for branded pages."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+
+# A fixed string, or a function of the matched text
+type Replacement = str | Callable[[str], str]
+
+
+@dataclass(frozen=True, slots=True)
+class RewriteRule:
+    """A declarative substitution applied to a page template.
+
+    The pattern is matched literally unless ``regex`` is set. A ``count`` of
+    zero rewrites every occurrence, otherwise only the first ``count`` ones.
+    """
+
+    name: str
+    pattern: str
+    regex: bool = False
+    count: int = 0
+
+
+class PageRewriter:
+    """Rewrite a document in one pass using a compiled multi-pattern matcher.
+
+    All rules are compiled once into a single alternation with one named group
+    per rule, so a document is scanned once no matter how many substitutions a
+    page declares, and the output is assembled with a single join.
+    """
+
+    def __init__(self, rules: Iterable[RewriteRule]) -> None:
+        """Compile the rules into one matcher."""
+        self.rules = tuple(rules)
+        self._limits = {rule.name: rule.count for rule in self.rules if rule.count}
+        self._pattern = re.compile(
+            "|".join(
+                f"(?P<{rule.name}>"
+                f"{rule.pattern if rule.regex else re.escape(rule.pattern)})"
+                for rule in self.rules
+            ),
+            re.DOTALL,
+        )
+
+    def matches(self, html: str) -> dict[str, int]:
+        """Return how often each rule matches html, ignoring count limits."""
+        counts = dict.fromkeys((rule.name for rule in self.rules), 0)
+        for match in self._pattern.finditer(html):
+            if match.lastgroup:
+                counts[match.lastgroup] += 1
+        return counts
+
+    def rewrite(self, html: str, replacements: Mapping[str, Replacement]) -> str:
+        """Return html with every matched rule replaced.
+
+        Rules without an entry in replacements leave their match untouched.
+        Callable replacements receive the matched text.
+        """
+        if not replacements:
+            return html
+
+        parts: list[str] = []
+        seen: dict[str, int] = {}
+        pos = 0
+        for match in self._pattern.finditer(html):
+            name = match.lastgroup
+            replacement = replacements.get(name) if name else None
+            if replacement is None:
+                continue
+            limit = self._limits.get(name)
+            if limit:
+                hits = seen.get(name, 0)
+                if hits >= limit:
+                    continue
+                seen[name] = hits + 1
+            parts.append(html[pos : match.start()])
+            parts.append(
+                replacement(match.group()) if callable(replacement) else replacement
+            )
+            pos = match.end()
+
+        if not parts:
+            return html
+        parts.append(html[pos:])
+        return "".join(parts)
@@ -0,0 +1,63 @@
+"""Path-keyed route overrides for HA Rebrand."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+
+from aiohttp import web
+from homeassistant.core import CALLBACK_TYPE, callback
+
+type Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+class RouteOverrides:
+    """Table of GET handlers that take precedence over existing routes.
+
+    A middleware consults the table with a single dict lookup per request, so
+    pages owned by other components (e.g. ``/auth/authorize``) can be replaced
+    and restored at runtime without touching router internals.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the override table."""
+        self._handlers: dict[str, Handler] = {}
+        self.installed = False
+
+    @callback
+    def async_install(self, app: web.Application) -> bool:
+        """Install the middleware.
+
+        aiohttp freezes middlewares when the server starts, so this returns
+        False if the app is already running.
+        """
+        if self.installed:
+            return True
+        if app.frozen:
+            return False
+        app.middlewares.append(self._middleware)
+        self.installed = True
+        return True
+
+    @callback
+    def async_override(self, path: str, handler: Handler) -> CALLBACK_TYPE:
+        """Serve path with handler until the returned callback is called."""
+        self._handlers[path] = handler
+
+        @callback
+        def _remove() -> None:
+            if self._handlers.get(path) is handler:
+                del self._handlers[path]
+
+        return _remove
+
+    @web.middleware
+    async def _middleware(
+        self, request: web.Request, handler: Handler
+    ) -> web.StreamResponse:
+        """Dispatch overridden paths, pass everything else through."""
+        if (
+            request.method in ("GET", "HEAD")
+            and (override := self._handlers.get(request.path)) is not None
+        ):
+            return await override(request)
+        return await handler(request)
@@ -0,0 +1,87 @@
+/**
+ * HA Rebrand - primary color for the login and onboarding pages.
+ *
+ * Loaded as a blocking script in <head> with the color in
+ * data-primary-color and its palette, derived by the server, in
+ * data-palette. Sets each palette entry as --ha-rebrand-<entry> for
+ * ha-rebrand-auth.css and recolors the tsParticles background. The
+ * particles engine is patched the moment it is assigned to
+ * window.tsParticles, through a one-shot setter, so no timers or observers
+ * are needed.
+ */
+(function () {
+  var script = document.currentScript;
+  var customColor = script && script.dataset.primaryColor;
+  if (!customColor) return;
+
+  var palette = {};
+  try {
+    palette = JSON.parse(script.dataset.palette || "{}");
+  } catch (e) {}
+  var root = document.documentElement.style;
+  root.setProperty("--ha-rebrand-primary", customColor);
+  for (var entry in palette) {
+    root.setProperty("--ha-rebrand-" + entry, palette[entry]);
+  }
+
+  function recolor(options) {
+    var particles = options && options.particles;
+    if (!particles) return false;
+    particles.color = { value: customColor };
+    if (particles.links) {
+      particles.links.color = { value: customColor };
+    }
+    return true;
+  }
+
+  function patch(engine) {
+    if (!engine || typeof engine.load !== "function" || engine.__haRebrandPatched) return;
+    engine.__haRebrandPatched = true;
+
+    var origLoad = engine.load;
+    engine.load = function (params) {
+      // load({ id, options }) and the older load(id, options)
+      if (params && typeof params === "object") {
+        recolor(params.options);
+      } else {
+        recolor(arguments[1]);
+      }
+      return origLoad.apply(this, arguments);
+    };
+
+    // Containers created before the patch, recolored once
+    var containers = typeof engine.dom === "function" ? engine.dom() : [];
+    for (var i = 0; i < containers.length; i++) {
+      try {
+        if (recolor(containers[i] && containers[i].options)) {
+          containers[i].refresh();
+        }
+      } catch (e) {}
+    }
+  }
+
+  if (typeof window.tsParticles !== "undefined") {
+    patch(window.tsParticles);
+    return;
+  }
+
+  // Wait for the engine to define its global, then step out of the way
+  try {
+    Object.defineProperty(window, "tsParticles", {
+      configurable: true,
+      enumerable: true,
+      get: function () {
+        return undefined;
+      },
+      set: function (engine) {
+        Object.defineProperty(window, "tsParticles", {
+          configurable: true,
+          enumerable: true,
+          writable: true,
+          value: engine,
+        });
+        patch(engine);
+      },
+    });
+  } catch (e) {}
+})();
@@ -0,0 +1,46 @@
+/**
+ * HA Rebrand - launch screen logo backup.
+ *
+ * Loaded deferred with data-logo, data-logo-dark and data-name on its
+ * <script> tag. Puts the logo back if the frontend recreates the stock SVG.
+ * With a dark logo the replacement is a <picture> whose dark <source> the
+ * browser picks by prefers-color-scheme, as in the server-rendered markup.
+ */
+(function () {
+  var data = document.currentScript ? document.currentScript.dataset : {};
+  var logo = data.logo, logoD = data.logoDark, brand = data.name || "";
+  if (!logo) return;
+
+  function logoElement() {
+    var img = document.createElement("img");
+    img.src = logo;
+    img.alt = brand;
+    img.className = "ha-rebrand-logo";
+    if (!logoD || logoD === logo) return img;
+    var picture = document.createElement("picture");
+    var source = document.createElement("source");
+    source.srcset = logoD;
+    source.media = "(prefers-color-scheme: dark)";
+    picture.appendChild(source);
+    picture.appendChild(img);
+    return picture;
+  }
+
+  function fix() {
+    var ls = document.getElementById("ha-launch-screen");
+    if (!ls) return;
+    var svg = ls.querySelector("svg");
+    if (svg) { svg.style.display = "none"; svg.style.visibility = "hidden"; }
+    var img = ls.querySelector("img.ha-rebrand-logo");
+    if (!img) {
+      var el = logoElement();
+      if (svg) { svg.parentNode.insertBefore(el, svg); }
+      else { ls.insertBefore(el, ls.firstChild); }
+    }
+  }
+
+  fix();
+  var obs = new MutationObserver(fix);
+  obs.observe(document.body, { childList: true, subtree: true });
+  setTimeout(function () { obs.disconnect(); }, 15000);
+})();
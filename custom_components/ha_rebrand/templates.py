@@ -0,0 +1,160 @@
+"""Cache of hass_frontend page templates for HA Rebrand."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from importlib import metadata
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant, callback
+
+from .executor import IOExecutor
+
+_LOGGER = logging.getLogger(__name__)
+
+FRONTEND_PACKAGE = "home-assistant-frontend"
+TEMPLATE_NAMES = ("authorize.html", "onboarding.html")
+
+# Minimum seconds between freshness checks of the cached templates
+REVALIDATE_INTERVAL = 60
+
+
+@dataclass(slots=True)
+class _Template:
+    """A template read from hass_frontend and the fingerprint it was read at."""
+
+    html: str
+    version: str | None
+    mtime_ns: int
+
+
+def _read_templates(
+    names: tuple[str, ...], fingerprints: dict[str, tuple[str | None, int]]
+) -> dict[str, _Template]:
+    """Read templates that are missing or no longer match their fingerprint."""
+    try:
+        import hass_frontend
+    except ImportError:
+        _LOGGER.warning("Could not import hass_frontend package")
+        return {}
+
+    try:
+        version: str | None = metadata.version(FRONTEND_PACKAGE)
+    except metadata.PackageNotFoundError:
+        version = None
+
+    root = Path(hass_frontend.__file__).parent
+    updated: dict[str, _Template] = {}
+    for name in names:
+        path = root / name
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+            if fingerprints.get(name) == (version, mtime_ns):
+                continue
+            updated[name] = _Template(path.read_text("utf-8"), version, mtime_ns)
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            _LOGGER.warning("Error reading %s: %s", name, e)
+    return updated
+
+
+class FrontendTemplates:
+    """Preloaded hass_frontend templates, reloaded when the frontend changes.
+
+    Templates are validated against the installed frontend version and the
+    file mtime. Lookups never block: a stale check is scheduled in the
+    background at most once per REVALIDATE_INTERVAL and the current copy is
+    served until the reload completes.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        executor: IOExecutor,
+        names: tuple[str, ...] = TEMPLATE_NAMES,
+    ) -> None:
+        """Initialize the template cache."""
+        self.hass = hass
+        self._executor = executor
+        self._names = names
+        self._templates: dict[str, _Template] = {}
+        self._last_check = 0.0
+        self._load_task: asyncio.Task[None] | None = None
+        # Bumped whenever any template changes, for keying rendered pages
+        self.revision = 0
+
+    async def async_load(self) -> None:
+        """Load any missing or stale templates.
+
+        Concurrent callers share a single in-flight read.
+        """
+        if self._load_task is None:
+            self._load_task = self._async_start_load()
+        await asyncio.shield(self._load_task)
+
+    @callback
+    def async_get(self, name: str) -> str | None:
+        """Return a cached template, scheduling a freshness check if due."""
+        if (
+            self._load_task is None
+            and time.monotonic() - self._last_check > REVALIDATE_INTERVAL
+        ):
+            self._load_task = self._async_start_load()
+        tpl = self._templates.get(name)
+        return tpl.html if tpl else None
+
+    async def async_get_or_load(self, name: str) -> str | None:
+        """Return a template, waiting for a reload if it is missing.
+
+        A missing template is only looked for again once per
+        REVALIDATE_INTERVAL, so requests made meanwhile don't each read
+        from disk.
+        """
+        if (html := self.async_get(name)) is None and self._load_task is not None:
+            await asyncio.shield(self._load_task)
+            html = self.async_get(name)
+        return html
+
+    @callback
+    def _async_start_load(self) -> asyncio.Task[None]:
+        """Start a background load task."""
+        return self.hass.async_create_background_task(
+            self._async_load(), "ha_rebrand template load"
+        )
+
+    async def _async_load(self) -> None:
+        """Read changed templates in the executor and swap them in."""
+        fingerprints = {
+            name: (tpl.version, tpl.mtime_ns) for name, tpl in self._templates.items()
+        }
+        self._last_check = time.monotonic()
+        try:
+            updated = await self._executor.async_run(
+                _read_templates, self._names, fingerprints
+            )
+        finally:
+            self._load_task = None
+
+        for name, tpl in updated.items():
+            previous = self._templates.get(name)
+            if previous is not None:
+                _LOGGER.info(
+                    "HA Rebrand: Reloaded %s after frontend change (%s -> %s)",
+                    name,
+                    previous.version,
+                    tpl.version,
+                )
+            self._templates[name] = tpl
+        if updated:
+            self.revision += 1
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel any pending background load."""
+        if self._load_task is not None:
+            self._load_task.cancel()
+            self._load_task = None
@@ -0,0 +1,173 @@
+"""Resumable chunked uploads over the websocket API for HA Rebrand.
+
+An upload is started with ``upload_begin``, sent as a sequence of chunks at
+increasing offsets and finished with ``upload_commit``. Chunks are appended
+to a staging file next to the uploads, so an interrupted upload resumes from
+the last acknowledged offset instead of starting over.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import secrets
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from .image import SNIFF_SIZE, HeaderIncomplete, ImageInfo, validate_image
+
+# Suggested chunk size; base64 encoding adds a third on the wire
+CHUNK_SIZE = 256 * 1024
+MAX_CHUNK_SIZE = 1024 * 1024
+
+# Sessions idle for longer than this are discarded
+UPLOAD_TTL = 3600
+
+STAGING_PREFIX = ".upload-"
+
+
+class UploadError(Exception):
+    """Raised when a chunked upload request can't be applied."""
+
+    def __init__(self, code: str, message: str) -> None:
+        """Initialize the error with a websocket error code."""
+        super().__init__(message)
+        self.code = code
+
+
+@dataclass(slots=True)
+class UploadSession:
+    """State of one chunked upload."""
+
+    upload_id: str
+    user_id: str
+    profile: str
+    file_type: str
+    ext: str
+    size: int
+    staging_path: str
+    offset: int = 0
+    info: ImageInfo | None = None
+    head: bytearray = field(default_factory=bytearray)
+    # Bytes kept for the header; grows when it continues past SNIFF_SIZE
+    head_size: int = SNIFF_SIZE
+    digest: Any = field(default_factory=hashlib.sha256)
+    updated: float = field(default_factory=time.monotonic)
+    # Serializes chunks so offsets are checked and advanced atomically
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def check_chunk(self, offset: int, data: bytes, sha256: str | None) -> bool:
+        """Validate a chunk before it is written.
+
+        Returns False for a chunk that was already stored (a retry after a
+        lost acknowledgement), which is acknowledged without writing.
+        """
+        if offset < self.offset:
+            return False
+        if offset > self.offset:
+            raise UploadError(
+                "offset_mismatch", f"Expected offset {self.offset}, got {offset}"
+            )
+        if sha256 is not None and hashlib.sha256(data).hexdigest() != sha256.lower():
+            raise UploadError("checksum_mismatch", "Chunk checksum does not match")
+        if offset + len(data) > self.size:
+            raise UploadError("too_large", "Chunk exceeds the declared file size")
+        # Check the image header as soon as enough of it has arrived
+        if self.info is None:
+            head = bytes(self.head) + data
+            last = offset + len(data) == self.size
+            while self.info is None and (len(head) >= self.head_size or last):
+                try:
+                    self.info = validate_image(head[: self.head_size], self.ext)
+                except HeaderIncomplete as err:
+                    if err.size <= self.head_size:
+                        raise
+                    self.head_size = err.size
+        return True
+
+    def advance(self, data: bytes) -> None:
+        """Record a chunk as written."""
+        if self.info is None and len(self.head) < self.head_size:
+            self.head.extend(data[: self.head_size - len(self.head)])
+        self.digest.update(data)
+        self.offset += len(data)
+        self.updated = time.monotonic()
+
+    @property
+    def complete(self) -> bool:
+        """Return True once every byte has been received."""
+        return self.offset == self.size
+
+
+class ChunkedUploads:
+    """In-memory table of the chunked uploads in progress."""
+
+    def __init__(self) -> None:
+        """Initialize the table."""
+        self._sessions: dict[str, UploadSession] = {}
+
+    def begin(
+        self,
+        user_id: str,
+        profile: str,
+        file_type: str,
+        ext: str,
+        size: int,
+        staging_dir: str,
+    ) -> UploadSession:
+        """Start a new upload session."""
+        upload_id = secrets.token_hex(16)
+        session = UploadSession(
+            upload_id=upload_id,
+            user_id=user_id,
+            profile=profile,
+            file_type=file_type,
+            ext=ext,
+            size=size,
+            staging_path=os.path.join(staging_dir, f"{STAGING_PREFIX}{upload_id}"),
+        )
+        self._sessions[upload_id] = session
+        return session
+
+    def get(self, upload_id: str, user_id: str) -> UploadSession:
+        """Return a user's upload session."""
+        session = self._sessions.get(upload_id)
+        if session is None or session.user_id != user_id:
+            raise UploadError("not_found", "Unknown or expired upload")
+        return session
+
+    def pop(self, upload_id: str) -> UploadSession | None:
+        """Remove an upload session."""
+        return self._sessions.pop(upload_id, None)
+
+    def pop_expired(self) -> list[UploadSession]:
+        """Remove and return the sessions idle for longer than the TTL."""
+        cutoff = time.monotonic() - UPLOAD_TTL
+        expired = [s for s in self._sessions.values() if s.updated < cutoff]
+        for session in expired:
+            del self._sessions[session.upload_id]
+        return expired
+
+
+def create_staging(path: str) -> None:
+    """Create an empty staging file."""
+    with open(path, "wb"):
+        pass
+
+
+def write_chunk(path: str, offset: int, data: bytes) -> None:
+    """Write a chunk into a staging file at offset."""
+    with open(path, "r+b") as file:
+        file.seek(offset)
+        file.write(data)
+        file.truncate()
+
+
+def remove_staging(path: str) -> None:
+    """Delete a staging file if it still exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
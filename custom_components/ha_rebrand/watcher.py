@@ -0,0 +1,144 @@
+"""Watch config.json for changes made outside of HA Rebrand."""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Callable, Coroutine
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_time_interval
+
+from .executor import IOExecutor
+
+_LOGGER = logging.getLogger(__name__)
+
+# Changes arriving within this many seconds are applied once
+WATCH_DEBOUNCE = 1.0
+
+# Used when watchdog isn't installed
+POLL_INTERVAL = timedelta(seconds=5)
+
+
+def _fingerprint(path: str) -> tuple[int, int] | None:
+    """Return the modification time and size of path, None if missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ConfigFileWatcher:
+    """Call back, debounced, when a file changes on disk.
+
+    Uses watchdog's native observer (inotify on Linux) when the package is
+    installed, and otherwise polls the file's modification time and size.
+    The callback decides whether the change is relevant; our own writes
+    also trigger it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        executor: IOExecutor,
+        path: str,
+        on_change: Callable[[], Coroutine[Any, Any, None]],
+    ) -> None:
+        """Initialize the watcher."""
+        self.hass = hass
+        self._executor = executor
+        self.path = path
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=WATCH_DEBOUNCE,
+            immediate=False,
+            function=on_change,
+        )
+        self._observer: Any = None
+        self._unsub_poll: CALLBACK_TYPE | None = None
+        self._last_fingerprint: tuple[int, int] | None = None
+
+    @property
+    def mode(self) -> str | None:
+        """Return how the file is watched, None when stopped."""
+        if self._observer is not None:
+            return "native"
+        if self._unsub_poll is not None:
+            return "polling"
+        return None
+
+    async def async_start(self) -> None:
+        """Start watching, natively if possible."""
+        try:
+            self._observer = await self.hass.async_add_executor_job(
+                self._start_observer
+            )
+        except ImportError:
+            _LOGGER.debug("HA Rebrand: watchdog not available, polling %s", self.path)
+        except OSError as err:
+            _LOGGER.warning(
+                "HA Rebrand: Could not watch %s, polling instead: %s", self.path, err
+            )
+        if self._observer is None:
+            self._last_fingerprint = await self._executor.async_run(
+                _fingerprint, self.path
+            )
+            self._unsub_poll = async_track_time_interval(
+                self.hass, self._async_poll, POLL_INTERVAL
+            )
+
+    def _start_observer(self) -> Any:
+        """Start a watchdog observer on the file's directory."""
+        from watchdog.events import (
+            FileSystemEvent,
+            FileSystemEventHandler,
+        )
+        from watchdog.observers import Observer
+
+        path = self.path
+        schedule = self._debouncer.async_schedule_call
+        loop = self.hass.loop
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event: FileSystemEvent) -> None:
+                # Atomic writes show up as a move onto the file
+                if not event.is_directory and path in (
+                    os.fsdecode(event.src_path),
+                    os.fsdecode(getattr(event, "dest_path", "") or ""),
+                ):
+                    loop.call_soon_threadsafe(schedule)
+
+        observer = Observer()
+        observer.schedule(_Handler(), os.path.dirname(path), recursive=False)
+        observer.daemon = True
+        observer.start()
+        return observer
+
+    async def _async_poll(self, now: datetime) -> None:
+        """Schedule the callback if the file's fingerprint changed."""
+        fingerprint = await self._executor.async_run(_fingerprint, self.path)
+        if fingerprint is not None and fingerprint != self._last_fingerprint:
+            self._debouncer.async_schedule_call()
+        self._last_fingerprint = fingerprint
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop watching and drop any pending callback."""
+        if self._unsub_poll is not None:
+            self._unsub_poll()
+            self._unsub_poll = None
+        if (observer := self._observer) is not None:
+            self._observer = None
+            self.hass.async_add_executor_job(_stop_observer, observer)
+        self._debouncer.async_shutdown()
+
+
+def _stop_observer(observer: Any) -> None:
+    """Stop a watchdog observer and wait for its thread."""
+    observer.stop()
+    observer.join()
@@ -0,0 +1,228 @@
+"""Rebranded web app manifest for HA Rebrand.
+
+Installed (home screen) apps take their name and icons from
+``/manifest.json``. The manifest is built from the frontend's own one with
+the branded name, theme color and a generated icon set. Icons are rendered
+once per logo content and named after its hash, so they can be cached
+forever.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import io
+import logging
+import math
+import os
+import re
+import tempfile
+from collections.abc import Mapping
+from typing import Any
+
+from .bundle import UPLOADS_URL
+from .const import (
+    CONF_FAVICON,
+    CONF_LOGO,
+    CONF_PRIMARY_COLOR,
+    CONF_SYSTEM_NAME,
+    DEFAULT_SYSTEM_NAME,
+)
+from .pages import image_size
+
+_LOGGER = logging.getLogger(__name__)
+
+ICON_SIZES = (192, 512)
+ICONS_DIR = "icons"
+
+# Maskable icons are cropped to a circle of 80% of their size
+MASKABLE_SAFE_ZONE = 0.8
+DEFAULT_BACKGROUND = "#ffffff"
+
+# Entries of the stock manifest that advertise Home Assistant itself
+_STOCK_ONLY_KEYS = (
+    "screenshots",
+    "related_applications",
+    "prefer_related_applications",
+)
+
+_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+    ".ico": "image/x-icon",
+    ".svg": "image/svg+xml",
+}
+
+_HEX_COLOR = re.compile(r"^#(?:[0-9a-fA-F]{3}){1,2}$")
+
+
+def icon_source(config: Mapping[str, Any]) -> str | None:
+    """Return the uploaded image the icons are generated from."""
+    for key in (CONF_LOGO, CONF_FAVICON):
+        if (url := config.get(key)) and url.startswith(UPLOADS_URL):
+            return url.split("?", 1)[0]
+    return None
+
+
+def icon_background(config: Mapping[str, Any]) -> str:
+    """Return the background color of a profile's maskable icons."""
+    color = config.get(CONF_PRIMARY_COLOR)
+    if isinstance(color, str) and _HEX_COLOR.match(color):
+        return color
+    return DEFAULT_BACKGROUND
+
+
+def _icon_name(stem: str, digest: str, size: int, background: str | None) -> str:
+    # Profiles sharing an image may differ in the maskable background
+    if background is None:
+        return f"{stem}-{digest}-{size}.png"
+    return f"{stem}-{digest}-{size}-maskable-{background.lstrip('#').lower()}.png"
+
+
+def _write_atomic(path: str, content: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _render_icon(image: Any, size: int, maskable: bool, background: str) -> bytes:
+    """Fit an image on a square canvas and return it as PNG."""
+    from PIL import Image
+
+    width, height = image.size
+    if maskable:
+        # Keep the whole image inside the circular safe zone
+        canvas = Image.new("RGBA", (size, size), background)
+        scale = MASKABLE_SAFE_ZONE * size / math.hypot(width, height)
+    else:
+        canvas = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        scale = size / max(width, height)
+    fitted = image.resize(
+        (max(1, round(width * scale)), max(1, round(height * scale))),
+        Image.Resampling.LANCZOS,
+    )
+    canvas.alpha_composite(
+        fitted, ((size - fitted.width) // 2, (size - fitted.height) // 2)
+    )
+    output = io.BytesIO()
+    canvas.save(output, "PNG", optimize=True)
+    return output.getvalue()
+
+
+def generate_icons(
+    uploads_dir: str, source_url: str, background: str
+) -> list[dict[str, str]] | None:
+    """Generate the icon set for an uploaded image.
+
+    Existing icons for the same content are reused and icons of earlier
+    versions of the image are removed. Returns None if Pillow isn't
+    available or can't read the image (e.g. SVG).
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        _LOGGER.debug("HA Rebrand: Pillow not available, not generating icons")
+        return None
+
+    filename = source_url.removeprefix(UPLOADS_URL)
+    source_path = os.path.join(uploads_dir, filename)
+    try:
+        with open(source_path, "rb") as file:
+            content = file.read()
+    except OSError as err:
+        _LOGGER.warning("HA Rebrand: Could not read %s for icons: %s", filename, err)
+        return None
+
+    stem = os.path.splitext(filename)[0]
+    digest = hashlib.md5(content).hexdigest()[:8]
+    icons_dir = os.path.join(uploads_dir, ICONS_DIR)
+    os.makedirs(icons_dir, exist_ok=True)
+
+    image = None
+    icons = []
+    for maskable in (False, True):
+        for size in ICON_SIZES:
+            name = _icon_name(stem, digest, size, background if maskable else None)
+            path = os.path.join(icons_dir, name)
+            if not os.path.exists(path):
+                if image is None:
+                    try:
+                        with Image.open(io.BytesIO(content)) as opened:
+                            image = opened.convert("RGBA")
+                    except (OSError, ValueError) as err:
+                        _LOGGER.debug(
+                            "HA Rebrand: Cannot generate icons from %s: %s",
+                            filename,
+                            err,
+                        )
+                        return None
+                _write_atomic(path, _render_icon(image, size, maskable, background))
+            icons.append(
+                {
+                    "src": f"{UPLOADS_URL}{ICONS_DIR}/{name}",
+                    "sizes": f"{size}x{size}",
+                    "type": "image/png",
+                    "purpose": "maskable" if maskable else "any",
+                }
+            )
+
+    # Icons of earlier versions of this image
+    stale = re.compile(
+        rf"^{re.escape(stem)}-(?!{digest}-)[0-9a-f]{{8}}-\d+"
+        r"(?:-maskable-[0-9a-f]+)?\.png$"
+    )
+    for name in os.listdir(icons_dir):
+        if stale.match(name):
+            try:
+                os.remove(os.path.join(icons_dir, name))
+            except OSError as err:
+                _LOGGER.warning("Could not remove %s: %s", name, err)
+    return icons
+
+
+def fallback_icons(config: Mapping[str, Any]) -> list[dict[str, str]]:
+    """Return icons pointing at the uploaded images themselves."""
+    icons = []
+    for key in (CONF_LOGO, CONF_FAVICON):
+        if not (url := config.get(key)):
+            continue
+        ext = os.path.splitext(url.split("?", 1)[0])[1].lower()
+        if (size := image_size(config, url)) is not None:
+            sizes = f"{size[0]}x{size[1]}"
+        elif ext == ".svg":
+            sizes = "any"
+        else:
+            continue
+        icons.append(
+            {"src": url, "sizes": sizes, "type": _MIME_TYPES.get(ext, "image/png")}
+        )
+    return icons
+
+
+def build_manifest(
+    base: Mapping[str, Any],
+    config: Mapping[str, Any],
+    icons: list[dict[str, str]] | None,
+) -> dict[str, Any]:
+    """Return the stock manifest with a profile's branding applied.
+
+    Without icons (nothing uploaded, or none could be made) the stock icons
+    are kept.
+    """
+    manifest = copy.deepcopy(dict(base))
+    for key in _STOCK_ONLY_KEYS:
+        manifest.pop(key, None)
+    name = config.get(CONF_SYSTEM_NAME) or DEFAULT_SYSTEM_NAME
+    manifest["name"] = manifest["short_name"] = name
+    if (color := config.get(CONF_PRIMARY_COLOR)) and _HEX_COLOR.match(str(color)):
+        manifest["theme_color"] = color
+    if icons:
+        manifest["icons"] = icons
+    return manifest
@@ -0,0 +1,250 @@
+"""Run the branded page rewriters over the golden template corpus.
+
+The rewrite rules in ``pages.py`` match exact upstream strings, so a change
+in the frontend's templates can silently stop branding from applying, or
+make the matcher scan much more. This script renders every template in
+``tools/golden/<frontend version>/`` with a sample config and reports, per page,
+how often each rule matched and how long a render took. Match counts and
+a digest of the output are compared with ``tools/golden/expected.json``.
+
+Usage:
+    python tools/check_templates.py              # check against expected.json
+    python tools/check_templates.py --update     # accept the current results
+    python tools/check_templates.py --extract    # add the installed frontend
+    python tools/check_templates.py --wheel home_assistant_frontend-*.whl
+    python tools/check_templates.py --dump out/  # write the rendered pages
+
+It needs neither Home Assistant nor aiohttp: the page modules are imported
+without running the integration's ``__init__``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib
+import json
+import statistics
+import sys
+import time
+import types
+import zipfile
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+CORPUS_DIR = Path(__file__).resolve().parent / "golden"
+EXPECTED_FILE = CORPUS_DIR / "expected.json"
+PACKAGE_DIR = ROOT / "custom_components" / "ha_rebrand"
+TEMPLATE_NAMES = ("authorize.html", "onboarding.html", "index.html")
+
+# Branding applied to every template, exercising every rule
+SAMPLE_CONFIG: dict[str, Any] = {
+    "system_name": "Acme Home",
+    "logo": "/local/ha_rebrand/logo.png",
+    "logo_dark": "/local/ha_rebrand/logo_dark.png",
+    "favicon": "/local/ha_rebrand/favicon.png",
+    "primary_color": "#e91e63",
+    "hide_open_home_foundation": True,
+    "image_sizes": {
+        "/local/ha_rebrand/logo.png": [512, 256],
+        "/local/ha_rebrand/logo_dark.png": [512, 256],
+    },
+}
+
+# Client color scheme hints each page is rendered for
+COLOR_SCHEMES = (None, "dark")
+
+
+def load_pages() -> types.ModuleType:
+    """Import ha_rebrand.pages without the integration's __init__."""
+    package = types.ModuleType("ha_rebrand")
+    package.__path__ = [str(PACKAGE_DIR)]
+    sys.modules["ha_rebrand"] = package
+    return importlib.import_module("ha_rebrand.pages")
+
+
+def corpus_pages(pages: types.ModuleType) -> dict[str, Any]:
+    """Return the branded pages by template filename."""
+    return {
+        f"{page.name}.html": page
+        for page in (pages.AUTHORIZE_PAGE, pages.ONBOARDING_PAGE, pages.INDEX_PAGE)
+    }
+
+
+def measure(page: Any, html: str, color_scheme: str | None, iterations: int) -> float:
+    """Return the median render time in milliseconds."""
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        page.render(html, SAMPLE_CONFIG, color_scheme)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def run(
+    iterations: int, dump: Path | None
+) -> tuple[dict[str, Any], dict[str, float], list[str]]:
+    """Render the corpus and return the results, render times and a report."""
+    pages = corpus_pages(load_pages())
+    results: dict[str, Any] = {}
+    durations: dict[str, float] = {}
+    report: list[str] = []
+    for release in sorted(p for p in CORPUS_DIR.iterdir() if p.is_dir()):
+        for filename, page in pages.items():
+            path = release / filename
+            if not path.exists():
+                continue
+            html = path.read_text("utf-8")
+            matches = page.rewriter.matches(html)
+            result: dict[str, Any] = {"matches": matches, "output": {}}
+            timings = []
+            for color_scheme in COLOR_SCHEMES:
+                output = page.render(html, SAMPLE_CONFIG, color_scheme)
+                scheme = color_scheme or "none"
+                digest = hashlib.sha256(output.encode()).hexdigest()
+                result["output"][scheme] = digest[:16]
+                timings.append(measure(page, html, color_scheme, iterations))
+                if dump is not None:
+                    target = dump / release.name / f"{page.name}.{scheme}.html"
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    target.write_text(output, "utf-8")
+            key = f"{release.name}/{filename}"
+            results[key] = result
+            durations[key] = max(timings)
+
+            unmatched = [
+                name
+                for name in page.substitutions(SAMPLE_CONFIG, None, None)
+                if not matches.get(name)
+            ]
+            report.append(
+                f"{release.name}/{filename}: {len(html)} chars, "
+                f"{durations[key]:.3f} ms/render"
+            )
+            report.append(
+                "  matched: "
+                + ", ".join(f"{name}={count}" for name, count in matches.items())
+            )
+            if unmatched:
+                report.append(f"  NOT APPLIED: {', '.join(unmatched)}")
+    return results, durations, report
+
+
+def compare(results: dict[str, Any], expected: dict[str, Any]) -> list[str]:
+    """Return the differences between results and the expected results."""
+    problems = []
+    for key, result in results.items():
+        if key not in expected:
+            problems.append(f"{key}: not in expected.json")
+            continue
+        for name, count in result["matches"].items():
+            before = expected[key]["matches"].get(name)
+            if before != count:
+                problems.append(f"{key}: rule {name} matched {count}, was {before}")
+        for scheme, digest in result["output"].items():
+            if expected[key]["output"].get(scheme) != digest:
+                problems.append(f"{key}: output for color scheme {scheme} changed")
+    problems.extend(
+        f"{key}: missing from the corpus" for key in expected if key not in results
+    )
+    return problems
+
+
+def extract() -> int:
+    """Copy the installed frontend's templates into the corpus."""
+    try:
+        from importlib import metadata
+
+        import hass_frontend
+    except ImportError:
+        print("hass_frontend is not installed", file=sys.stderr)
+        return 1
+    version = metadata.version("home-assistant-frontend")
+    source = Path(hass_frontend.__file__).parent
+    target = CORPUS_DIR / version
+    target.mkdir(parents=True, exist_ok=True)
+    for name in TEMPLATE_NAMES:
+        if (source / name).exists():
+            (target / name).write_text((source / name).read_text("utf-8"), "utf-8")
+            print(f"Added {target.relative_to(ROOT) / name}")
+    return 0
+
+
+def extract_wheel(wheel: Path) -> int:
+    """Copy the templates of a downloaded frontend wheel into the corpus.
+
+    Wheels are published on PyPI, e.g. ``pip download --no-deps
+    home-assistant-frontend==20251001.4``.
+    """
+    # home_assistant_frontend-<version>-py3-none-any.whl
+    parts = wheel.name.split("-")
+    if len(parts) < 2 or parts[0] != "home_assistant_frontend":
+        print(f"{wheel.name} is not a home-assistant-frontend wheel", file=sys.stderr)
+        return 1
+    target = CORPUS_DIR / parts[1]
+    with zipfile.ZipFile(wheel) as archive:
+        names = set(archive.namelist())
+        target.mkdir(parents=True, exist_ok=True)
+        for name in TEMPLATE_NAMES:
+            if (member := f"hass_frontend/{name}") in names:
+                (target / name).write_bytes(archive.read(member))
+                print(f"Added {target.relative_to(ROOT) / name}")
+    return 0
+
+
+def main() -> int:
+    """Run the harness."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--update", action="store_true", help="rewrite expected.json")
+    parser.add_argument(
+        "--extract", action="store_true", help="add the installed frontend's templates"
+    )
+    parser.add_argument(
+        "--wheel",
+        type=Path,
+        action="append",
+        help="add the templates of a home-assistant-frontend wheel",
+    )
+    parser.add_argument("--dump", type=Path, help="write the rendered pages here")
+    parser.add_argument(
+        "--iterations", type=int, default=200, help="renders timed per page"
+    )
+    parser.add_argument(
+        "--max-ms", type=float, help="fail if a page renders slower than this"
+    )
+    args = parser.parse_args()
+
+    if args.extract:
+        return extract()
+    if args.wheel:
+        return max(extract_wheel(wheel) for wheel in args.wheel)
+
+    results, durations, report = run(args.iterations, args.dump)
+    print("\n".join(report))
+
+    if args.update:
+        EXPECTED_FILE.write_text(
+            json.dumps(results, indent=2, sort_keys=True) + "\n", "utf-8"
+        )
+        print(f"Wrote {EXPECTED_FILE.relative_to(ROOT)}")
+        return 0
+
+    expected = json.loads(EXPECTED_FILE.read_text("utf-8"))
+    problems = compare(results, expected)
+    if args.max_ms is not None:
+        problems.extend(
+            f"{key}: {duration:.3f} ms/render, over {args.max_ms} ms"
+            for key, duration in durations.items()
+            if duration > args.max_ms
+        )
+    if problems:
+        print("\nDifferences from expected.json:")
+        print("\n".join(f"  {problem}" for problem in problems))
+        return 1
+    print("\nAll templates match expected.json")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())